@@ -0,0 +1,426 @@
+"""
+Benchmarks for the create, fetch, validate and persistence hot paths
+
+Every case runs against the bundled mock Jira server (src/utils/mock_server.py),
+hosted by this process, while the code under test runs in a fresh child
+interpreter so caches start cold and memory figures belong to the client only.
+Each case/size is run twice: once for wall time, requests and peak RSS, and
+once under tracemalloc for allocations (tracing slows the run down).
+
+Cases:
+    upload_roadmap                 roadmaps of 10 / 100 / 1k / 10k issues
+    get_work_items_to_json         1k / 10k / 100k issues in the project
+    fetch_all_data                 every data type for a 1k issue project
+    validate_and_prepare_project   100 / 1k issue roadmaps, missing components created
+    validate_and_clean_fields      1k calls
+    json_snapshot                  JsonHandler save/load and snapshot lookups, 10k / 100k issues
+
+Roadmap fixtures are tiled from backup/tasks*.yaml.
+
+Usage:
+    python benchmarks/bench_hot_paths.py                      # all cases
+    python benchmarks/bench_hot_paths.py --quick              # smallest size of each case
+    python benchmarks/bench_hot_paths.py --cases upload_roadmap --max-size 1000 --latency uniform:0.01,0.03
+    python benchmarks/bench_hot_paths.py --save-baseline      # record the current numbers as the baseline
+
+Results are written to benchmarks/results/<timestamp>.json. When a baseline
+exists (benchmarks/results/baseline.json or --baseline), any metric that grew
+by more than --threshold (default 20%) is reported and the exit status is 1.
+"""
+import os
+import sys
+import copy
+import glob
+import json
+import time
+import argparse
+import platform
+import tempfile
+import subprocess
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SRC_DIR = os.path.join(ROOT_DIR, "src")
+RESULTS_DIR = os.path.join(ROOT_DIR, "benchmarks", "results")
+sys.path.insert(0, SRC_DIR)
+
+CASE_SIZES = {
+    "upload_roadmap": [10, 100, 1000, 10000],
+    "get_work_items_to_json": [1000, 10000, 100000],
+    "fetch_all_data": [1000],
+    "validate_and_prepare_project": [100, 1000],
+    "validate_and_clean_fields": [1000],
+    "json_snapshot": [10000, 100000]
+}
+
+# Metrics compared against the baseline, with the absolute change ignored as noise
+COMPARED_METRICS = {"wall_seconds": 0.05, "requests": 0, "peak_rss_mb": 5.0, "alloc_peak_mb": 1.0}
+
+FIXTURE_COMPONENTS = ["DevOps", "Backend", "Frontend", "AI", "Data", "QA"]
+
+
+# --- Roadmap fixtures ---------------------------------------------------------
+
+def _walk(items: List[Dict[str, Any]]):
+    for item in items or []:
+        yield item
+        yield from _walk(item.get("tasks"))
+        yield from _walk(item.get("subtasks"))
+
+
+def _issue_count(item: Dict[str, Any]) -> int:
+    return 1 + sum(_issue_count(child) for child in (item.get("tasks") or []) + (item.get("subtasks") or []))
+
+
+def _relabel(item: Dict[str, Any], copy_index: int) -> Dict[str, Any]:
+    """Deep copy an item with unique summaries (created issues are keyed by summary)"""
+    item = copy.deepcopy(item)
+    for node in _walk([item]):
+        node["summary"] = f"{node.get('summary', 'Item')} #{copy_index}"
+    return item
+
+
+def load_fixtures() -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+    """Epics and plain (subtask-free) tasks from the backup roadmap files"""
+    import yaml
+    epics: List[Dict[str, Any]] = []
+    tasks: List[Dict[str, Any]] = []
+    for path in sorted(glob.glob(os.path.join(ROOT_DIR, "backup", "tasks*.yaml"))):
+        with open(path, encoding="utf-8") as f:
+            data = yaml.safe_load(f) or {}
+        epics.extend(data.get("epics") or [])
+        for item in _walk((data.get("epics") or []) + (data.get("tasks") or [])):
+            if item not in epics and not item.get("tasks"):
+                tasks.append({k: v for k, v in item.items() if k != "subtasks"})
+    return epics, tasks
+
+
+def build_roadmap(size: int, project_key: str, epics: List[Dict[str, Any]],
+                  tasks: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Tile fixture epics into a roadmap of exactly size issues, topped up with standalone tasks"""
+    roadmap: Dict[str, Any] = {"project": project_key, "epics": [], "tasks": []}
+    total, index = 0, 0
+    while epics and total + _issue_count(epics[index % len(epics)]) <= size:
+        roadmap["epics"].append(_relabel(epics[index % len(epics)], index))
+        total += _issue_count(roadmap["epics"][-1])
+        index += 1
+    while total < size:
+        roadmap["tasks"].append(_relabel(tasks[index % len(tasks)], index))
+        total += 1
+        index += 1
+    return roadmap
+
+
+def fixture_names(epics: List[Dict[str, Any]], tasks: List[Dict[str, Any]], field: str) -> List[str]:
+    names = set()
+    for item in _walk(epics + tasks):
+        value = item.get(field) or []
+        names.update(value if isinstance(value, list) else [value])
+    return sorted(str(n) for n in names)
+
+
+# --- Case preparation (parent process, owns the mock server) -------------------
+
+class BenchContext:
+    def __init__(self, server: Any, workdir: str):
+        self.server = server
+        self.workdir = workdir
+        self._fixtures: Optional[Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]] = None
+        self._seeded: set = set()
+
+    @property
+    def fixtures(self) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        if self._fixtures is None:
+            self._fixtures = load_fixtures()
+            epics, tasks = self._fixtures
+            for assignee in fixture_names(epics, tasks, "assignee"):
+                self.server.state.add_user(assignee, f"{assignee}@example.com")
+        return self._fixtures
+
+    def roadmap_file(self, size: int, project_key: str) -> str:
+        import yaml
+        epics, tasks = self.fixtures
+        path = os.path.join(self.workdir, f"roadmap_{project_key}.yaml")
+        with open(path, "w", encoding="utf-8") as f:
+            yaml.safe_dump(build_roadmap(size, project_key, epics, tasks), f, allow_unicode=True, sort_keys=False)
+        return path
+
+    def seeded_project(self, project_key: str, size: int) -> str:
+        """A project holding size synthetic issues, seeded once and shared by read-only cases"""
+        if project_key not in self._seeded:
+            started = time.perf_counter()
+            self.server.state.add_project(project_key, components=FIXTURE_COMPONENTS, versions=["1.0", "2.0"])
+            self.server.state.seed_issues(project_key, size)
+            self._seeded.add(project_key)
+            print(f"  seeded {size} issues into {project_key} in {time.perf_counter() - started:.1f}s", file=sys.stderr)
+        return project_key
+
+
+def prepare(case: str, size: int, attempt: int, ctx: BenchContext) -> Dict[str, str]:
+    """Set up mock state for one child run and return the env it needs"""
+    if case == "upload_roadmap":
+        # A fresh project per run so issue keys and created components do not carry over
+        key = f"UP{size}R{attempt}"
+        epics, tasks = ctx.fixtures
+        ctx.server.state.add_project(key, components=fixture_names(epics, tasks, "components"))
+        return {"PROJECT_KEY": key, "BENCH_ROADMAP": ctx.roadmap_file(size, key)}
+    if case == "validate_and_prepare_project":
+        # No components yet: reconciliation has to create them
+        key = f"VP{size}R{attempt}"
+        ctx.server.state.add_project(key)
+        return {"PROJECT_KEY": key, "BENCH_ROADMAP": ctx.roadmap_file(size, key)}
+    if case in ("get_work_items_to_json", "fetch_all_data"):
+        return {"PROJECT_KEY": ctx.seeded_project(f"WI{size}", size)}
+    if case == "validate_and_clean_fields":
+        return {"PROJECT_KEY": ctx.seeded_project("WI10", 10)}
+    return {}
+
+
+# --- Case execution (child process) --------------------------------------------
+
+def setup_case(case: str, size: int) -> Callable[[], Any]:
+    """Build the handlers for a case and return the callable being measured"""
+    if case == "upload_roadmap":
+        from utils.create_handler import JiraCreateHandler
+        handler = JiraCreateHandler()
+        roadmap = os.environ["BENCH_ROADMAP"]
+        return lambda: handler.upload_roadmap(roadmap)
+
+    if case == "get_work_items_to_json":
+        from utils.get_handler import JiraGetHandler
+        handler = JiraGetHandler()
+        return handler.get_work_items_to_json
+
+    if case == "fetch_all_data":
+        from utils.get_handler import JiraGetHandler
+        handler = JiraGetHandler()
+        return handler.fetch_all_data
+
+    if case == "validate_and_prepare_project":
+        from utils.create_handler import JiraCreateHandler
+        from utils.combi_handler import JiraCombiHandler
+        create_handler = JiraCreateHandler()
+        create_handler.project_key = os.environ["PROJECT_KEY"]
+        data = create_handler.load_yaml_file(os.environ["BENCH_ROADMAP"])
+        combi_handler = JiraCombiHandler(create_handler.connect_handler, create_handler)
+        return lambda: combi_handler.validate_and_prepare_project(data)
+
+    if case == "validate_and_clean_fields":
+        from utils.get_handler import JiraGetHandler
+        from utils.validate_handler import JiraValidateHandler
+        get_handler = JiraGetHandler()
+        get_handler.get_fields_to_json()  # writes field_map.json
+        validate_handler = JiraValidateHandler(get_handler.connect_handler)
+        fields = {"Summary": "Benchmark", "Description": "x", "Labels": ["a"], "Priority": {"name": "High"},
+                  "customfield_99999": "unknown", "Due date": "2025-01-01"}
+        return lambda: [validate_handler.validate_and_clean_fields(dict(fields)) for _ in range(size)]
+
+    if case == "json_snapshot":
+        from utils.json_handler import JsonHandler
+        from utils.mock_server import MockJiraState
+        state = MockJiraState()
+        state.seed_issues("SNAP", size)
+        issues = list(state.issues.values())
+        handler = JsonHandler()
+        lookups = [issue["key"] for issue in issues[::max(1, size // 1000)]]
+
+        def run() -> None:
+            handler.save_json({"issues": issues}, "bench_work_items.json", compact=True)
+            handler.load_json("bench_work_items.json")
+            handler.write_snapshot(issues, "bench_work_items.snap")
+            with handler.open_snapshot("bench_work_items.snap") as reader:
+                for key in lookups:
+                    reader.get(key)
+        return run
+
+    raise ValueError(f"Unknown case: {case}")
+
+
+def _reset_peak_rss() -> None:
+    """Reset the kernel's peak RSS counter (Linux only) so setup does not count"""
+    try:
+        with open("/proc/self/clear_refs", "w") as f:
+            f.write("5")
+    except OSError:
+        pass
+
+
+def _peak_rss_mb() -> Optional[float]:
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return round(int(line.split()[1]) / 1024, 1)
+    except OSError:
+        pass
+    try:
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # ru_maxrss is in bytes on macOS and kilobytes elsewhere
+        return round(peak / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)
+    except ImportError:
+        return None
+
+
+def run_child(case: str, size: int, traced: bool, output: str) -> None:
+    from utils.metrics_handler import metrics
+    metrics.enable()
+    run = setup_case(case, size)
+    metrics.reset()
+
+    result: Dict[str, Any] = {}
+    if traced:
+        import tracemalloc
+        tracemalloc.start()
+        run()
+        current, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        result["alloc_peak_mb"] = round(peak / (1024 * 1024), 2)
+        result["alloc_retained_mb"] = round(current / (1024 * 1024), 2)
+    else:
+        _reset_peak_rss()
+        started = time.perf_counter()
+        run()
+        result["wall_seconds"] = round(time.perf_counter() - started, 3)
+        result["peak_rss_mb"] = _peak_rss_mb()
+        totals = metrics.summary()["totals"]
+        result["requests"] = totals["requests"] + totals["retries"]
+        result["throttled"] = totals["throttled"]
+        result["failures"] = totals["failures"]
+
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(result, f)
+
+
+# --- Driver ---------------------------------------------------------------------
+
+def measure(case: str, size: int, ctx: BenchContext, allocations: bool) -> Dict[str, Any]:
+    record: Dict[str, Any] = {"case": case, "size": size}
+    for attempt, traced in enumerate([False, True] if allocations else [False]):
+        env = dict(os.environ)
+        env.update({
+            "JIRA_URL": ctx.server.url,
+            "JIRA_USER": "bench@example.com",
+            "JIRA_TOKEN": "bench-token",
+            # JiraCreateHandler's auth check reads the older variable names
+            "JIRA_INSTANCE": ctx.server.url,
+            "EMAIL": "bench@example.com",
+            "API_TOKEN": "bench-token",
+            "JIRA_RATE_LIMIT": "0",
+            "PYTHONPATH": SRC_DIR
+        })
+        env.update(prepare(case, size, attempt, ctx))
+        run_dir = tempfile.mkdtemp(prefix=f"{case}-{size}-", dir=ctx.workdir)
+        env["JIRA_DATA_DIR"] = os.path.join(run_dir, "data")
+        output = os.path.join(run_dir, "result.json")
+        child = subprocess.run(
+            [sys.executable, os.path.abspath(__file__), "--child", case, str(size), "--output", output]
+            + (["--traced"] if traced else []),
+            cwd=run_dir, env=env, capture_output=True, text=True
+        )
+        if child.returncode != 0 or not os.path.exists(output):
+            tail = "\n".join(child.stderr.strip().splitlines()[-15:])
+            record["error"] = f"child exited with {child.returncode}: {tail}"
+            return record
+        with open(output, encoding="utf-8") as f:
+            record.update(json.load(f))
+    return record
+
+
+def compare(results: List[Dict[str, Any]], baseline: Dict[str, Any], threshold: float) -> List[str]:
+    """Describe every metric that regressed by more than threshold against the baseline"""
+    previous = {(r["case"], r["size"]): r for r in baseline.get("results", [])}
+    regressions = []
+    for result in results:
+        base = previous.get((result["case"], result["size"]))
+        if not base or "error" in result:
+            continue
+        for metric, noise in COMPARED_METRICS.items():
+            new, old = result.get(metric), base.get(metric)
+            if new is None or old is None:
+                continue
+            if new > old * (1 + threshold) and new - old > noise:
+                regressions.append(f"{result['case']}[{result['size']}] {metric}: {old} -> {new} "
+                                   f"(+{(new / old - 1) * 100 if old else float('inf'):.0f}%)")
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--cases", default=",".join(CASE_SIZES), help="Comma-separated cases (default: all)")
+    parser.add_argument("--max-size", type=int, default=None, help="Skip sizes above this")
+    parser.add_argument("--quick", action="store_true", help="Only the smallest size of each case")
+    parser.add_argument("--latency", default=None, help='Mock server latency, e.g. "uniform:0.01,0.03"')
+    parser.add_argument("--rate-limit", type=float, default=0.0, help="Mock server requests/s before 429s")
+    parser.add_argument("--no-allocations", action="store_true", help="Skip the tracemalloc run")
+    parser.add_argument("--threshold", type=float, default=0.2, help="Allowed relative growth (default: 0.2)")
+    parser.add_argument("--baseline", default=os.path.join(RESULTS_DIR, "baseline.json"))
+    parser.add_argument("--save-baseline", action="store_true", help="Also write the results as the baseline")
+    parser.add_argument("--output", default=None, help="Results file (default: benchmarks/results/<timestamp>.json)")
+    parser.add_argument("--child", nargs=2, metavar=("CASE", "SIZE"), help=argparse.SUPPRESS)
+    parser.add_argument("--traced", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        run_child(args.child[0], int(args.child[1]), args.traced, args.output)
+        return 0
+
+    from utils.mock_server import MockJiraConfig, MockJiraServer
+
+    cases = [c.strip() for c in args.cases.split(",") if c.strip()]
+    unknown = [c for c in cases if c not in CASE_SIZES]
+    if unknown:
+        parser.error(f"Unknown cases: {', '.join(unknown)}")
+
+    config = MockJiraConfig(latency=args.latency, rate_limit=args.rate_limit, burst=max(1, int(args.rate_limit)), seed=42)
+    results: List[Dict[str, Any]] = []
+    with tempfile.TemporaryDirectory(prefix="jira-bench-") as workdir, MockJiraServer(config) as server:
+        ctx = BenchContext(server, workdir)
+        for case in cases:
+            sizes = CASE_SIZES[case][:1] if args.quick else CASE_SIZES[case]
+            for size in sizes:
+                if args.max_size and size > args.max_size:
+                    continue
+                print(f"{case}[{size}] ...", file=sys.stderr)
+                record = measure(case, size, ctx, allocations=not args.no_allocations)
+                results.append(record)
+                if "error" in record:
+                    print(f"  FAILED: {record['error']}", file=sys.stderr)
+                else:
+                    print(f"  {record.get('wall_seconds')}s, {record.get('requests')} requests, "
+                          f"peak RSS {record.get('peak_rss_mb')} MB, allocations {record.get('alloc_peak_mb')} MB",
+                          file=sys.stderr)
+
+    report = {
+        "created": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "mock": {"latency": args.latency, "rate_limit": args.rate_limit},
+        "results": results
+    }
+    os.makedirs(RESULTS_DIR, exist_ok=True)
+    output = args.output or os.path.join(RESULTS_DIR, f"{datetime.now():%Y%m%d-%H%M%S}.json")
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    print(f"Results written to {output}", file=sys.stderr)
+
+    status = 1 if any("error" in r for r in results) else 0
+    if os.path.exists(args.baseline) and not args.save_baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            regressions = compare(results, json.load(f), args.threshold)
+        for line in regressions:
+            print(f"REGRESSION {line}", file=sys.stderr)
+        if regressions:
+            status = 1
+        else:
+            print(f"No regressions beyond {args.threshold:.0%} against {args.baseline}", file=sys.stderr)
+    if args.save_baseline:
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"Baseline saved to {args.baseline}", file=sys.stderr)
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,99 @@
+"""
+Cold-start benchmark for the Jira manager CLI
+
+Measures, in fresh interpreters:
+  - import time of src/main.py
+  - time until a `test` invocation is ready to send its first request
+    (JiraManager built, connect handler constructed; no network I/O)
+and checks that heavy modules are not imported on that path.
+
+Usage:
+    python benchmarks/startup_bench.py [--runs 7] [--budget-ms 150] [--top 10]
+
+Exits with status 1 when the median startup exceeds the budget or a heavy
+module is loaded, so it can guard against regressions in CI.
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+SRC_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src")
+
+# Modules that must not be imported just to test the connection
+HEAVY_MODULES = ["pandas", "numpy", "pyarrow", "yaml"]
+
+STARTUP_SNIPPET = """
+import sys, time, json
+started = time.perf_counter()
+import main
+imported = time.perf_counter()
+manager = main.JiraManager()
+manager.connect_handler
+ready = time.perf_counter()
+print(json.dumps({
+    "import_ms": (imported - started) * 1000,
+    "startup_ms": (ready - started) * 1000,
+    "heavy_modules": [m for m in HEAVY if m in sys.modules]
+}))
+"""
+
+
+def run_once() -> dict:
+    env = dict(os.environ)
+    # Dummy credentials: the benchmark never sends a request
+    env.update({
+        "JIRA_URL": "http://127.0.0.1:9",
+        "JIRA_USER": "bench@example.com",
+        "JIRA_TOKEN": "bench-token",
+        "PYTHONDONTWRITEBYTECODE": "0"
+    })
+    code = f"HEAVY = {HEAVY_MODULES!r}\n" + STARTUP_SNIPPET
+    result = subprocess.run([sys.executable, "-c", code], cwd=SRC_DIR, env=env, capture_output=True, text=True)
+    if result.returncode != 0:
+        raise SystemExit(f"Startup run failed:\n{result.stderr.strip()}")
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def import_offenders(top: int) -> list:
+    """Return the slowest cumulative imports of main (from -X importtime)"""
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", "import main"], cwd=SRC_DIR,
+                            capture_output=True, text=True)
+    rows = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        rows.append((int(cumulative_us), name.strip()))
+    return [{"module": name, "cumulative_ms": round(us / 1000, 2)} for us, name in sorted(rows, reverse=True)[:top]]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=7)
+    parser.add_argument("--budget-ms", type=float, default=150.0)
+    parser.add_argument("--top", type=int, default=10, help="Number of slowest imports to list")
+    args = parser.parse_args()
+
+    # Warm the bytecode cache so every measured run is comparable
+    run_once()
+    runs = [run_once() for _ in range(args.runs)]
+    heavy = sorted({m for r in runs for m in r["heavy_modules"]})
+    report = {
+        "runs": args.runs,
+        "import_ms_median": round(statistics.median(r["import_ms"] for r in runs), 2),
+        "startup_ms_median": round(statistics.median(r["startup_ms"] for r in runs), 2),
+        "startup_ms_max": round(max(r["startup_ms"] for r in runs), 2),
+        "budget_ms": args.budget_ms,
+        "heavy_modules_loaded": heavy,
+        "slowest_imports": import_offenders(args.top)
+    }
+    report["passed"] = report["startup_ms_median"] <= args.budget_ms and not heavy
+    print(json.dumps(report, indent=2))
+    return 0 if report["passed"] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
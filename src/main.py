@@ -1,30 +1,64 @@
-from utils.connect_handler import JiraConnectHandler
-from utils.get_handler import JiraGetHandler
-from utils.create_handler import JiraCreateHandler
-from utils.error_handler import JiraError
+from utils.error_handler import JiraError, ContextThreadPoolExecutor
+from utils.metrics_handler import metrics
+from utils.profile_handler import profiled, profiler
 import os
 import sys
+import json
+import time
+import argparse
 import logging
-from typing import Dict, Any
+import contextlib
+from functools import cached_property
+from typing import Dict, Any, List, Optional, Union, Callable
+
+# Handler modules (and requests/pandas/yaml behind them) are imported on first use
 
 class JiraManager:
-    def __init__(self):
-        """Initialize Jira Manager with all handlers"""
+    def __init__(self, pool_size: int = 10):
+        """Initialize Jira Manager; handlers are built lazily on first use
+        
+        Args:
+            pool_size: HTTP connections kept by the shared connect handler
+        """
+        self.pool_size = pool_size
         # Setup logging
         logging.basicConfig(
             level=logging.INFO,
             format='%(asctime)s - %(levelname)s - %(message)s'
         )
         self.logger = logging.getLogger(__name__)
-        
+
+    def _build_handler(self, factory: Callable[[], Any]) -> Any:
+        """Construct a handler, exiting on configuration errors as before"""
         try:
-            self.connect_handler = JiraConnectHandler()
-            self.get_handler = JiraGetHandler()
-            self.create_handler = JiraCreateHandler()
+            return factory()
         except JiraError as e:
             self.logger.error(f"Initialization error: {str(e)}")
             sys.exit(1)
 
+    @cached_property
+    def connect_handler(self):
+        from utils.connect_handler import JiraConnectHandler
+        return self._build_handler(lambda: JiraConnectHandler(pool_size=self.pool_size))
+
+    @cached_property
+    def get_handler(self):
+        from utils.get_handler import JiraGetHandler
+        return self._build_handler(lambda: JiraGetHandler(connect_handler=self.connect_handler))
+
+    @cached_property
+    def user_handler(self):
+        from utils.user_handler import JiraUserHandler
+        return self._build_handler(lambda: JiraUserHandler(self.connect_handler))
+
+    @cached_property
+    def create_handler(self):
+        from utils.create_handler import JiraCreateHandler
+        return self._build_handler(lambda: JiraCreateHandler(connect_handler=self.connect_handler,
+                                                             get_handler=self.get_handler,
+                                                             user_handler=self.user_handler))
+
+    @profiled()
     def test_connection(self) -> Dict[str, Any]:
         """Test Jira connection and return detailed results"""
         try:
@@ -51,26 +85,51 @@ class JiraManager:
             self.logger.error(f"Connection test failed: {str(e)}")
             return {"connection": "✗ Failed", "error": str(e)}
 
-    def fetch_jira_data(self, data_types: list = None) -> Dict[str, Any]:
-        """Fetch specific or all Jira data"""
+    @profiled()
+    def fetch_jira_data(self, data_types: list = None, jql: Optional[str] = None, max_workers: int = 1,
+                        progress: Optional[Callable[[Dict[str, Any]], None]] = None,
+                        changelog: bool = False) -> Dict[str, Any]:
+        """Fetch specific or all Jira data
+        
+        Args:
+            data_types: Data types to fetch (default: all)
+            jql: Optional JQL for work items
+            max_workers: Number of data types fetched concurrently
+            progress: Optional callback receiving an event per fetched data type
+            changelog: Include each work item's changelog (needed for cycle time reports)
+        """
         try:
             if not data_types:
                 data_types = ["fields", "issue_types", "components", "versions", "work_items"]
             
-            results = {}
+            fetchers = {}
             for data_type in data_types:
-                self.logger.info(f"Fetching {data_type}...")
-                if hasattr(self.get_handler, f"get_{data_type}"):
-                    results[data_type] = getattr(self.get_handler, f"get_{data_type}")()
-                else:
+                # Prefer the exporting getters (get_fields_to_json, ...) over plain lookups
+                method = getattr(self.get_handler, f"get_{data_type}_to_json", None) or \
+                    getattr(self.get_handler, f"get_{data_type}", None)
+                if method is None:
                     self.logger.warning(f"Unknown data type: {data_type}")
+                    continue
+                if data_type == "work_items" and (jql or changelog):
+                    method = lambda m=method: m(jql=jql, expand="changelog" if changelog else None)
+                fetchers[data_type] = method
             
-            return results
+            def fetch(data_type: str) -> Any:
+                self.logger.info(f"Fetching {data_type}...")
+                value = fetchers[data_type]()
+                if progress is not None:
+                    progress({"event": "fetched", "data_type": data_type, "items": _count_items(value)})
+                return value
+            
+            with ContextThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+                values = list(executor.map(fetch, fetchers))
+            return dict(zip(fetchers, values))
             
         except Exception as e:
             self.logger.error(f"Error fetching data: {str(e)}")
             return {"error": str(e)}
 
+    @profiled()
     def create_jira_issues(self, yaml_file: str) -> Dict[str, Any]:
         """Create Jira issues from YAML file"""
         try:
@@ -84,6 +143,365 @@ class JiraManager:
                 "error": str(e)
             }
 
+    @profiled()
+    def create_jira_issues_batch(self, source: Union[str, List[str]], max_workers: int = 4,
+                                 progress: Optional[Callable[[Dict[str, Any]], None]] = None,
+                                 roadmaps: Optional[Dict[str, Dict[str, Any]]] = None) -> Dict[str, Any]:
+        """Create Jira issues from every roadmap in a directory, glob pattern or list of those"""
+        try:
+            from utils.batch_handler import JiraBatchHandler
+            self.logger.info(f"Creating issues from roadmaps in {source}...")
+            batch_handler = JiraBatchHandler(max_workers=max_workers, connect_handler=self.connect_handler,
+                                             get_handler=self.get_handler, user_handler=self.user_handler)
+            on_result = None
+            if progress is not None:
+                on_result = lambda yaml_file, result: progress({
+                    "event": "uploaded", "file": yaml_file, "success": result.get("success"),
+                    "project": result.get("project"), "error": result.get("error")
+                })
+            return batch_handler.upload_roadmaps(source, on_result=on_result, roadmaps=roadmaps)
+            
+        except Exception as e:
+            self.logger.error(f"Error creating issues in batch: {str(e)}")
+            return {
+                "success": False,
+                "error": str(e),
+                "files": {}
+            }
+
+    @profiled()
+    def pipelined_sync(self, source: Union[str, List[str]], jql: Optional[str] = None, max_workers: int = 4,
+                       progress: Optional[Callable[[Dict[str, Any]], None]] = None) -> Dict[str, Any]:
+        """Full sync with overlapping stages instead of fetch-then-create
+        
+        Roadmaps are parsed while the metadata creation needs (project
+        snapshots, field list, assignee accountIds) is prefetched; creation
+        starts as soon as that is ready, and the fetch of issue types,
+        components and versions runs alongside it. Work items are fetched once
+        creation is done so they include the new issues.
+        
+        Returns:
+            {"fetch": ..., "upload": ..., "stages": {stage: seconds}, "elapsed_seconds": ...}
+        """
+        from utils.batch_handler import JiraBatchHandler
+        started = time.perf_counter()
+        stages: Dict[str, float] = {}
+        
+        def timed(stage: str, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+            stage_started = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                stages[stage] = round(time.perf_counter() - stage_started, 3)
+                if progress is not None:
+                    progress({"event": "stage", "stage": stage, "seconds": stages[stage]})
+        
+        def parse(files: List[str]) -> Dict[str, Dict[str, Any]]:
+            roadmaps = {}
+            for yaml_file in files:
+                try:
+                    # Each file's project is read from its data; the shared handler keeps its own
+                    roadmaps[yaml_file] = self.create_handler.load_yaml_file(yaml_file, adopt_project=False)
+                except Exception as e:
+                    # Left for the upload stage, which reports the error for this file
+                    self.logger.warning(f"Could not parse {yaml_file} ahead of upload: {str(e)}")
+            return roadmaps
+        
+        try:
+            files = JiraBatchHandler(max_workers=1, connect_handler=self.connect_handler,
+                                     get_handler=self.get_handler, user_handler=self.user_handler
+                                     ).resolve_roadmap_files(source)
+            default_project = os.getenv("PROJECT_KEY")
+            background_types = ["issue_types", "components", "versions"]
+            
+            with ContextThreadPoolExecutor(max_workers=4) as executor:
+                # Stage 1: parse roadmaps while creation metadata is prefetched
+                parsed = executor.submit(timed, "parse", parse, files)
+                fields = executor.submit(timed, "fields", self.get_handler.get_fields_to_json)
+                if default_project:
+                    executor.submit(self.connect_handler.get_project_snapshot, default_project)
+                # Project metadata is not needed for creation, so it is fetched in the background throughout
+                background = executor.submit(timed, "fetch", self.fetch_jira_data, background_types, jql,
+                                             max(1, max_workers // 2), progress)
+                
+                # Stage 2: project snapshots and assignees named by the roadmaps
+                roadmaps = parsed.result()
+                project_keys = {data.get("project") or default_project for data in roadmaps.values()} - {None}
+                assignees = sorted({a for data in roadmaps.values() for a in self.user_handler.collect_assignees(data)})
+                metadata = [executor.submit(self.connect_handler.get_project_snapshot, key) for key in project_keys]
+                metadata.append(executor.submit(timed, "assignees", self.user_handler.resolve_users, assignees))
+                # Creation resolves custom fields through the field map, so it waits for the field prefetch too
+                metadata.append(fields)
+                for future in metadata:
+                    future.result()
+                stages["metadata_ready"] = round(time.perf_counter() - started, 3)
+                
+                # Stage 3: create issues while the background fetch continues
+                upload = timed("create", self.create_jira_issues_batch, files, max_workers, progress, roadmaps)
+                
+                # Stage 4: work items, fetched after creation so the new issues are included
+                work_items = timed("work_items", self.fetch_jira_data, ["work_items"], jql, 1, progress)
+                fetched = {"fields": fields.result(), **background.result(), **work_items}
+            
+            return {
+                "fetch": fetched,
+                "upload": upload,
+                "stages": stages,
+                "elapsed_seconds": round(time.perf_counter() - started, 3)
+            }
+            
+        except Exception as e:
+            self.logger.error(f"Error in pipelined sync: {str(e)}")
+            return {"fetch": {"error": str(e)}, "upload": {"success": False, "error": str(e), "files": {}},
+                    "stages": stages, "elapsed_seconds": round(time.perf_counter() - started, 3)}
+
+    def report_jira_data(self, sections: Optional[List[str]] = None, days: int = 30,
+                         version: Optional[str] = None, refresh: bool = False) -> Dict[str, Any]:
+        """Analytics over the fetched work items: counts, progress, slippage, cycle time, burndown
+        
+        Args:
+            sections: Report sections (default: all)
+            days: Burndown length in days
+            version: Limit the burndown to one fix version
+            refresh: Fetch the work items (with changelogs) first instead of using the local copy
+        """
+        try:
+            if refresh:
+                self.get_handler.get_work_items_to_json(expand="changelog")
+            return self.get_handler.get_report(sections, days=days, version=version)
+            
+        except Exception as e:
+            self.logger.error(f"Error building report: {str(e)}")
+            return {"error": str(e)}
+
+    @profiled()
+    def bulk_update_issues(self, operation: str, jql: Optional[str] = None, keys: Optional[List[str]] = None,
+                           target: Optional[str] = None, fields: Optional[Dict[str, Any]] = None,
+                           update: Optional[Dict[str, List[Dict[str, Any]]]] = None, max_workers: int = 8,
+                           progress: Optional[Callable[[Dict[str, Any]], None]] = None,
+                           notify: bool = True) -> Dict[str, Any]:
+        """Transition (operation="transition", to target) or edit (operation="edit") issues in bulk
+        
+        Args:
+            jql: Query selecting the issues (or keys)
+            keys: Issue keys (or jql)
+            target: Destination status or transition name, for transitions
+            fields: Fields to set (on the transition screen, for transitions)
+            update: Field operations for edits, e.g. {"labels": [{"add": "q3"}]}
+            notify: False edits without notification emails (needs admin or project admin permission)
+        """
+        try:
+            from utils.bulk_handler import JiraBulkHandler
+            bulk_handler = JiraBulkHandler(connect_handler=self.connect_handler, get_handler=self.get_handler,
+                                           max_workers=max_workers)
+            if operation == "transition":
+                return bulk_handler.bulk_transition(target, jql=jql, keys=keys, fields=fields, progress=progress)
+            return bulk_handler.bulk_edit(fields=fields, update=update, jql=jql, keys=keys, progress=progress,
+                                          notify=notify)
+            
+        except Exception as e:
+            self.logger.error(f"Error in bulk {operation}: {str(e)}")
+            return {"success": False, "error": str(e), "operation": operation, "issues": {}}
+
+    @profiled()
+    def rollback_upload(self, run_ids: Optional[List[str]] = None, last: bool = False,
+                        created_issues: Optional[Dict[str, Dict[str, str]]] = None, dry_run: bool = False,
+                        confirm: Optional[Callable[[Dict[str, Any]], bool]] = None, max_workers: int = 4,
+                        progress: Optional[Callable[[Dict[str, Any]], None]] = None) -> Dict[str, Any]:
+        """Delete the issues created by upload runs (sub-tasks, then tasks, then epics)
+        
+        Args:
+            run_ids: Upload run ids from the creation journal
+            last: Roll back the most recent run in the journal
+            created_issues: An upload result's created_issues, instead of run ids
+            dry_run: Only return the plan
+            confirm: Called with the plan before deleting; nothing is deleted unless it returns True
+        """
+        try:
+            from utils.rollback_handler import JiraRollbackHandler
+            rollback_handler = JiraRollbackHandler(connect_handler=self.connect_handler, get_handler=self.get_handler,
+                                                   max_workers=max_workers)
+            if last:
+                runs = [run for run in rollback_handler.list_runs() if run["issues"]]
+                if not runs:
+                    return {"success": False, "error": "No upload run with remaining issues in the journal"}
+                run_ids = [runs[-1]["run_id"]]
+            plan = rollback_handler.plan(run_ids, created_issues)
+            if dry_run or not plan["issues"]:
+                return {"success": True, "dry_run": dry_run, "plan": plan}
+            if confirm is None or not confirm(plan):
+                return {"success": False, "error": "Rollback not confirmed", "plan": plan}
+            return rollback_handler.rollback(plan, progress)
+            
+        except Exception as e:
+            self.logger.error(f"Error rolling back: {str(e)}")
+            return {"success": False, "error": str(e)}
+
+    @profiled()
+    def attach_files(self, issue_key: str, files: List[str], max_workers: int = 4,
+                     progress: Optional[Callable[[Dict[str, Any]], None]] = None) -> Dict[str, Any]:
+        """Upload files to an issue, streamed from disk and in parallel"""
+        try:
+            from utils.attachment_handler import JiraAttachmentHandler
+            attachment_handler = JiraAttachmentHandler(connect_handler=self.connect_handler, max_workers=max_workers)
+            try:
+                return attachment_handler.upload_files([(issue_key, path) for path in files], progress)
+            finally:
+                attachment_handler.close()
+            
+        except Exception as e:
+            self.logger.error(f"Error attaching files: {str(e)}")
+            return {"success": False, "error": str(e)}
+
+    @profiled()
+    def mirror_attachments(self, jql: Optional[str] = None, keys: Optional[List[str]] = None, max_workers: int = 4,
+                           progress: Optional[Callable[[Dict[str, Any]], None]] = None) -> Dict[str, Any]:
+        """Download the attachments of the matched issues into the local content-addressed mirror"""
+        try:
+            from utils.attachment_handler import JiraAttachmentHandler
+            attachment_handler = JiraAttachmentHandler(connect_handler=self.connect_handler, max_workers=max_workers)
+            return attachment_handler.mirror_attachments(jql=jql, keys=keys, progress=progress)
+            
+        except Exception as e:
+            self.logger.error(f"Error mirroring attachments: {str(e)}")
+            return {"success": False, "error": str(e)}
+
+    def plan_jira_issues(self, yaml_files: List[str]) -> Dict[str, Any]:
+        """Report what uploading the given roadmaps would create, without creating anything"""
+        try:
+            from utils.batch_handler import JiraBatchHandler
+            batch_handler = JiraBatchHandler(max_workers=1, connect_handler=self.connect_handler,
+                                             get_handler=self.get_handler, user_handler=self.user_handler)
+            files = batch_handler.resolve_roadmap_files(yaml_files)
+            plans = {yaml_file: self.create_handler.plan_roadmap(yaml_file) for yaml_file in files}
+            return {"success": all(p.get("success") for p in plans.values()), "files": plans}
+            
+        except Exception as e:
+            self.logger.error(f"Error planning upload: {str(e)}")
+            return {"success": False, "error": str(e), "files": {}}
+
+    def query_jira_data(self, keys: Optional[List[str]] = None, project: Optional[str] = None,
+                        tree: Optional[str] = None) -> Dict[str, Any]:
+        """Answer lookups from the warm local caches without a sync
+
+        Args:
+            keys: Issue keys looked up in the local work items snapshot
+            project: Project key whose cached snapshot (issue types, components, versions) is returned
+            tree: Issue key whose subtree and progress rollup come from the hierarchy index
+        """
+        results: Dict[str, Any] = {}
+        if keys:
+            results["issues"] = {key: self.get_handler.get_local_issue(key) for key in keys}
+        if tree:
+            hierarchy = self.get_handler.get_hierarchy()
+            results["tree"] = {**hierarchy.tree(tree), "ancestors": hierarchy.ancestors(tree),
+                               "rollup": hierarchy.rollup(tree)}
+        if project:
+            snapshot = self.connect_handler.get_project_snapshot(project)
+            results["project"] = snapshot.to_dict() if snapshot else None
+        return results
+
+    def daemon_runners(self) -> Dict[str, Callable[[Dict[str, Any], Callable[[Dict[str, Any]], None]], Any]]:
+        """Job runners for daemon mode, all sharing this manager's warm handlers"""
+        def fetch(params: Dict[str, Any], progress: Callable[[Dict[str, Any]], None]) -> Dict[str, Any]:
+            data_types = params.get("types")
+            # Cached lookups are kept warm, but a fetch job always re-reads Jira
+            for data_type in data_types or [None]:
+                self.get_handler.clear_cache(data_type)
+            results = self.fetch_jira_data(data_types, jql=params.get("jql"),
+                                           max_workers=params.get("jobs", 4), progress=progress)
+            if "error" in results:
+                raise JiraError(results["error"], "FETCH_FAILED")
+            return _summarize("fetch", results)
+
+        def upload(params: Dict[str, Any], progress: Callable[[Dict[str, Any]], None]) -> Dict[str, Any]:
+            results = self.create_jira_issues_batch(params["files"], max_workers=params.get("jobs", 4), progress=progress)
+            if results.get("error"):
+                raise JiraError(results["error"], "UPLOAD_FAILED")
+            return results
+
+        def sync(params: Dict[str, Any], progress: Callable[[Dict[str, Any]], None]) -> Dict[str, Any]:
+            self.get_handler.clear_cache()
+            results = self.pipelined_sync(params["files"], jql=params.get("jql"),
+                                          max_workers=params.get("jobs", 4), progress=progress)
+            if results["upload"].get("error"):
+                raise JiraError(results["upload"]["error"], "SYNC_FAILED")
+            return {"fetch": _summarize("fetch", results["fetch"]), "upload": results["upload"], "stages": results["stages"]}
+
+        def query(params: Dict[str, Any], progress: Callable[[Dict[str, Any]], None]) -> Dict[str, Any]:
+            return self.query_jira_data(keys=params.get("keys"), project=params.get("project"), tree=params.get("tree"))
+
+        def report(params: Dict[str, Any], progress: Callable[[Dict[str, Any]], None]) -> Dict[str, Any]:
+            results = self.report_jira_data(params.get("sections"), days=params.get("days", 30),
+                                            version=params.get("version"), refresh=params.get("refresh", False))
+            if "error" in results:
+                raise JiraError(results["error"], "REPORT_FAILED")
+            return results
+
+        def bulk(operation: str) -> Callable[[Dict[str, Any], Callable[[Dict[str, Any]], None]], Dict[str, Any]]:
+            def run(params: Dict[str, Any], progress: Callable[[Dict[str, Any]], None]) -> Dict[str, Any]:
+                results = self.bulk_update_issues(operation, jql=params.get("jql"), keys=params.get("keys"),
+                                                  target=params.get("to"), fields=params.get("fields"),
+                                                  update=params.get("update"), max_workers=params.get("jobs", 8),
+                                                  progress=progress, notify=params.get("notify", True))
+                if results.get("error"):
+                    raise JiraError(results["error"], "BULK_FAILED")
+                return results
+            return run
+
+        def rollback(params: Dict[str, Any], progress: Callable[[Dict[str, Any]], None]) -> Dict[str, Any]:
+            # Without "confirm": true the job only returns the plan
+            results = self.rollback_upload(params.get("run_ids"), last=params.get("last", False),
+                                           created_issues=params.get("created_issues"),
+                                           dry_run=not params.get("confirm"), confirm=lambda plan: True,
+                                           max_workers=params.get("jobs", 4), progress=progress)
+            if results.get("error"):
+                raise JiraError(results["error"], "ROLLBACK_FAILED")
+            return results
+
+        def attach(params: Dict[str, Any], progress: Callable[[Dict[str, Any]], None]) -> Dict[str, Any]:
+            results = self.attach_files(params["issue"], params.get("files") or [],
+                                        max_workers=params.get("jobs", 4), progress=progress)
+            if results.get("error"):
+                raise JiraError(results["error"], "ATTACH_FAILED")
+            return results
+
+        def mirror(params: Dict[str, Any], progress: Callable[[Dict[str, Any]], None]) -> Dict[str, Any]:
+            results = self.mirror_attachments(jql=params.get("jql"), keys=params.get("keys"),
+                                              max_workers=params.get("jobs", 4), progress=progress)
+            if results.get("error"):
+                raise JiraError(results["error"], "MIRROR_FAILED")
+            return results
+
+        return {"fetch": fetch, "upload": upload, "sync": sync, "query": query, "report": report,
+                "transition": bulk("transition"), "edit": bulk("edit"), "rollback": rollback,
+                "attach": attach, "mirror": mirror}
+
+    def run_daemon(self, host: str = "127.0.0.1", port: int = 8765, workers: int = 1,
+                   webhook_port: Optional[int] = None) -> None:
+        """Serve jobs over a local HTTP endpoint until shut down
+        
+        Args:
+            webhook_port: Also receive Jira webhooks on this port, updating the caches the jobs use
+        """
+        from utils.daemon_handler import JiraDaemon
+        # Build the transport up front so the first job starts warm
+        self.connect_handler
+        receiver = None
+        if webhook_port is not None:
+            from utils.webhook_handler import JiraWebhookReceiver
+            receiver = JiraWebhookReceiver(self.get_handler, host=host, port=webhook_port).start()
+        try:
+            JiraDaemon(self.daemon_runners(), host=host, port=port, workers=workers).serve_forever()
+        finally:
+            if receiver is not None:
+                receiver.shutdown()
+
+    def run_webhook(self, host: str = "127.0.0.1", port: int = 8766) -> None:
+        """Receive Jira webhooks and apply them to the local caches until interrupted"""
+        from utils.webhook_handler import JiraWebhookReceiver
+        JiraWebhookReceiver(self.get_handler, host=host, port=port).serve_forever()
+
 def print_results(results: Dict[str, Any], section: str = None) -> None:
     """Print results in a formatted way"""
     if section == "connection":
@@ -113,6 +531,41 @@ def print_results(results: Dict[str, Any], section: str = None) -> None:
             print(f"Created Subtasks: {len(created.get('subtasks', {}))}")
         else:
             print(f"Error: {results.get('error', 'Unknown error')}")
+    
+    elif section == "batch":
+        print("\n=== Batch Upload Results ===")
+        print(f"Success: {'✓' if results.get('success') else '✗'}")
+        if results.get('error'):
+            print(f"Error: {results['error']}")
+        
+        for yaml_file, result in results.get('files', {}).items():
+            created = result.get('created_issues') or {}
+            status = '✓' if result.get('success') else '✗'
+            counts = "/".join(str(len(created.get(level, {}))) for level in ("epics", "tasks", "subtasks"))
+            print(f"{status} {yaml_file} [{result.get('project', 'Unknown')}] epics/tasks/subtasks: {counts}")
+            if not result.get('success'):
+                print(f"    Error: {result.get('error', 'Unknown error')}")
+        
+        totals = results.get('totals')
+        if totals:
+            print(f"\nFiles: {totals['succeeded']}/{totals['files']} succeeded in {results.get('elapsed_seconds', 0)}s")
+            print(f"Created Epics: {totals['epics']}, Tasks: {totals['tasks']}, Subtasks: {totals['subtasks']}")
+
+    if metrics.enabled:
+        print_metrics_summary()
+
+def print_metrics_summary() -> None:
+    """Print a live per-endpoint summary of the metrics recorded so far"""
+    summary = metrics.summary()
+    totals = summary["totals"]
+    print("\n--- Request Metrics ---")
+    print(f"Requests: {totals['requests']} ({totals['requests_per_second']}/s), "
+          f"retries: {totals['retries']}, 429s: {totals['throttled']}, failures: {totals['failures']}")
+    print(f"Latency p50/p95: {totals['latency_p50']}s / {totals['latency_p95']}s, "
+          f"bytes in/out: {totals['bytes_in']}/{totals['bytes_out']}")
+    for entry in summary["endpoints"]:
+        print(f"  {entry['method']:6} {entry['endpoint']:35} n={entry['count']:<5} "
+              f"p50={entry['latency_p50']}s p95={entry['latency_p95']}s statuses={entry['statuses']}")
 
 def display_menu() -> None:
     """Display the main menu"""
@@ -121,16 +574,305 @@ def display_menu() -> None:
     print("2. Fetch Jira Data")
     print("3. Create Issues from YAML")
     print("4. Full Sync (Fetch & Create)")
-    print("5. Exit")
+    print("5. Batch Upload (directory or glob)")
+    print("6. Exit")
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the non-interactive command-line interface"""
+    parser = argparse.ArgumentParser(
+        prog="jira-manager",
+        description="Jira API manager. Run without a command for the interactive menu."
+    )
+    parser.add_argument("--jobs", type=int, default=4, help="Parallel workers for fetch/upload/bulk updates/attachments (default: 4)")
+    parser.add_argument("--rate", type=float, default=0.0, help="Max requests per second, 0 = unlimited")
+    parser.add_argument("--batch-size", type=int, default=100, help="Search page size (default: 100)")
+    parser.add_argument("--cache-dir", default=None, help="Directory for cached data files (default: data)")
+    parser.add_argument("--report", default=None, help="Also write the JSON report to this file")
+    parser.add_argument("--profile", action="store_true", help="Profile each operation into <cache dir>/profiles")
+    parser.add_argument("--profile-mode", default="all", choices=["cprofile", "sample", "all"],
+                        help="cprofile: .pstats, sample: .collapsed stacks, all: both (default: all)")
+    
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    subparsers.add_parser("test", help="Test the Jira connection")
+    
+    fetch = subparsers.add_parser("fetch", help="Fetch Jira data")
+    fetch.add_argument("--types", default=None,
+                       help="Comma-separated: fields,issue_types,components,versions,work_items (default: all)")
+    fetch.add_argument("--jql", default=None, help="JQL used for work items")
+    fetch.add_argument("--changelog", action="store_true", help="Include work item changelogs (for cycle time)")
+    
+    upload = subparsers.add_parser("upload", help="Create issues from one or more roadmap files")
+    upload.add_argument("files", nargs="+", help="YAML files, directories or glob patterns")
+    
+    sync = subparsers.add_parser("sync", help="Fetch Jira data, then upload roadmaps")
+    sync.add_argument("files", nargs="+", help="YAML files, directories or glob patterns")
+    sync.add_argument("--jql", default=None, help="JQL used for work items")
+    
+    report = subparsers.add_parser("report", help="Analytics over the fetched work items")
+    report.add_argument("--sections", default=None,
+                        help="Comma-separated: counts,progress,slippage,cycle_time,burndown (default: all)")
+    report.add_argument("--days", type=int, default=30, help="Burndown length in days (default: 30)")
+    report.add_argument("--version", default=None, help="Limit the burndown to this fix version")
+    report.add_argument("--refresh", action="store_true", help="Fetch work items with changelogs first")
+    
+    transition = subparsers.add_parser("transition", help="Move issues to a workflow status in bulk")
+    transition.add_argument("keys", nargs="*", help="Issue keys (or use --jql)")
+    transition.add_argument("--jql", default=None, help="JQL selecting the issues")
+    transition.add_argument("--to", required=True, help="Destination status (or transition name)")
+    transition.add_argument("--set", action="append", default=[], metavar="FIELD=VALUE",
+                            help="Field set on the transition screen, e.g. resolution={\"name\":\"Done\"} (repeatable)")
+    
+    edit = subparsers.add_parser("edit", help="Edit fields of issues in bulk")
+    edit.add_argument("keys", nargs="*", help="Issue keys (or use --jql)")
+    edit.add_argument("--jql", default=None, help="JQL selecting the issues")
+    edit.add_argument("--set", action="append", default=[], metavar="FIELD=VALUE",
+                      help="Field value (JSON or plain text), e.g. duedate=2025-06-30 (repeatable)")
+    edit.add_argument("--add-label", action="append", default=[], help="Label to add (repeatable)")
+    edit.add_argument("--remove-label", action="append", default=[], help="Label to remove (repeatable)")
+    edit.add_argument("--no-notify", action="store_true",
+                      help="Do not email watchers (requires Administer Jira or project admin permission)")
+    
+    rollback = subparsers.add_parser("rollback", help="Delete the issues created by upload runs")
+    rollback.add_argument("run_ids", nargs="*", help="Upload run ids (see --list)")
+    rollback.add_argument("--last", action="store_true", help="Roll back the most recent upload run")
+    rollback.add_argument("--from-result", default=None, help="Upload result JSON with created_issues, instead of run ids")
+    rollback.add_argument("--list", action="store_true", help="List upload runs in the creation journal")
+    rollback.add_argument("--dry-run", action="store_true", help="Only list what would be deleted")
+    rollback.add_argument("--yes", action="store_true", help="Delete without asking for confirmation")
+    
+    attach = subparsers.add_parser("attach", help="Upload files to an issue")
+    attach.add_argument("issue", help="Issue key")
+    attach.add_argument("files", nargs="+", help="Files to attach")
+    
+    mirror = subparsers.add_parser("mirror", help="Download issue attachments into the local mirror")
+    mirror.add_argument("keys", nargs="*", help="Issue keys (or use --jql)")
+    mirror.add_argument("--jql", default=None, help="JQL selecting the issues")
+    
+    plan = subparsers.add_parser("plan", help="Show what an upload would create")
+    plan.add_argument("files", nargs="+", help="YAML files, directories or glob patterns")
+    
+    daemon = subparsers.add_parser("daemon", help="Serve fetch/upload/sync/query jobs over local HTTP with warm caches")
+    daemon.add_argument("--host", default="127.0.0.1", help="Address to bind (default: 127.0.0.1)")
+    daemon.add_argument("--port", type=int, default=8765, help="Port to listen on (default: 8765)")
+    daemon.add_argument("--workers", type=int, default=1, help="Jobs run concurrently (default: 1)")
+    daemon.add_argument("--webhook-port", type=int, default=None, help="Also receive Jira webhooks on this port")
+    
+    webhook = subparsers.add_parser("webhook", help="Receive Jira webhooks and apply them to the local caches")
+    webhook.add_argument("--host", default="127.0.0.1", help="Address to bind (default: 127.0.0.1)")
+    webhook.add_argument("--port", type=int, default=8766, help="Port to listen on (default: 8766)")
+    return parser
+
+def _count_items(value: Any) -> int:
+    if isinstance(value, dict) and "issues" in value:
+        return len(value["issues"])
+    return len(value) if isinstance(value, (list, dict)) else int(bool(value))
+
+def _confirm_rollback(plan: Dict[str, Any]) -> bool:
+    """Show a rollback plan on stderr and ask before deleting (never when stdin is not a terminal)"""
+    levels = plan["levels"]
+    kept = f" ({len(plan['kept'])} kept for sub-tasks the upload did not create)" if plan.get("kept") else ""
+    print(f"\nAbout to delete {plan['issues'] - len(plan.get('kept', {}))} issues in {plan['calls']} calls{kept}:",
+          file=sys.stderr)
+    for name in ("subtasks", "tasks", "epics"):
+        for item in levels.get(name, []):
+            if item.get("kept_subtasks"):
+                extra = f" (kept: has other sub-tasks {', '.join(item['kept_subtasks'])})"
+            else:
+                extra = " (with sub-tasks)" if item.get("delete_subtasks") else ""
+            print(f"  {item['key']:12} {name[:-1]:8} {item.get('summary') or ''}{extra}", file=sys.stderr)
+    if not sys.stdin.isatty():
+        print("Not a terminal; pass --yes to delete without confirmation", file=sys.stderr)
+        return False
+    print("Delete these issues? [y/N] ", end="", file=sys.stderr, flush=True)
+    return sys.stdin.readline().strip().lower() in ("y", "yes")
+
+def _load_created_issues(path: str) -> Dict[str, Dict[str, str]]:
+    """created_issues of an upload result file, merged across the files of a batch result"""
+    with open(path, "r", encoding="utf-8") as f:
+        result = json.load(f)
+    merged: Dict[str, Dict[str, str]] = {"epics": {}, "tasks": {}, "subtasks": {}}
+    for upload in [result, *(result.get("files") or {}).values()]:
+        for level, issues in (upload.get("created_issues") or {}).items():
+            merged.setdefault(level, {}).update(issues)
+    return merged
+
+def _parse_assignments(assignments: List[str]) -> Dict[str, Any]:
+    """FIELD=VALUE arguments as a fields dict; values are JSON when they parse as JSON"""
+    fields = {}
+    for assignment in assignments:
+        name, separator, value = assignment.partition("=")
+        if not separator:
+            raise SystemExit(f"Expected FIELD=VALUE, got: {assignment}")
+        try:
+            fields[name.strip()] = json.loads(value)
+        except ValueError:
+            fields[name.strip()] = value
+    return fields
+
+def _summarize(command: str, results: Dict[str, Any]) -> Dict[str, Any]:
+    """Reduce operation results to the parts worth putting in a report"""
+    if command == "fetch":
+        return {data_type: _count_items(data) for data_type, data in results.items() if data_type != "error"}
+    if command in ("upload", "sync"):
+        upload = results.get("upload", results)
+        return {
+            "totals": upload.get("totals", {}),
+            "files": {f: {"success": r.get("success"), "project": r.get("project"), "run_id": r.get("run_id"),
+                          "attachments": r.get("attachments"), "error": r.get("error")}
+                      for f, r in upload.get("files", {}).items()}
+        }
+    if command == "rollback" and "issues" in results:
+        return {
+            **{k: v for k, v in results.items() if k != "issues"},
+            "failed_issues": {key: r for key, r in results["issues"].items() if r.get("result") == "failed"}
+        }
+    if command in ("transition", "edit"):
+        # Per-issue results only for the issues that need attention
+        return {
+            **{k: v for k, v in results.items() if k != "issues"},
+            "failed_issues": {key: r for key, r in results.get("issues", {}).items() if r.get("result") == "failed"}
+        }
+    return results
+
+def run_cli(argv: List[str]) -> int:
+    """Run one non-interactive command and print a machine-readable JSON report"""
+    args = build_parser().parse_args(argv)
+    
+    # Handlers read their settings from the environment when constructed
+    if args.cache_dir:
+        os.environ["JIRA_DATA_DIR"] = args.cache_dir
+    os.environ["JIRA_PAGE_SIZE"] = str(args.batch_size)
+    from utils.connect_handler import rate_limiter
+    rate_limiter.set_rate(args.rate)
+    metrics.enable()
+    metrics.reset()
+    if args.profile:
+        profiler.enable(args.profile_mode, os.path.join(os.getenv("JIRA_DATA_DIR", "data"), "profiles"))
+    
+    if args.command in ("daemon", "webhook"):
+        try:
+            if args.command == "daemon":
+                JiraManager().run_daemon(args.host, args.port, args.workers, args.webhook_port)
+            else:
+                JiraManager().run_webhook(args.host, args.port)
+        finally:
+            metrics.export()
+        return 0
+    
+    started = time.time()
+    # Keep stdout for the report; progress output goes to stderr
+    with contextlib.redirect_stdout(sys.stderr):
+        # Every worker shares one connect handler, so its pool grows with --jobs like the handlers' own pools
+        jira_manager = JiraManager(pool_size=max(10, args.jobs * 2))
+        if args.command == "test":
+            results = jira_manager.test_connection()
+            success = results.get("connection", "").startswith("✓")
+            items = 0
+        elif args.command == "fetch":
+            data_types = [t.strip() for t in args.types.split(",")] if args.types else None
+            results = jira_manager.fetch_jira_data(data_types, jql=args.jql, max_workers=args.jobs,
+                                                   changelog=args.changelog)
+            success = "error" not in results
+            items = _count_items(results.get("work_items"))
+        elif args.command == "report":
+            sections = [s.strip() for s in args.sections.split(",")] if args.sections else None
+            results = jira_manager.report_jira_data(sections, days=args.days, version=args.version,
+                                                    refresh=args.refresh)
+            success = "error" not in results
+            items = results.get("issues", 0)
+        elif args.command in ("transition", "edit"):
+            fields = _parse_assignments(args.set) or None
+            update = None
+            if args.command == "edit" and (args.add_label or args.remove_label):
+                update = {"labels": [{"add": label} for label in args.add_label] +
+                                    [{"remove": label} for label in args.remove_label]}
+            results = jira_manager.bulk_update_issues(args.command, jql=args.jql, keys=args.keys or None,
+                                                      target=getattr(args, "to", None), fields=fields,
+                                                      update=update, max_workers=args.jobs,
+                                                      notify=not getattr(args, "no_notify", False))
+            success = results.get("success", False)
+            items = results.get("updated", 0)
+        elif args.command == "rollback" and args.list:
+            from utils.rollback_handler import JiraRollbackHandler
+            results = {"runs": JiraRollbackHandler(connect_handler=jira_manager.connect_handler).list_runs()}
+            success = True
+            items = 0
+        elif args.command == "rollback":
+            created = _load_created_issues(args.from_result) if args.from_result else None
+            results = jira_manager.rollback_upload(args.run_ids or None, last=args.last, created_issues=created,
+                                                   dry_run=args.dry_run, max_workers=args.jobs,
+                                                   confirm=(lambda plan: True) if args.yes else _confirm_rollback)
+            success = results.get("success", False)
+            items = results.get("deleted", 0)
+        elif args.command == "attach":
+            results = jira_manager.attach_files(args.issue, args.files, max_workers=args.jobs)
+            success = results.get("success", False)
+            items = results.get("uploaded", 0)
+        elif args.command == "mirror":
+            results = jira_manager.mirror_attachments(jql=args.jql, keys=args.keys or None, max_workers=args.jobs)
+            success = results.get("success", False)
+            items = results.get("downloaded", 0) + results.get("resumed", 0)
+        elif args.command == "plan":
+            results = jira_manager.plan_jira_issues(args.files)
+            success = results.get("success", False)
+            items = sum(p.get("total_issues", 0) for p in results.get("files", {}).values())
+        else:
+            if args.command == "sync":
+                results = jira_manager.pipelined_sync(args.files, jql=args.jql, max_workers=args.jobs)
+                upload = results["upload"]
+                success = upload.get("success", False) and "error" not in results["fetch"]
+            else:
+                upload = results = jira_manager.create_jira_issues_batch(args.files, max_workers=args.jobs)
+                success = upload.get("success", False)
+            totals = upload.get("totals", {})
+            items = totals.get("epics", 0) + totals.get("tasks", 0) + totals.get("subtasks", 0)
+    
+    elapsed = time.time() - started
+    summary = metrics.summary()
+    totals = summary["totals"]
+    report = {
+        "command": args.command,
+        "success": bool(success),
+        "elapsed_seconds": round(elapsed, 3),
+        "throughput": {
+            "issues_per_second": round(items / elapsed, 2) if elapsed > 0 else 0.0,
+            "requests_per_second": round(totals["requests"] / elapsed, 2) if elapsed > 0 else 0.0
+        },
+        "latency": {"p50": totals["latency_p50"], "p95": totals["latency_p95"]},
+        "requests": totals["requests"],
+        "retries": totals["retries"],
+        "throttled": totals["throttled"],
+        "failures": {
+            "requests": totals["failures"],
+            "errors": sum(e["count"] for e in summary["errors"])
+        },
+        "settings": {"jobs": args.jobs, "rate": args.rate, "batch_size": args.batch_size,
+                     "cache_dir": os.getenv("JIRA_DATA_DIR", "data")},
+        "result": _summarize(args.command, results)
+    }
+    if args.command == "sync":
+        report["result"]["fetch"] = _summarize("fetch", results["fetch"])
+        report["stages"] = results["stages"]
+    
+    output = json.dumps(report, ensure_ascii=False, indent=2, default=str)
+    print(output)
+    if args.report:
+        with open(args.report, "w", encoding="utf-8") as f:
+            f.write(output)
+    metrics.export()
+    return 0 if success else 1
 
 def main():
     """Main function with improved menu and error handling"""
+    if len(sys.argv) > 1:
+        sys.exit(run_cli(sys.argv[1:]))
+    
     try:
         jira_manager = JiraManager()
         
         while True:
             display_menu()
-            choice = input("\nEnter your choice (1-5): ")
+            choice = input("\nEnter your choice (1-6): ")
             
             if choice == "1":
                 results = jira_manager.test_connection()
@@ -155,30 +897,41 @@ def main():
                 print_results(results, "creation")
                 
             elif choice == "4":
-                # Fetch data first
-                print("\nFetching Jira data...")
-                fetch_results = jira_manager.fetch_jira_data()
-                print_results(fetch_results, "data")
-                
-                # Then create issues
+                # Ask for the roadmap first so fetching and creation can overlap
                 yaml_file = input("\nEnter path to YAML file (default: data/tasks.yaml): ").strip()
                 yaml_file = yaml_file or "data/tasks.yaml"
                 
-                create_results = jira_manager.create_jira_issues(yaml_file)
-                print_results(create_results, "creation")
+                print("\nSyncing (fetch and create run in parallel)...")
+                results = jira_manager.pipelined_sync(yaml_file)
+                print_results(results["fetch"], "data")
+                print_results(results["upload"], "batch")
+                print("\nStage timings: " + ", ".join(f"{stage} {seconds}s" for stage, seconds in results["stages"].items())
+                      + f" (total {results['elapsed_seconds']}s)")
                 
             elif choice == "5":
+                source = input("\nEnter roadmap directory or glob (default: data/roadmaps): ").strip()
+                source = source or "data/roadmaps"
+                workers = input("Enter number of parallel workers (default: 4): ").strip()
+                
+                results = jira_manager.create_jira_issues_batch(source, int(workers) if workers.isdigit() else 4)
+                print_results(results, "batch")
+                
+            elif choice == "6":
                 print("\nExiting Jira Manager. Goodbye!")
                 break
                 
             else:
-                print("\nInvalid choice. Please enter a number between 1 and 5.")
+                print("\nInvalid choice. Please enter a number between 1 and 6.")
                 
     except KeyboardInterrupt:
         print("\n\nOperation cancelled by user. Exiting...")
     except Exception as e:
         print(f"\nUnexpected error: {str(e)}")
         sys.exit(1)
+    finally:
+        if metrics.enabled:
+            paths = metrics.export()
+            print(f"\nMetrics written to {paths['prometheus']} and {paths['json']}")
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
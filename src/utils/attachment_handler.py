@@ -0,0 +1,323 @@
+import os
+import uuid
+import hashlib
+import logging
+import mimetypes
+import threading
+from concurrent.futures import Future
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from .bulk_handler import key_queries
+from .connect_handler import JiraConnectHandler
+from .json_handler import JsonHandler
+from .error_handler import JiraError, JiraAPIError, error_context, ContextThreadPoolExecutor
+
+CHUNK_SIZE = 1 << 16
+
+# One lock per .part file, shared by every handler in the process, so concurrent
+# mirrors of the same attachment never write to one partial file together
+_part_locks: Dict[Path, threading.Lock] = {}
+_part_locks_lock = threading.Lock()
+
+
+def _part_lock(part: Path) -> threading.Lock:
+    with _part_locks_lock:
+        return _part_locks.setdefault(part.resolve(), threading.Lock())
+
+
+class MultipartFileStream:
+    """multipart/form-data body that streams one file from disk
+
+    The length is known up front, so requests sends a Content-Length instead
+    of chunked encoding, and seek(0) rewinds it for a retried request.
+    """
+
+    def __init__(self, path: str, field: str = "file", filename: Optional[str] = None):
+        filename = filename or os.path.basename(path)
+        content_type = mimetypes.guess_type(filename)[0] or "application/octet-stream"
+        self.boundary = uuid.uuid4().hex
+        self._head = (f'--{self.boundary}\r\nContent-Disposition: form-data; name="{field}"; '
+                      f'filename="{filename.replace(chr(34), "%22")}"\r\n'
+                      f'Content-Type: {content_type}\r\n\r\n').encode("utf-8")
+        self._tail = f"\r\n--{self.boundary}--\r\n".encode("ascii")
+        self._file = open(path, "rb")
+        self._size = os.fstat(self._file.fileno()).st_size
+        self._position = 0
+
+    @property
+    def content_type(self) -> str:
+        return f"multipart/form-data; boundary={self.boundary}"
+
+    def __len__(self) -> int:
+        return len(self._head) + self._size + len(self._tail)
+
+    def read(self, size: Optional[int] = -1) -> bytes:
+        if size is None or size < 0:
+            size = len(self) - self._position
+        body_end = len(self._head) + self._size
+        chunks = []
+        while size > 0 and self._position < len(self):
+            if self._position < len(self._head):
+                chunk = self._head[self._position:self._position + size]
+            elif self._position < body_end:
+                chunk = self._file.read(min(size, body_end - self._position))
+                if not chunk:
+                    raise OSError(f"{self._file.name} shrank while uploading")
+            else:
+                offset = self._position - body_end
+                chunk = self._tail[offset:offset + size]
+            chunks.append(chunk)
+            self._position += len(chunk)
+            size -= len(chunk)
+        return b"".join(chunks)
+
+    def __iter__(self) -> Iterator[bytes]:
+        while True:
+            chunk = self.read(CHUNK_SIZE)
+            if not chunk:
+                return
+            yield chunk
+
+    def tell(self) -> int:
+        return self._position
+
+    def seek(self, offset: int, whence: int = 0) -> int:
+        if (offset, whence) != (0, 0):
+            raise OSError("MultipartFileStream can only be rewound to the start")
+        self._file.seek(0)
+        self._position = 0
+        return 0
+
+    def close(self) -> None:
+        self._file.close()
+
+    def __enter__(self) -> "MultipartFileStream":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+
+class JiraAttachmentHandler:
+    """Upload files to issues and mirror issue attachments locally
+
+    Uploads stream each file from disk as multipart/form-data and run on
+    max_workers threads (JIRA_ATTACHMENT_WORKERS, default 4). Downloads go
+    to a content-addressed mirror, objects/<sha256[:2]>/<sha256> under
+    <data>/attachments, with index.json mapping attachment ids to objects:
+    mirrored attachments are skipped, identical files are stored once and an
+    interrupted download resumes from its .part file with a Range request.
+    """
+
+    def __init__(self, connect_handler: Optional[JiraConnectHandler] = None, max_workers: Optional[int] = None,
+                 mirror_dir: Optional[str] = None):
+        self.max_workers = max_workers or int(os.getenv("JIRA_ATTACHMENT_WORKERS", "4"))
+        self.connect_handler = connect_handler or JiraConnectHandler(pool_size=max(10, self.max_workers * 2))
+        self.mirror = JsonHandler(base_dir=mirror_dir or str(JsonHandler().base_dir / "attachments"))
+        self.logger = logging.getLogger(__name__)
+        self._lock = threading.Lock()
+        self._executor: Optional[ContextThreadPoolExecutor] = None
+        # Attachment id -> {"sha256", "size", "filename", "mimeType", "issue", "path"}
+        self._index: Optional[Dict[str, Dict[str, Any]]] = None
+
+    def upload(self, issue_key: str, path: str) -> Dict[str, Any]:
+        """Attach one file to an issue; returns the attachment metadata"""
+        with error_context(issue=issue_key, attachment=path), MultipartFileStream(path) as body:
+            response = self.connect_handler._make_request(
+                "POST", f"issue/{issue_key}/attachments", data=body,
+                headers={"Content-Type": body.content_type, "X-Atlassian-Token": "no-check"})
+        if response.status_code != 200:
+            raise JiraAPIError(f"Failed to attach {os.path.basename(path)} to {issue_key}: {response.status_code}",
+                               str(response.status_code), {"response": response.text[:500]})
+        return response.json()[0]
+
+    def _upload_result(self, issue_key: str, path: str) -> Dict[str, Any]:
+        try:
+            attachment = self.upload(issue_key, path)
+            return {"result": "uploaded", "issue": issue_key, "path": path, "id": attachment.get("id"),
+                    "size": attachment.get("size")}
+        except (JiraError, OSError) as e:
+            self.logger.error(f"Failed to attach {path} to {issue_key}: {str(e)}")
+            return {"result": "failed", "issue": issue_key, "path": path, "error": str(e)}
+
+    def submit(self, issue_key: str, path: str) -> Future:
+        """Queue an upload on the shared worker pool; the future resolves to an upload result"""
+        with self._lock:
+            if self._executor is None:
+                self._executor = ContextThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="jira-attach")
+            return self._executor.submit(self._upload_result, issue_key, path)
+
+    def upload_files(self, files: Iterable[Tuple[str, str]],
+                     progress: Optional[Callable[[Dict[str, Any]], None]] = None) -> Dict[str, Any]:
+        """Upload (issue key, path) pairs in parallel"""
+        futures = [self.submit(issue_key, path) for issue_key, path in files]
+        results = []
+        for future in futures:
+            results.append(future.result())
+            if progress is not None:
+                progress({"event": "attachment", **results[-1]})
+        return summarize_uploads(results)
+
+    def close(self) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+    def list_attachments(self, jql: Optional[str] = None, keys: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+        """Attachment metadata (with the owning issue key) of the issues matched by JQL or keys"""
+        if not jql and not keys:
+            raise JiraError("A JQL query or issue keys are required", "INVALID_ATTACHMENT_REQUEST", {},
+                            {"file": "attachment_handler"})
+        attachments: List[Dict[str, Any]] = []
+        for query in [jql] if jql else key_queries(keys):
+            start_at = 0
+            while True:
+                params = {"jql": query, "startAt": start_at, "maxResults": 100, "fields": "attachment"}
+                if not jql:
+                    # Unknown keys are logged instead of failing the whole search with a 400
+                    params["validateQuery"] = "warn"
+                response = self.connect_handler._make_request("GET", "search", params=params)
+                if response.status_code != 200:
+                    raise JiraAPIError(f"Failed to list attachments: {response.status_code}",
+                                       str(response.status_code), {"jql": query})
+                page = response.json()
+                for warning in page.get("warningMessages") or []:
+                    self.logger.warning(warning)
+                batch = page.get("issues", [])
+                for issue in batch:
+                    for attachment in (issue.get("fields") or {}).get("attachment") or []:
+                        attachments.append({**attachment, "issue": issue["key"]})
+                start_at += len(batch)
+                if not batch or start_at >= page.get("total", 0):
+                    break
+        return attachments
+
+    @property
+    def index(self) -> Dict[str, Dict[str, Any]]:
+        if self._index is None:
+            self._index = self.mirror.load_json("index.json") or {}
+        return self._index
+
+    def object_path(self, sha256: str) -> Path:
+        return self.mirror.base_dir / "objects" / sha256[:2] / sha256
+
+    def path_for(self, attachment_id: str) -> Optional[Path]:
+        """Mirrored file of an attachment, if it has been downloaded"""
+        entry = self.index.get(str(attachment_id))
+        return self.object_path(entry["sha256"]) if entry else None
+
+    def download(self, attachment: Dict[str, Any]) -> Dict[str, Any]:
+        """Mirror one attachment unless it already is; resumes a partial download"""
+        attachment_id = str(attachment["id"])
+        part = self.mirror.base_dir / "partial" / f"{attachment_id}.part"
+        part.parent.mkdir(parents=True, exist_ok=True)
+        # Checked under the lock: a concurrent caller may have just mirrored it
+        with _part_lock(part):
+            return self._download(attachment, attachment_id, part)
+
+    def _download(self, attachment: Dict[str, Any], attachment_id: str, part: Path) -> Dict[str, Any]:
+        expected = attachment.get("size")
+        with self._lock:
+            entry = self.index.get(attachment_id)
+        # Attachment content never changes for an id, so a stored object of the same size is current
+        if entry and self.object_path(entry["sha256"]).exists() and (expected is None or entry["size"] == expected):
+            return {"result": "skipped", "id": attachment_id, "sha256": entry["sha256"]}
+
+        digest = hashlib.sha256()
+        offset = part.stat().st_size if part.exists() else 0
+        if expected is not None and offset > expected:
+            offset = 0
+        if offset:
+            with open(part, "rb") as f:
+                for chunk in iter(lambda: f.read(CHUNK_SIZE), b""):
+                    digest.update(chunk)
+
+        with error_context(attachment=attachment_id, issue=attachment.get("issue")):
+            if expected is None or offset < expected:
+                headers = {"Range": f"bytes={offset}-"} if offset else {}
+                response = self.connect_handler._make_request(
+                    "GET", f"attachment/content/{attachment_id}", stream=True, headers=headers)
+                with response:
+                    if response.status_code == 200 and offset:
+                        # Range not honoured: start over
+                        offset, digest = 0, hashlib.sha256()
+                    elif response.status_code not in (200, 206):
+                        return {"result": "failed", "id": attachment_id, "status_code": response.status_code}
+                    with open(part, "ab" if offset else "wb") as f:
+                        for chunk in response.iter_content(CHUNK_SIZE):
+                            digest.update(chunk)
+                            f.write(chunk)
+            size = part.stat().st_size
+            if expected is not None and size != expected:
+                return {"result": "failed", "id": attachment_id,
+                        "error": f"size mismatch: got {size} of {expected} bytes (kept for resume)"}
+
+        sha256 = digest.hexdigest()
+        target = self.object_path(sha256)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        if target.exists():
+            part.unlink()
+        else:
+            os.replace(part, target)
+        with self._lock:
+            self.index[attachment_id] = {
+                "sha256": sha256, "size": size, "filename": attachment.get("filename"),
+                "mimeType": attachment.get("mimeType"), "issue": attachment.get("issue"),
+                "path": str(target.relative_to(self.mirror.base_dir)),
+                "mirrored": datetime.now().isoformat(timespec="seconds")
+            }
+        return {"result": "resumed" if offset else "downloaded", "id": attachment_id, "sha256": sha256, "size": size}
+
+    def mirror_attachments(self, jql: Optional[str] = None, keys: Optional[List[str]] = None,
+                           progress: Optional[Callable[[Dict[str, Any]], None]] = None) -> Dict[str, Any]:
+        """Download every attachment of the matched issues into the mirror, in parallel"""
+        attachments = self.list_attachments(jql, keys)
+        self.logger.info(f"Mirroring {len(attachments)} attachments with {self.max_workers} workers")
+
+        def download(attachment: Dict[str, Any]) -> Dict[str, Any]:
+            try:
+                result = self.download(attachment)
+            except (JiraError, OSError) as e:
+                result = {"result": "failed", "id": str(attachment.get("id")), "error": str(e)}
+            if progress is not None:
+                progress({"event": "attachment", "issue": attachment.get("issue"), **result})
+            return result
+
+        try:
+            with ContextThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="jira-mirror") as executor:
+                results = list(executor.map(download, attachments))
+        finally:
+            # Saved even when interrupted, so finished downloads are not fetched again; written
+            # from a copy so download workers are not blocked on the file write
+            if self._index is not None:
+                with self._lock:
+                    index = dict(self._index)
+                self.mirror.save_json(index, "index.json")
+
+        counts = {"downloaded": 0, "resumed": 0, "skipped": 0, "failed": 0}
+        for result in results:
+            counts[result["result"]] += 1
+        return {
+            "success": counts["failed"] == 0,
+            "attachments": len(attachments),
+            **counts,
+            "bytes": sum(r.get("size", 0) for r in results if r["result"] in ("downloaded", "resumed")),
+            "mirror": str(self.mirror.base_dir),
+            "failed_attachments": [r for r in results if r["result"] == "failed"]
+        }
+
+
+def summarize_uploads(results: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Counts and failures of a list of upload results"""
+    uploaded = [r for r in results if r["result"] == "uploaded"]
+    failed = [r for r in results if r["result"] == "failed"]
+    return {
+        "success": not failed,
+        "uploaded": len(uploaded),
+        "failed": len(failed),
+        "bytes": sum(r.get("size") or 0 for r in uploaded),
+        "failed_uploads": failed
+    }
@@ -1,6 +1,5 @@
 import os
 import base64
-import yaml
 from dotenv import load_dotenv
 
 class JiraAuthHandler:
@@ -36,6 +35,8 @@ class JiraAuthHandler:
     def load_credentials_from_yaml(self, yaml_file):
         """Load credentials from YAML file if not set in environment"""
         try:
+            import yaml
+            
             with open(yaml_file, 'r', encoding='utf-8') as file:
                 config = yaml.safe_load(file)
                 
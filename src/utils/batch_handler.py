@@ -0,0 +1,111 @@
+import os
+import glob
+import time
+import logging
+from concurrent.futures import as_completed
+from typing import Dict, List, Any, Callable, Iterable, Optional, Union
+
+from .connect_handler import JiraConnectHandler
+from .get_handler import JiraGetHandler
+from .create_handler import JiraCreateHandler
+from .user_handler import JiraUserHandler
+from .error_handler import JiraDataError, ContextThreadPoolExecutor
+
+
+class JiraBatchHandler:
+    """Upload many roadmap files, possibly for different projects, in parallel
+
+    Every file gets its own JiraCreateHandler (project key and created issues
+    are isolated per file) while the transport, project snapshots and user
+    directory are shared between workers.
+    """
+
+    YAML_PATTERNS = ("*.yaml", "*.yml")
+
+    def __init__(self, max_workers: int = 4, connect_handler: Optional[JiraConnectHandler] = None,
+                 get_handler: Optional[JiraGetHandler] = None, user_handler: Optional[JiraUserHandler] = None):
+        self.max_workers = max_workers
+        self.connect_handler = connect_handler or JiraConnectHandler(pool_size=max(10, max_workers * 2))
+        self.get_handler = get_handler or JiraGetHandler(connect_handler=self.connect_handler)
+        self.user_handler = user_handler or JiraUserHandler(self.connect_handler)
+        self.logger = logging.getLogger(__name__)
+
+    def resolve_roadmap_files(self, source: Union[str, Iterable[str]]) -> List[str]:
+        """Expand a directory, glob pattern, file path or list of those into YAML files"""
+        sources = [source] if isinstance(source, str) else list(source)
+        files: List[str] = []
+        for src in sources:
+            if os.path.isdir(src):
+                for pattern in self.YAML_PATTERNS:
+                    files.extend(glob.glob(os.path.join(src, pattern)))
+            elif os.path.isfile(src):
+                files.append(src)
+            else:
+                files.extend(glob.glob(src, recursive=True))
+
+        # Preserve order but drop duplicates from overlapping patterns
+        unique = list(dict.fromkeys(os.path.normpath(f) for f in files))
+        if not unique:
+            raise JiraDataError(
+                f"No roadmap files found for {source}",
+                "NO_ROADMAP_FILES",
+                {"source": sources},
+                {"file": "batch_handler"}
+            )
+        return sorted(unique)
+
+    def _upload_one(self, yaml_file: str, data: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Upload a single roadmap with its own isolated create handler"""
+        started = time.time()
+        handler = JiraCreateHandler(
+            connect_handler=self.connect_handler,
+            get_handler=self.get_handler,
+            user_handler=self.user_handler
+        )
+        result = handler.upload_roadmap(yaml_file, data)
+        result["elapsed_seconds"] = round(time.time() - started, 3)
+        return result
+
+    def upload_roadmaps(self, source: Union[str, Iterable[str]],
+                        on_result: Optional[Callable[[str, Dict[str, Any]], None]] = None,
+                        roadmaps: Optional[Dict[str, Dict[str, Any]]] = None) -> Dict[str, Any]:
+        """Upload every roadmap file matched by source in parallel
+
+        Args:
+            source: Directory, glob pattern, file path or list of those
+            on_result: Optional callback(yaml_file, result) invoked as each file finishes
+            roadmaps: Already parsed roadmaps by file path; other files are parsed here
+
+        Returns:
+            Aggregated result with a per-file upload result and totals
+        """
+        files = self.resolve_roadmap_files(source)
+        self.logger.info(f"Uploading {len(files)} roadmap files with {self.max_workers} workers")
+
+        started = time.time()
+        results: Dict[str, Dict[str, Any]] = {}
+        with ContextThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = {executor.submit(self._upload_one, f, (roadmaps or {}).get(f)): f for f in files}
+            for future in as_completed(futures):
+                yaml_file = futures[future]
+                try:
+                    results[yaml_file] = future.result()
+                except Exception as e:
+                    self.logger.error(f"Error uploading {yaml_file}: {str(e)}")
+                    results[yaml_file] = {"success": False, "error": str(e), "project": None, "created_issues": {}}
+                if on_result is not None:
+                    on_result(yaml_file, results[yaml_file])
+
+        totals = {"files": len(files), "succeeded": 0, "failed": 0, "epics": 0, "tasks": 0, "subtasks": 0}
+        for result in results.values():
+            totals["succeeded" if result.get("success") else "failed"] += 1
+            created = result.get("created_issues") or {}
+            for level in ("epics", "tasks", "subtasks"):
+                totals[level] += len(created.get(level, {}))
+
+        return {
+            "success": totals["failed"] == 0,
+            "elapsed_seconds": round(time.time() - started, 3),
+            "totals": totals,
+            "files": {f: results[f] for f in files}
+        }
@@ -0,0 +1,259 @@
+import os
+import time
+import logging
+import threading
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .connect_handler import JiraConnectHandler
+from .get_handler import JiraGetHandler
+from .error_handler import JiraError, JiraAPIError, error_context, ContextThreadPoolExecutor
+
+# Search clause size when a key list is resolved through JQL
+KEY_CHUNK = 100
+RESOLVE_FIELDS = "summary,issuetype,status"
+
+
+def key_queries(keys: List[str]) -> List[str]:
+    """'key in (...)' queries for a key list, KEY_CHUNK keys each
+
+    Search them with validateQuery=warn: Jira otherwise rejects the whole
+    query with a 400 when any listed key does not exist.
+    """
+    return [f"key in ({','.join(keys[i:i + KEY_CHUNK])})" for i in range(0, len(keys), KEY_CHUNK)]
+
+
+class JiraBulkHandler:
+    """Move many issues through workflow transitions or edit their fields
+
+    Issues come from a JQL query or a key list and are resolved with one
+    paged search. Available transitions are looked up once per (issue type,
+    status) and cached; updates then run on max_workers threads over the
+    shared, rate limited transport (429s wait out Retry-After there).
+    Issues that still fail are retried once in a second, narrower pass that
+    re-reads each issue and looks up its own transitions.
+    """
+
+    def __init__(self, connect_handler: Optional[JiraConnectHandler] = None,
+                 get_handler: Optional[JiraGetHandler] = None, max_workers: Optional[int] = None):
+        self.max_workers = max_workers or int(os.getenv("JIRA_BULK_WORKERS", "8"))
+        self.connect_handler = connect_handler or JiraConnectHandler(pool_size=max(10, self.max_workers * 2))
+        # Locally stored work items are patched as updates succeed (when a get handler is given)
+        self.get_handler = get_handler
+        self.logger = logging.getLogger(__name__)
+        self._lock = threading.Lock()
+        # (issue type id, status id) -> transitions available from that status
+        self._transitions: Dict[Tuple[str, str], List[Dict[str, Any]]] = {}
+        self.transition_lookups = 0
+
+    def resolve_issues(self, jql: Optional[str] = None, keys: Optional[List[str]] = None) -> Dict[str, Dict[str, Any]]:
+        """Issue key -> search result (summary, issue type, status) for a JQL query or key list"""
+        if not jql and not keys:
+            raise JiraError("A JQL query or issue keys are required", "INVALID_BULK_REQUEST", {},
+                            {"file": "bulk_handler"})
+        queries = [jql] if jql else key_queries(keys)
+        issues: Dict[str, Dict[str, Any]] = {}
+        for query in queries:
+            start_at = 0
+            while True:
+                params = {"jql": query, "startAt": start_at, "maxResults": 100, "fields": RESOLVE_FIELDS}
+                if not jql:
+                    # Missing keys become warnings and are reported per key instead of failing the run
+                    params["validateQuery"] = "warn"
+                response = self.connect_handler._make_request("GET", "search", params=params)
+                if response.status_code != 200:
+                    raise JiraAPIError(f"Failed to resolve issues: {response.status_code}",
+                                       str(response.status_code), {"jql": query})
+                page = response.json()
+                for warning in page.get("warningMessages") or []:
+                    self.logger.warning(warning)
+                batch = page.get("issues", [])
+                issues.update((issue["key"], issue) for issue in batch)
+                start_at += len(batch)
+                if not batch or start_at >= page.get("total", 0):
+                    break
+        return issues
+
+    @staticmethod
+    def _group(issue: Dict[str, Any]) -> Tuple[str, str]:
+        fields = issue.get("fields") or {}
+        issuetype = fields.get("issuetype") or {}
+        status = fields.get("status") or {}
+        return str(issuetype.get("id") or issuetype.get("name")), str(status.get("id") or status.get("name"))
+
+    def get_transitions(self, issue_key: str, group: Optional[Tuple[str, str]] = None) -> List[Dict[str, Any]]:
+        """Transitions available to an issue; cached per (issue type, status) when group is given"""
+        if group is not None and group in self._transitions:
+            return self._transitions[group]
+        response = self.connect_handler._make_request("GET", f"issue/{issue_key}/transitions")
+        if response.status_code != 200:
+            raise JiraAPIError(f"Failed to get transitions of {issue_key}: {response.status_code}",
+                               str(response.status_code), {"response": response.text})
+        transitions = response.json().get("transitions", [])
+        with self._lock:
+            self.transition_lookups += 1
+            if group is not None:
+                self._transitions[group] = transitions
+        return transitions
+
+    @staticmethod
+    def _find_transition(transitions: List[Dict[str, Any]], target: str) -> Optional[Dict[str, Any]]:
+        """Transition whose destination status (or own name) matches target"""
+        target = target.strip().lower()
+        return next((t for t in transitions if (t.get("to") or {}).get("name", "").lower() == target), None) or \
+            next((t for t in transitions if t.get("name", "").lower() == target), None)
+
+    def _transition_one(self, key: str, issue: Dict[str, Any], target: str, fields: Optional[Dict[str, Any]],
+                        cached: bool) -> Dict[str, Any]:
+        status = (issue.get("fields") or {}).get("status") or {}
+        if status.get("name", "").lower() == target.strip().lower():
+            return {"result": "skipped", "reason": f"already {status.get('name')}"}
+        transitions = self.get_transitions(key, self._group(issue) if cached else None)
+        transition = self._find_transition(transitions, target)
+        if transition is None:
+            available = ", ".join((t.get("to") or {}).get("name") or t.get("name", "") for t in transitions)
+            return {"result": "failed", "error": f"No transition to '{target}' from {status.get('name')} "
+                                                 f"(available: {available or 'none'})"}
+        payload: Dict[str, Any] = {"transition": {"id": transition["id"]}}
+        if fields:
+            payload["fields"] = fields
+        response = self.connect_handler._make_request("POST", f"issue/{key}/transitions", json=payload)
+        if response.status_code != 204:
+            return {"result": "failed", "status_code": response.status_code, "error": response.text[:500]}
+        if self.get_handler is not None and transition.get("to"):
+            self.get_handler.patch_work_item(key, lambda _: {"status": transition["to"], **(fields or {})})
+        return {"result": "updated", "from": status.get("name"), "to": (transition.get("to") or {}).get("name")}
+
+    def _edit_one(self, key: str, issue: Dict[str, Any], fields: Optional[Dict[str, Any]],
+                  update: Optional[Dict[str, List[Dict[str, Any]]]], notify: bool = True) -> Dict[str, Any]:
+        payload: Dict[str, Any] = {}
+        if fields:
+            payload["fields"] = fields
+        if update:
+            payload["update"] = update
+        # Suppressing notifications requires Administer Jira or project admin permission
+        params = {} if notify else {"notifyUsers": "false"}
+        response = self.connect_handler._make_request("PUT", f"issue/{key}", params=params, json=payload)
+        if response.status_code != 204:
+            return {"result": "failed", "status_code": response.status_code, "error": response.text[:500]}
+        if self.get_handler is not None:
+            self.get_handler.patch_work_item(key, lambda current: _apply_update(current, fields, update))
+        return {"result": "updated"}
+
+    def _run(self, operation: str, issues: Dict[str, Dict[str, Any]],
+             apply: Callable[[str, Dict[str, Any], bool], Dict[str, Any]],
+             progress: Optional[Callable[[Dict[str, Any]], None]] = None) -> Dict[str, Any]:
+        """Apply to every issue in parallel, then retry failures once with fresh issue data"""
+        started = time.perf_counter()
+        results: Dict[str, Dict[str, Any]] = {}
+
+        def attempt(key: str, issue: Dict[str, Any], first_pass: bool) -> Tuple[str, Dict[str, Any]]:
+            with error_context(issue=key, operation=operation):
+                try:
+                    if not first_pass:
+                        # The first attempt may have landed before failing (e.g. a lost response)
+                        response = self.connect_handler._make_request(
+                            "GET", f"issue/{key}", params={"fields": RESOLVE_FIELDS})
+                        if response.status_code == 200:
+                            issue = response.json()
+                    result = apply(key, issue, first_pass)
+                except JiraError as e:
+                    result = {"result": "failed", "error": str(e)}
+            result["attempts"] = results.get(key, {}).get("attempts", 0) + 1
+            if progress is not None:
+                progress({"event": operation, "issue": key, **result})
+            return key, result
+
+        with ContextThreadPoolExecutor(max_workers=max(1, self.max_workers)) as executor:
+            # One transition lookup per (type, status) before fanning out, so workers only hit the cache
+            if operation == "transition":
+                groups = {self._group(issue): key for key, issue in issues.items()}
+                list(executor.map(lambda item: self._safe_lookup(item[1], item[0]),
+                                  [(g, k) for g, k in groups.items() if g not in self._transitions]))
+            results.update(executor.map(lambda item: attempt(*item, True), issues.items()))
+
+        failed = [key for key, result in results.items() if result["result"] == "failed"]
+        if failed:
+            self.logger.info(f"Retrying {len(failed)} failed {operation}s")
+            # Narrower second pass: whatever failed under load is less likely to fail again
+            with ContextThreadPoolExecutor(max_workers=max(1, self.max_workers // 4)) as executor:
+                results.update(executor.map(lambda key: attempt(key, issues[key], False), failed))
+
+        counts = {"updated": 0, "skipped": 0, "failed": 0}
+        for result in results.values():
+            counts[result["result"]] += 1
+        if self.get_handler is not None and counts["updated"]:
+            self.get_handler.flush_local_changes()
+        return {
+            "success": counts["failed"] == 0,
+            "operation": operation,
+            "total": len(issues),
+            **counts,
+            "retried": len(failed),
+            "transition_lookups": self.transition_lookups,
+            "elapsed_seconds": round(time.perf_counter() - started, 3),
+            "issues": results
+        }
+
+    def _safe_lookup(self, key: str, group: Tuple[str, str]) -> None:
+        try:
+            self.get_transitions(key, group)
+        except JiraError as e:
+            # Left to the per-issue attempt, which reports the error
+            self.logger.warning(f"Transition lookup for {key} failed: {str(e)}")
+
+    def bulk_transition(self, target: str, jql: Optional[str] = None, keys: Optional[List[str]] = None,
+                        fields: Optional[Dict[str, Any]] = None,
+                        progress: Optional[Callable[[Dict[str, Any]], None]] = None) -> Dict[str, Any]:
+        """Move every matched issue to the target status (or through the transition of that name)
+
+        Args:
+            target: Destination status name, or transition name
+            fields: Optional fields set on the transition screen (e.g. resolution)
+        """
+        issues = self.resolve_issues(jql, keys)
+        self.logger.info(f"Transitioning {len(issues)} issues to '{target}' with {self.max_workers} workers")
+        result = self._run("transition", issues,
+                           lambda key, issue, cached: self._transition_one(key, issue, target, fields, cached),
+                           progress)
+        result["missing"] = sorted(set(keys or []) - set(issues))
+        result["success"] = result["success"] and not result["missing"]
+        return result
+
+    def bulk_edit(self, fields: Optional[Dict[str, Any]] = None, update: Optional[Dict[str, List[Dict[str, Any]]]] = None,
+                  jql: Optional[str] = None, keys: Optional[List[str]] = None,
+                  progress: Optional[Callable[[Dict[str, Any]], None]] = None, notify: bool = True) -> Dict[str, Any]:
+        """Edit every matched issue
+
+        Args:
+            fields: Field values to set, e.g. {"duedate": "2025-06-30"}
+            update: Field operations, e.g. {"labels": [{"add": "q3"}, {"remove": "q2"}]}
+            notify: False skips the watchers' emails (needs admin or project admin permission)
+        """
+        if not fields and not update:
+            raise JiraError("Nothing to edit: fields or update operations are required", "INVALID_BULK_REQUEST",
+                            {}, {"file": "bulk_handler"})
+        issues = self.resolve_issues(jql, keys)
+        self.logger.info(f"Editing {len(issues)} issues with {self.max_workers} workers")
+        result = self._run("edit", issues, lambda key, issue, cached: self._edit_one(key, issue, fields, update, notify),
+                           progress)
+        result["missing"] = sorted(set(keys or []) - set(issues))
+        result["success"] = result["success"] and not result["missing"]
+        return result
+
+
+def _apply_update(current: Dict[str, Any], fields: Optional[Dict[str, Any]],
+                  update: Optional[Dict[str, List[Dict[str, Any]]]]) -> Dict[str, Any]:
+    """Changed field values after an edit, computed from the local copy"""
+    changed = dict(fields or {})
+    for name, operations in (update or {}).items():
+        value = changed.get(name, current.get(name))
+        for operation in operations:
+            for op, operand in operation.items():
+                if op == "set":
+                    value = operand
+                elif op == "add":
+                    value = [*(value or []), *([] if operand in (value or []) else [operand])]
+                elif op == "remove":
+                    value = [v for v in value or [] if v != operand]
+        changed[name] = value
+    return changed
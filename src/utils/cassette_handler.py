@@ -0,0 +1,190 @@
+import os
+import json
+import time
+import hashlib
+import logging
+import threading
+from collections import defaultdict, deque
+from datetime import timedelta
+from pathlib import Path
+from typing import Any, Deque, Dict, Iterable, List, Optional, Tuple
+from urllib.parse import urlencode
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from .error_handler import JiraError
+
+REDACTED = "<redacted>"
+BASE_URL_PLACEHOLDER = "{JIRA_URL}"
+# Response headers worth keeping: they change client behaviour (retries) or sizing
+KEPT_HEADERS = ("Content-Type", "Retry-After", "X-RateLimit-Limit", "X-RateLimit-Remaining", "X-RateLimit-Reset")
+MODES = ("record", "replay")
+
+
+class Cassette:
+    """Recorded request/response pairs for deterministic offline runs
+
+    In record mode every attempt sent through JiraConnectHandler (retries
+    included, so 429 bursts are kept) is written to a JSONL file, replacing
+    any earlier recording, with the credentials and instance URL redacted. In replay mode requests are
+    answered from that file in recorded order per request, after sleeping the
+    recorded latency multiplied by timing_scale (0 replays instantly).
+    """
+
+    def __init__(self, path: str, mode: str = "replay", timing_scale: float = 1.0, match_body: bool = True,
+                 secrets: Iterable[Optional[str]] = (), base_url: str = ""):
+        if mode not in MODES:
+            raise JiraError(f"Unknown cassette mode: {mode}", "INVALID_CASSETTE",
+                            {"mode": mode, "supported": list(MODES)}, {"file": "cassette_handler"})
+        self.path = Path(path)
+        self.mode = mode
+        self.timing_scale = max(float(timing_scale), 0.0)
+        self.match_body = match_body
+        self.base_url = base_url.rstrip("/")
+        self.secrets = sorted({s for s in secrets if s and len(s) > 3}, key=len, reverse=True)
+        self.logger = logging.getLogger(__name__)
+        self._lock = threading.Lock()
+        self._started = time.monotonic()
+        self._interactions: Dict[str, Deque[Dict[str, Any]]] = defaultdict(deque)
+        self._last: Dict[str, Dict[str, Any]] = {}
+
+        if mode == "record":
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            # A recording replaces the previous one; appending would replay stale interactions first
+            self._file = open(self.path, "w", encoding="utf-8")
+        else:
+            self._file = None
+            self._load()
+
+    def _load(self) -> None:
+        if not self.path.exists():
+            raise JiraError(f"Cassette not found: {self.path}", "CASSETTE_NOT_FOUND",
+                            {"path": str(self.path)}, {"file": "cassette_handler"})
+        count = 0
+        with open(self.path, encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    interaction = json.loads(line)
+                    self._interactions[interaction["match"] if self.match_body else interaction["route"]].append(interaction)
+                    count += 1
+        self.logger.info(f"Loaded {count} recorded interactions from {self.path}")
+
+    def _redact(self, text: str) -> str:
+        if self.base_url:
+            text = text.replace(self.base_url, BASE_URL_PLACEHOLDER)
+        for secret in self.secrets:
+            text = text.replace(secret, REDACTED)
+        return text
+
+    def _keys(self, method: str, url: str, kwargs: Dict[str, Any]) -> Tuple[str, str, Optional[str]]:
+        """Route (method, path and sorted query) and match key (route plus body hash) of a request"""
+        endpoint = url[len(self.base_url):] if self.base_url and url.startswith(self.base_url) else url
+        params = kwargs.get("params") or {}
+        query = urlencode(sorted((k, str(v)) for k, v in params.items())) if isinstance(params, dict) else str(params)
+        route = f"{method} {endpoint}" + (f"?{query}" if query else "")
+        body = kwargs.get("json")
+        body_text = json.dumps(body, sort_keys=True, ensure_ascii=False) if body is not None else kwargs.get("data")
+        if isinstance(body_text, bytes):
+            body_text = body_text.decode("utf-8", "replace")
+        elif not isinstance(body_text, str):
+            # Streamed bodies (attachment uploads) are neither recorded nor matched
+            body_text = None
+        digest = hashlib.sha1(self._redact(body_text).encode("utf-8")).hexdigest()[:16] if body_text else "-"
+        return route, f"{route} #{digest}", body_text
+
+    def request(self, session: requests.Session, method: str, url: str, **kwargs: Any) -> requests.Response:
+        """Send (record mode) or replay (replay mode) one request"""
+        route, match, body_text = self._keys(method, url, kwargs)
+        if self.mode == "replay":
+            return self._replay(method, url, route, match, kwargs)
+
+        started = time.perf_counter()
+        response = session.request(method, url, **kwargs)
+        elapsed = time.perf_counter() - started
+        interaction = {
+            "route": self._redact(route),
+            "match": self._redact(match),
+            "offset": round(time.monotonic() - self._started, 4),
+            "elapsed": round(elapsed, 4),
+            "request_body": self._redact(body_text) if body_text else None,
+            "status": response.status_code,
+            "headers": {h: response.headers[h] for h in KEPT_HEADERS if h in response.headers},
+            "body": self._redact(response.text)
+        }
+        line = json.dumps(interaction, ensure_ascii=False) + "\n"
+        with self._lock:
+            self._file.write(line)
+            self._file.flush()
+        return response
+
+    def _replay(self, method: str, url: str, route: str, match: str, kwargs: Dict[str, Any]) -> requests.Response:
+        key = self._redact(match if self.match_body else route)
+        with self._lock:
+            queue = self._interactions.get(key)
+            if queue:
+                interaction = queue.popleft()
+                self._last[key] = interaction
+            else:
+                # Once a request's recordings are used up, keep answering with the last one
+                interaction = self._last.get(key)
+        if interaction is None:
+            raise JiraError(f"No recorded response for {route}", "CASSETTE_MISS",
+                            {"route": route, "cassette": str(self.path)}, {"file": "cassette_handler"})
+
+        if self.timing_scale:
+            time.sleep(interaction["elapsed"] * self.timing_scale)
+
+        body = interaction["body"].replace(BASE_URL_PLACEHOLDER, self.base_url).encode("utf-8")
+        response = requests.Response()
+        response.status_code = interaction["status"]
+        response._content = body
+        response._content_consumed = True
+        response.headers = CaseInsensitiveDict({**interaction["headers"], "Content-Length": str(len(body))})
+        response.encoding = "utf-8"
+        response.url = url
+        response.elapsed = timedelta(seconds=interaction["elapsed"])
+        response.request = requests.Request(method, url, params=kwargs.get("params"), json=kwargs.get("json"),
+                                            data=kwargs.get("data")).prepare()
+        return response
+
+    def remaining(self) -> int:
+        """Recorded interactions not replayed yet"""
+        with self._lock:
+            return sum(len(q) for q in self._interactions.values())
+
+    def close(self) -> None:
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+
+_cassettes: Dict[Tuple[str, str], Cassette] = {}
+_cassettes_lock = threading.Lock()
+
+
+def cassette_from_env(secrets: List[Optional[str]], base_url: str) -> Optional[Cassette]:
+    """Cassette configured by JIRA_CASSETTE_MODE / JIRA_CASSETTE, shared per file
+
+    JIRA_CASSETTE_MODE     "record" or "replay" (unset: talk to Jira normally)
+    JIRA_CASSETTE          cassette file (default: data/cassettes/jira.jsonl)
+    JIRA_CASSETTE_TIMING   replay latency multiplier (default 1.0 = original, 0 = instant)
+    JIRA_CASSETTE_MATCH    "body" (default) matches requests by body too, "route" by method and URL only
+    """
+    mode = os.getenv("JIRA_CASSETTE_MODE", "").strip().lower()
+    if not mode or mode == "off":
+        return None
+    path = os.getenv("JIRA_CASSETTE") or os.path.join(os.getenv("JIRA_DATA_DIR", "data"), "cassettes", "jira.jsonl")
+    with _cassettes_lock:
+        key = (os.path.abspath(path), mode)
+        if key not in _cassettes:
+            _cassettes[key] = Cassette(
+                path,
+                mode=mode,
+                timing_scale=float(os.getenv("JIRA_CASSETTE_TIMING", "1.0") or 0),
+                match_body=os.getenv("JIRA_CASSETTE_MATCH", "body").lower() != "route",
+                secrets=secrets,
+                base_url=base_url
+            )
+        return _cassettes[key]
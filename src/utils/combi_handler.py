@@ -1,6 +1,7 @@
-from typing import Dict, List, Set, Protocol
+from typing import Dict, List, Set, Protocol, Callable, Iterable
+from concurrent.futures import as_completed
 from .validate_handler import JiraValidateHandler
-from .error_handler import error_handler, JiraError
+from .error_handler import error_handler, JiraError, ContextThreadPoolExecutor
 from .connect_handler import JiraConnectHandler
 
 class CreateHandlerProtocol(Protocol):
@@ -16,6 +17,7 @@ class JiraCombiHandler:
         self.connect = connect_handler
         self.validate_handler = JiraValidateHandler(connect_handler=self.connect)
         self.create_handler = create_handler
+        self.max_workers = 4
 
     def _validate_and_create_fields(self) -> None:
         """Validate required fields exist and create them if missing"""
@@ -39,6 +41,74 @@ class JiraCombiHandler:
             except Exception as e:
                 print(f"✗ Failed to create components field: {str(e)}")
 
+    @staticmethod
+    def _collect_names(data: Dict, key: str) -> Set[str]:
+        """Collect the values of a list field from every epic, task and subtask"""
+        names: Set[str] = set()
+
+        def walk(items: List[Dict]) -> None:
+            for item in items or []:
+                value = item.get(key, [])
+                names.update(value if isinstance(value, list) else [value])
+                walk(item.get("tasks", []))
+                walk(item.get("subtasks", []))
+
+        walk(data.get("epics", []))
+        walk(data.get("tasks", []))
+        return names
+
+    def _create_missing(self, kind: str, names: Iterable[str], create: Callable[[Dict], Dict]) -> List[str]:
+        """Create missing components or versions concurrently
+
+        Returns:
+            Names that could not be created
+        """
+        failed: List[str] = []
+        names = sorted(names)
+        if not names:
+            return failed
+        
+        print(f"Creating {len(names)} missing {kind}: {', '.join(names)}")
+        with ContextThreadPoolExecutor(max_workers=min(self.max_workers, len(names))) as executor:
+            futures = {executor.submit(create, {"name": name}): name for name in names}
+            for future in as_completed(futures):
+                name = futures[future]
+                try:
+                    future.result()
+                except Exception as e:
+                    print(f"✗ Failed to create {kind[:-1]} {name}: {str(e)}")
+                    failed.append(name)
+        return failed
+
+    def reconcile_components_and_versions(self, project_key: str, components: Set[str], versions: Set[str]) -> Dict[str, List[str]]:
+        """Fetch the existing components and versions once and create the missing ones
+        
+        Args:
+            project_key: Project to reconcile
+            components: Component names referenced by the roadmap
+            versions: Version names referenced by the roadmap
+            
+        Returns:
+            Dictionary with the created and failed names per kind
+        """
+        result = {"created_components": [], "created_versions": [], "failed": []}
+        
+        if components:
+            print("\nChecking components...")
+            missing = set(components) - self.validate_handler.get_component_names(project_key)
+            failed = self._create_missing("components", missing, self.create_handler.create_component)
+            result["created_components"] = sorted(missing - set(failed))
+            result["failed"].extend(failed)
+        
+        if versions:
+            print("\nChecking versions...")
+            missing = set(versions) - self.validate_handler.get_version_names(project_key)
+            failed = self._create_missing("versions", missing, self.create_handler.create_version)
+            result["created_versions"] = sorted(missing - set(failed))
+            result["failed"].extend(failed)
+        
+        return result
+
     @error_handler
     def validate_and_prepare_project(self, data: Dict) -> None:
         """Validate and prepare project configuration before creating issues"""
@@ -120,10 +190,10 @@ class JiraCombiHandler:
                 {"file": "project_config"}
             )
         
-        # Validate issue types
-        required_types = ["Epic", "Task", "Sub-task"]
-        for issue_type in required_types:
-            if not self.validate_handler.validate_issue_type(project_key, issue_type):
+        # Validate issue types against a single fetch of the project's types
+        available_types = {it.get("name") for it in self.validate_handler.get_available_issue_types(project_key)}
+        for issue_type in ["Epic", "Task", "Sub-task"]:
+            if issue_type not in available_types:
                 raise JiraError(
                     f"Required issue type '{issue_type}' not found in project",
                     "INVALID_ISSUE_TYPE",
@@ -131,20 +201,12 @@ class JiraCombiHandler:
                     {"file": "project_config"}
                 )
         
-        # Check components
-        if all_components:
-            print("\nChecking components...")
-            for component in all_components:
-                if not self.validate_handler.validate_component(project_key, component):
-                    print(f"Creating missing component: {component}")
-                    self.create_handler.create_component({"name": component})
-        
-        # Check versions
-        if all_versions:
-            print("\nChecking versions...")
-            for version in all_versions:
-                if not self.validate_handler.validate_version(project_key, version):
-                    print(f"Creating missing version: {version}")
-                    self.create_handler.create_version({"name": version})
+        # Reconcile components and versions (including nested tasks and subtasks)
+        all_components.update(self._collect_names(data, "components"))
+        all_versions.update(self._collect_names(data, "fixVersions"))
+        reconciled = self.reconcile_components_and_versions(project_key, all_components, all_versions)
+        if reconciled["created_components"] or reconciled["created_versions"]:
+            # The cached snapshot no longer lists everything in the project
+            self.connect.invalidate_project_snapshot(project_key)
         
         print("Project configuration validated successfully")
@@ -1,12 +1,63 @@
 import os
+import time
+import threading
 import requests
+from requests.adapters import HTTPAdapter
 from typing import Optional, Dict, Any, List
 import logging
 
-from .error_handler import JiraError
+from .error_handler import JiraError, error_context
+from .project_snapshot import ProjectSnapshot, project_snapshot_cache
+from .metrics_handler import metrics
+from .cassette_handler import cassette_from_env
+from .profile_handler import profile_span
+
+class RateLimiter:
+    """Token bucket shared by every connect handler in the process
+
+    A rate of 0 disables limiting (the default, unless JIRA_RATE_LIMIT is set).
+    """
+
+    def __init__(self, rate: float = 0.0, burst: Optional[int] = None):
+        self._lock = threading.Lock()
+        self.set_rate(rate, burst)
+
+    def set_rate(self, rate: float, burst: Optional[int] = None) -> None:
+        with self._lock:
+            self.rate = max(float(rate or 0), 0.0)
+            self.capacity = float(burst or max(1, int(self.rate)))
+            self._tokens = self.capacity
+            self._updated = time.monotonic()
+
+    def acquire(self) -> None:
+        """Block until a request may be sent"""
+        if not self.rate:
+            return
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+
+rate_limiter = RateLimiter(float(os.getenv("JIRA_RATE_LIMIT", "0") or 0))
+
 
 class JiraConnectHandler:
-    def __init__(self):
+    # Status codes that are retried after waiting (Retry-After or exponential backoff)
+    RETRY_STATUS_CODES = (429, 503)
+    # A 503 may come after a POST was applied, so non-idempotent POSTs (creates, transitions,
+    # attachments) are only resent on 429, which Jira returns before doing any work
+    POST_RETRY_STATUS_CODES = (429,)
+    # POST endpoints that only read, and are safe to resend on any retryable status
+    READ_ONLY_POSTS = ("search", "search/jql")
+
+    def __init__(self, pool_size: int = 10, max_retries: int = 3):
         self.base_url = os.getenv('JIRA_URL', '') or os.getenv('JIRA_INSTANCE', '')
         if self.base_url:
             self.base_url = self.base_url.rstrip('/')
@@ -31,6 +82,15 @@ class JiraConnectHandler:
             "Content-Type": "application/json"
         })
         
+        # Size the connection pool so one handler can be shared by worker threads
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.max_retries = max_retries
+        
+        # Record or replay HTTP traffic instead of plain sending (JIRA_CASSETTE_MODE)
+        self.cassette = cassette_from_env([self.username, self.token], self.base_url)
+        
         # Setup logging
         logging.basicConfig(level=logging.DEBUG)
         self.logger = logging.getLogger(__name__)
@@ -41,18 +101,55 @@ class JiraConnectHandler:
         endpoint = endpoint.lstrip('/')
         url = f"{self.base_url}/rest/api/3/{endpoint}"
         
-        # Log request details
-        self.logger.debug(f"Making {method} request to: {url}")
-        if 'json' in kwargs:
-            self.logger.debug(f"Request payload: {kwargs['json']}")
+        # Log request details (skip building large debug strings when DEBUG is off)
+        debug = self.logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            self.logger.debug(f"Making {method} request to: {url}")
+            if 'json' in kwargs:
+                self.logger.debug(f"Request payload: {kwargs['json']}")
             
+        with error_context(endpoint=f"{method} {endpoint}"), profile_span("send"):
+            return self._send(method, url, endpoint, debug, **kwargs)
+
+    def _send(self, method: str, url: str, endpoint: str, debug: bool, **kwargs) -> requests.Response:
+        """Send a request, retrying throttled responses, and map transport errors"""
+        measure = metrics.enabled
+        started = time.perf_counter() if measure else 0.0
+        retry_status_codes = self.RETRY_STATUS_CODES if method != "POST" or endpoint in self.READ_ONLY_POSTS \
+            else self.POST_RETRY_STATUS_CODES
         try:
-            response = self.session.request(method, url, **kwargs)
+            for attempt in range(self.max_retries + 1):
+                rate_limiter.acquire()
+                if attempt and hasattr(kwargs.get("data"), "seek"):
+                    # Streamed bodies (attachment uploads) were consumed by the previous attempt
+                    kwargs["data"].seek(0)
+                if self.cassette is not None:
+                    response = self.cassette.request(self.session, method, url, **kwargs)
+                else:
+                    response = self.session.request(method, url, **kwargs)
+                if response.status_code not in retry_status_codes or attempt == self.max_retries:
+                    break
+                if measure:
+                    metrics.record_retry(method, endpoint, response.status_code)
+                delay = self._retry_delay(response, attempt)
+                if self.cassette is not None and self.cassette.mode == "replay":
+                    # Recorded Retry-After waits follow the replay speed (0 replays instantly)
+                    delay *= self.cassette.timing_scale
+                # Releases the connection of a streamed response that is not read
+                response.close()
+                self.logger.warning(f"{method} {endpoint} returned {response.status_code}, retrying in {delay:.1f}s")
+                time.sleep(delay)
+            
+            if measure:
+                self._record_metrics(method, endpoint, response, time.perf_counter() - started,
+                                    streamed=bool(kwargs.get("stream")))
             
             # Log response details
-            self.logger.debug(f"Response status: {response.status_code}")
-            self.logger.debug(f"Response headers: {dict(response.headers)}")
-            self.logger.debug(f"Response content: {response.text}")
+            if debug:
+                self.logger.debug(f"Response status: {response.status_code}")
+                self.logger.debug(f"Response headers: {dict(response.headers)}")
+                if not kwargs.get("stream"):
+                    self.logger.debug(f"Response content: {response.text}")
             
             if response.status_code == 400:
                 error_details = response.json() if response.text else {}
@@ -66,6 +163,8 @@ class JiraConnectHandler:
             return response
             
         except requests.exceptions.RequestException as e:
+            if measure:
+                metrics.record_request(method, endpoint, None, time.perf_counter() - started)
             error_message = f"API request failed: {str(e)}"
             if hasattr(e, 'response') and e.response is not None:
                 error_message += f"\nResponse: {e.response.text}"
@@ -78,6 +177,29 @@ class JiraConnectHandler:
                 {"file": "jira_api", "endpoint": endpoint}
             )
 
+    @staticmethod
+    def _record_metrics(method: str, endpoint: str, response: requests.Response, seconds: float,
+                        streamed: bool = False) -> None:
+        """Record latency, status and payload sizes of a completed request"""
+        body = response.request.body if response.request is not None else None
+        bytes_out = len(body) if body is not None and hasattr(body, "__len__") else 0
+        content_length = response.headers.get("Content-Length")
+        if content_length and content_length.isdigit():
+            bytes_in = int(content_length)
+        else:
+            # A streamed body is read later by the caller, so its size is unknown here
+            bytes_in = 0 if streamed else len(response.content)
+        metrics.record_request(method, endpoint, response.status_code, seconds, bytes_in, bytes_out)
+
+    @staticmethod
+    def _retry_delay(response: requests.Response, attempt: int) -> float:
+        """Seconds to wait before retrying, honoring the Retry-After header"""
+        retry_after = response.headers.get("Retry-After")
+        try:
+            return max(float(retry_after), 0.0)
+        except (TypeError, ValueError):
+            return min(2 ** attempt, 30)
+
     def test_connection(self) -> bool:
         """Test the connection to Jira"""
         try:
@@ -87,23 +209,31 @@ class JiraConnectHandler:
             self.logger.error(f"Connection test failed: {str(e)}")
             return False
 
-    def get_project(self, project_key: str) -> Optional[Dict[str, Any]]:
-        """Get project information"""
+    def _fetch_project_snapshot(self, project_key: str) -> Optional[ProjectSnapshot]:
+        """Fetch project/{key} once with every expand option the handlers need"""
+        response = self._make_request("GET", f"project/{project_key}", params={"expand": ProjectSnapshot.EXPAND})
+        return ProjectSnapshot.from_response(response.json()) if response.status_code == 200 else None
+
+    def get_project_snapshot(self, project_key: str, refresh: bool = False) -> Optional[ProjectSnapshot]:
+        """Get the shared, memoized snapshot of a project"""
         try:
-            response = self._make_request("GET", f"project/{project_key}")
-            return response.json() if response.status_code == 200 else None
+            return project_snapshot_cache.get(project_key, self._fetch_project_snapshot, refresh=refresh)
         except Exception as e:
-            self.logger.error(f"Failed to get project {project_key}: {str(e)}")
+            self.logger.error(f"Failed to get project snapshot for {project_key}: {str(e)}")
             return None
 
+    def invalidate_project_snapshot(self, project_key: Optional[str] = None) -> None:
+        """Force the next project lookup to hit the API again"""
+        project_snapshot_cache.invalidate(project_key)
+
+    def get_project(self, project_key: str) -> Optional[Dict[str, Any]]:
+        """Get project information"""
+        snapshot = self.get_project_snapshot(project_key)
+        return snapshot.to_dict() if snapshot else None
+
     def get_project_details(self, project_key: str) -> Optional[Dict[str, Any]]:
         """Get detailed information about a specific project"""
-        try:
-            response = self._make_request("GET", f"project/{project_key}")
-            return response.json() if response.status_code == 200 else None
-        except Exception as e:
-            self.logger.error(f"Failed to get project details for {project_key}: {str(e)}")
-            return None
+        return self.get_project(project_key)
 
     def get_create_meta(self, project_key: str, issue_type_name: str) -> Optional[Dict[str, Any]]:
         """Get create metadata for a specific project and issue type"""
@@ -229,10 +359,8 @@ class JiraConnectHandler:
     def get_issue_types(self, project_key: str) -> List[Dict[str, Any]]:
         """Get all issue types available for a project"""
         try:
-            project_data = self.get_project(project_key)
-            if project_data and "issueTypes" in project_data:
-                return project_data["issueTypes"]
-            return []
+            snapshot = self.get_project_snapshot(project_key)
+            return snapshot.issue_type_list() if snapshot else []
         except Exception as e:
             self.logger.error(f"Failed to get issue types: {str(e)}")
             return []
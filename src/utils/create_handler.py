@@ -1,27 +1,45 @@
 import os
-import yaml
-import json
-from datetime import datetime, timedelta
+from datetime import datetime
+from concurrent.futures import Future
 from typing import Dict, List, Any, Optional, Tuple
 import logging
-import pandas as pd
+import uuid
 
 from .auth_handler import JiraAuthHandler
 from .connect_handler import JiraConnectHandler
-from .error_handler import error_handler, JiraError, JiraDataError, JiraAPIError
+from .error_handler import error_handler, error_context, JiraError, JiraDataError, JiraAPIError
 from .get_handler import JiraGetHandler
+from .json_handler import JsonHandler
 from .validate_handler import JiraValidateHandler
+from .user_handler import JiraUserHandler
+from .profile_handler import profile_span
+
+CREATION_JOURNAL = "creation_journal.jsonl"
+# Compacted after this many appends, keeping the latest event per issue key
+JOURNAL_COMPACT_EVERY = 1000
 
 
 class JiraCreateHandler:
     """Handler class for creating Jira issues from YAML files"""
     
-    def __init__(self):
-        """Initialize the handler with authentication and connection handlers"""
+    def __init__(self, connect_handler: Optional[JiraConnectHandler] = None,
+                 get_handler: Optional[JiraGetHandler] = None,
+                 user_handler: Optional[JiraUserHandler] = None):
+        """Initialize the handler with authentication and connection handlers
+        
+        Args:
+            connect_handler: Optional shared transport (e.g. across batch upload workers)
+            get_handler: Optional shared get handler
+            user_handler: Optional shared user directory
+        """
         self.auth_handler = JiraAuthHandler()
-        self.connect_handler = JiraConnectHandler()
-        self.get_handler = JiraGetHandler()
-        self.validate_handler = JiraValidateHandler(self.connect_handler)
+        
+        # Collaborating handlers are built on first use unless injected
+        self._connect_handler = connect_handler
+        self._get_handler = get_handler
+        self._validate_handler: Optional[JiraValidateHandler] = None
+        self._user_handler = user_handler
+        self._creation_log = None
         
         # Setup logging
         logging.basicConfig(level=logging.INFO)
@@ -39,11 +57,70 @@ class JiraCreateHandler:
             "tasks": {},   # Mapping task summary to task key
             "subtasks": {} # Mapping subtask summary to subtask key
         }
+        
+        # Assignee identifier -> accountId, resolved in bulk before creation
+        self.assignee_map: Dict[str, Optional[str]] = {}
+        
+        self.run_id: Optional[str] = None
+        
+        # Issue key -> "Epic / Task / Subtask" summary path, used in error records
+        self._issue_paths: Dict[str, str] = {}
+        
+        # Attachment uploads of created issues, running while creation continues
+        self._attachment_handler = None
+        self._attachment_uploads: List[Future] = []
+        self._yaml_dir = "."
+
+    @property
+    def connect_handler(self) -> JiraConnectHandler:
+        if self._connect_handler is None:
+            self._connect_handler = JiraConnectHandler()
+        return self._connect_handler
+
+    @property
+    def get_handler(self) -> JiraGetHandler:
+        if self._get_handler is None:
+            self._get_handler = JiraGetHandler(connect_handler=self.connect_handler)
+        return self._get_handler
+
+    @property
+    def validate_handler(self) -> JiraValidateHandler:
+        if self._validate_handler is None:
+            self._validate_handler = JiraValidateHandler(self.connect_handler)
+        return self._validate_handler
+
+    @property
+    def user_handler(self) -> JiraUserHandler:
+        if self._user_handler is None:
+            self._user_handler = JiraUserHandler(self.connect_handler)
+        return self._user_handler
+
+    @property
+    def attachment_handler(self):
+        if self._attachment_handler is None:
+            from .attachment_handler import JiraAttachmentHandler
+            self._attachment_handler = JiraAttachmentHandler(self.connect_handler)
+        return self._attachment_handler
 
-    def load_yaml_file(self, filepath: str) -> Dict[str, Any]:
-        """Load and parse a YAML file"""
+    @property
+    def creation_log(self):
+        """Append-only journal of creation results, shared by every upload run"""
+        if self._creation_log is None:
+            self._creation_log = JsonHandler().open_log(CREATION_JOURNAL, key_field="key",
+                                                        compact_every=JOURNAL_COMPACT_EVERY)
+        return self._creation_log
+
+    def load_yaml_file(self, filepath: str, adopt_project: bool = True) -> Dict[str, Any]:
+        """Load and parse a YAML file
+        
+        Args:
+            filepath: Path to the roadmap YAML file
+            adopt_project: Use the file's project as this handler's project key when none is set
+        """
+        import yaml
+        
         try:
-            with open(filepath, 'r', encoding='utf-8') as file:
+            with profile_span("load"), open(filepath, 'r', encoding='utf-8') as file:
                 data = yaml.safe_load(file)
                 
             if not data:
@@ -52,11 +129,12 @@ class JiraCreateHandler:
                                     {"file": "yaml_parser"})
                 
             # Set project key from YAML if not set in environment
-            if "project" in data and not self.project_key:
+            if adopt_project and "project" in data and not self.project_key:
                 self.project_key = data["project"]
                 
             # Validate the structure
-            self.validate_handler._validate_yaml_structure(data)
+            with profile_span("validate"):
+                self.validate_handler._validate_yaml_structure(data)
                 
             return data
         except yaml.YAMLError as e:
@@ -67,7 +145,22 @@ class JiraCreateHandler:
             self.logger.error(f"Error loading YAML file: {str(e)}")
             raise
             
-    def _process_issue_response(self, response: Any, summary: str, hierarchy_level: int, is_cleaned: bool = False) -> Tuple[Optional[str], Optional[str]]:
+    def _journal(self, event: str, summary: str, hierarchy_level: int, parent_key: Optional[str] = None,
+                 **extra: Any) -> None:
+        """Append a creation event to the journal (flushed per batch)"""
+        self.creation_log.append({
+            "event": event,
+            "run_id": self.run_id,
+            "project": self.project_key,
+            "summary": summary,
+            "hierarchy_level": hierarchy_level,
+            "parent": parent_key,
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+            **extra
+        })
+
+    def _process_issue_response(self, response: Any, summary: str, hierarchy_level: int, is_cleaned: bool = False,
+                                parent_key: Optional[str] = None) -> Tuple[Optional[str], Optional[str]]:
         """Process the issue creation response and store the results
         
         Args:
@@ -75,6 +168,7 @@ class JiraCreateHandler:
             summary: Issue summary
             hierarchy_level: Hierarchy level of the issue
             is_cleaned: Whether this was created with cleaned fields
+            parent_key: Parent issue key, recorded in the creation journal
             
         Returns:
             Tuple of (issue_id, issue_key) or (None, None) if processing fails
@@ -94,7 +188,10 @@ class JiraCreateHandler:
                 self.created_issues["tasks"][summary] = issue_key
             elif hierarchy_level == -1:
                 self.created_issues["subtasks"][summary] = issue_key
-                
+            
+            self._journal("created", summary, hierarchy_level, parent_key, key=issue_key, id=issue_id)
+            if self._get_handler is not None:
+                self._get_handler.record_created_issue(issue_key, summary, hierarchy_level, parent_key)
             return issue_id, issue_key
             
         return None, None
@@ -138,7 +235,11 @@ class JiraCreateHandler:
             elif key == "labels":
                 fields["labels"] = value if isinstance(value, list) else [value]
             elif key == "assignee":
-                fields["assignee"] = {"accountId": value} if '@' in value else {"name": value}
+                account_id = self._resolve_assignee(value)
+                if account_id:
+                    fields["assignee"] = {"accountId": account_id}
+                else:
+                    self.logger.warning(f"Leaving '{summary}' unassigned: no accountId for '{value}'")
             elif key == "duedate":
                 fields["duedate"] = value
             elif key.startswith("customfield_"):
@@ -148,12 +249,40 @@ class JiraCreateHandler:
             
         return fields
 
-    def _retry_with_cleaned_fields(self, fields: Dict[str, Any], summary: str, hierarchy_level: int) -> Tuple[Optional[str], Optional[str]]:
+    def _attachment_paths(self, task_data: Dict[str, Any]) -> List[str]:
+        """Paths listed under an item's attachments, relative ones resolved against the YAML file"""
+        value = task_data.get("attachments") or []
+        return [os.path.join(self._yaml_dir, os.path.expanduser(str(path)))
+                for path in (value if isinstance(value, list) else [value])]
+
+    def _queue_attachments(self, issue_key: str, task_data: Dict[str, Any]) -> None:
+        """Start uploading an item's attachments to its newly created issue"""
+        for path in self._attachment_paths(task_data):
+            self._attachment_uploads.append(self.attachment_handler.submit(issue_key, path))
+
+    def _collect_attachments(self) -> Dict[str, Any]:
+        """Wait for the queued attachment uploads and summarize them"""
+        from .attachment_handler import summarize_uploads
+        uploads, self._attachment_uploads = self._attachment_uploads, []
+        return summarize_uploads([future.result() for future in uploads])
+
+    def _resolve_assignee(self, value: Any) -> Optional[str]:
+        """Get the accountId for an assignee value, falling back to a single lookup"""
+        identifier = str(value).strip()
+        if identifier in self.assignee_map:
+            return self.assignee_map[identifier]
+        account_id = self.user_handler.get_account_id(identifier)
+        self.assignee_map[identifier] = account_id
+        return account_id
+
+    def _retry_with_cleaned_fields(self, fields: Dict[str, Any], summary: str, hierarchy_level: int,
+                                   parent_key: Optional[str] = None) -> Tuple[Optional[str], Optional[str]]:
         """Retry issue creation with cleaned fields after initial failure
         Args:
             fields: Original fields that failed
             summary: Issue summary
             hierarchy_level: Hierarchy level of the issue
+            parent_key: Parent issue key, recorded in the creation journal
         Returns:
             Tuple of (issue_id, issue_key) or (None, None) if retry fails
         """
@@ -167,14 +296,37 @@ class JiraCreateHandler:
             if response.status_code != 201:
                 self.logger.error(f"Failed to create issue with cleaned fields: {response.status_code}")
                 self.logger.error(f"Response: {response.text}")
+                self._journal("failed", summary, hierarchy_level, parent_key, status_code=response.status_code)
                 return None, None
             else:
-                return self._process_issue_response(response, summary, hierarchy_level, is_cleaned=True)
+                return self._process_issue_response(response, summary, hierarchy_level, is_cleaned=True,
+                                                    parent_key=parent_key)
             
         except Exception as retry_error:
             self.logger.error(f"Error during retry attempt: {str(retry_error)}")
+            self._journal("failed", summary, hierarchy_level, parent_key, error=str(retry_error))
             return None, None
 
+    @error_handler
+    def create_component(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Create a project component (used by project reconciliation)"""
+        payload = {"project": self.project_key, **data}
+        response = self.connect_handler._make_request("POST", "component", json=payload)
+        if response.status_code != 201:
+            raise JiraAPIError(f"Failed to create component {data.get('name')}: {response.status_code}",
+                               str(response.status_code), {"response": response.text})
+        return response.json()
+
+    @error_handler
+    def create_version(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Create a project version (used by project reconciliation)"""
+        payload = {"project": self.project_key, **data}
+        response = self.connect_handler._make_request("POST", "version", json=payload)
+        if response.status_code != 201:
+            raise JiraAPIError(f"Failed to create version {data.get('name')}: {response.status_code}",
+                               str(response.status_code), {"response": response.text})
+        return response.json()
+
     @error_handler
     def create_hierarchical_task(self, task_data: Dict[str, Any], parent_key: Optional[str] = None, 
                                hierarchy_level: int = 0) -> Tuple[Optional[str], Optional[str]]:
@@ -195,36 +347,57 @@ class JiraCreateHandler:
             self.logger.error("Task must have a summary")
             return None, None
             
-        # Get issue type ID based on hierarchy level
-        issue_type_id = self.get_handler.get_issue_type_by_hierarchy(hierarchy_level)
+        # Get issue type ID based on hierarchy level from this roadmap's project
+        snapshot = self.connect_handler.get_project_snapshot(self.project_key)
+        issue_type = snapshot.issue_type_by_hierarchy(hierarchy_level) if snapshot else None
+        issue_type_id = issue_type.get("id") if issue_type else None
         if not issue_type_id:
             self.logger.error(f"Could not find issue type for hierarchy level {hierarchy_level}")
             return None, None
             
-        # Prepare initial fields
-        fields = self._prepare_issue_fields(summary, description, issue_type_id, task_data, parent_key, hierarchy_level)
-        payload = {"fields": fields}
+        parent_path = self._issue_paths.get(parent_key, parent_key) if parent_key else None
+        hierarchy_path = f"{parent_path} / {summary}" if parent_path else summary
         
-        try:
-            # First attempt with original fields
-            response = self.connect_handler._make_request("POST", "issue", json=payload)
-            result = self._process_issue_response(response, summary, hierarchy_level)
-            if result[0]:
-                return result
+        with error_context(issue=summary, hierarchy_path=hierarchy_path):
+            # Prepare initial fields
+            with profile_span("prepare"):
+                fields = self._prepare_issue_fields(summary, description, issue_type_id, task_data, parent_key, hierarchy_level)
+            payload = {"fields": fields}
+        
+            try:
+                # First attempt with original fields
+                response = self.connect_handler._make_request("POST", "issue", json=payload)
+                result = self._process_issue_response(response, summary, hierarchy_level, parent_key=parent_key)
+                if result[0]:
+                    self._issue_paths[result[1]] = hierarchy_path
+                    self._queue_attachments(result[1], task_data)
+                    return result
                 
-        except JiraAPIError as e:
-            self.logger.warning(f"Initial creation attempt failed: {str(e)}")
-            return self._retry_with_cleaned_fields(fields, summary, hierarchy_level)
+            except JiraAPIError as e:
+                self.logger.warning(f"Initial creation attempt failed: {str(e)}")
+                result = self._retry_with_cleaned_fields(fields, summary, hierarchy_level, parent_key)
+                if result[1]:
+                    self._issue_paths[result[1]] = hierarchy_path
+                    self._queue_attachments(result[1], task_data)
+                return result
             
-        return None, None
+            self._journal("failed", summary, hierarchy_level, parent_key, status_code=response.status_code)
+            return None, None
 
     @error_handler
-    def process_yaml_file(self, yaml_file: str) -> None:
-        """Process a YAML file and create Jira issues with hierarchy"""
+    def process_yaml_file(self, yaml_file: str, data: Optional[Dict[str, Any]] = None) -> None:
+        """Process a YAML file and create Jira issues with hierarchy
+        
+        Args:
+            yaml_file: Path to the roadmap YAML file
+            data: Already parsed (and validated) contents of yaml_file, if available
+        """
         self.logger.info(f"Processing YAML file: {yaml_file}")
         
-        data = self.load_yaml_file(yaml_file)
+        if data is None:
+            data = self.load_yaml_file(yaml_file)
         self.project_key = data.get("project", self.project_key)
+        self._yaml_dir = os.path.dirname(os.path.abspath(yaml_file))
         
         if not self.project_key:
             raise JiraDataError(
@@ -234,8 +407,23 @@ class JiraCreateHandler:
                 {"file": yaml_file}
             )
             
+        # The project snapshot doubles as the connection check
+        with profile_span("validate"):
+            snapshot = self.connect_handler.get_project_snapshot(self.project_key)
+        if snapshot is None:
+            raise JiraError(
+                f"Failed to read project {self.project_key} from Jira",
+                "CONNECTION_ERROR",
+                {"jira_instance": self.connect_handler.base_url, "project_key": self.project_key},
+                {"file": "create_handler"}
+            )
+        
         self.logger.info(f"Creating issues for project: {self.project_key}")
         
+        # Resolve every distinct assignee up front so payloads carry valid accountIds
+        with profile_span("prepare"):
+            self.assignee_map = self.user_handler.resolve_users(self.user_handler.collect_assignees(data))
+        
         # Create epics (hierarchy level 1)
         if "epics" in data:
             for epic_data in data["epics"]:
@@ -274,37 +462,82 @@ class JiraCreateHandler:
                         if not subtask_key:
                             self.logger.warning(f"Failed to create subtask: {subtask_data.get('summary')}")
 
-    def upload_roadmap(self, yaml_file: str) -> Dict[str, Any]:
+    def plan_roadmap(self, yaml_file: str) -> Dict[str, Any]:
+        """Describe what upload_roadmap would create, without creating anything
+        
+        Only the project snapshot is fetched; assignees are checked against the
+        cached user directory without new lookups.
+        """
+        try:
+            data = self.load_yaml_file(yaml_file)
+            project_key = data.get("project", self.project_key)
+            counts = {"epics": 0, "tasks": 0, "subtasks": 0}
+            components, versions = set(), set()
+            attachments: List[str] = []
+            self._yaml_dir = os.path.dirname(os.path.abspath(yaml_file))
+            
+            def walk(items: List[Dict[str, Any]], level: str) -> None:
+                for item in items or []:
+                    counts[level] += 1
+                    attachments.extend(self._attachment_paths(item))
+                    for key, target in (("components", components), ("fixVersions", versions)):
+                        value = item.get(key, [])
+                        target.update(value if isinstance(value, list) else [value])
+                    walk(item.get("tasks", []), "tasks")
+                    walk(item.get("subtasks", []), "subtasks")
+            
+            walk(data.get("epics", []), "epics")
+            walk(data.get("tasks", []), "tasks")
+            
+            assignees = self.user_handler.collect_assignees(data)
+            snapshot = self.connect_handler.get_project_snapshot(project_key)
+            
+            return {
+                "success": snapshot is not None,
+                "project": project_key,
+                "project_found": snapshot is not None,
+                "issues": counts,
+                "total_issues": sum(counts.values()),
+                "components": sorted(components),
+                "missing_components": sorted(components - set(snapshot.component_names)) if snapshot else sorted(components),
+                "versions": sorted(versions),
+                "missing_versions": sorted(versions - set(snapshot.version_names)) if snapshot else sorted(versions),
+                "missing_issue_types": sorted({"Epic", "Task", "Sub-task"} - set(snapshot.issue_type_names)) if snapshot else [],
+                "assignees": assignees,
+                "uncached_assignees": [a for a in assignees if not self.user_handler.cached_account_id(a)],
+                "attachments": len(attachments),
+                "missing_attachments": [path for path in attachments if not os.path.isfile(path)]
+            }
+        except Exception as e:
+            self.logger.error(f"Error planning roadmap: {str(e)}")
+            return {"success": False, "error": str(e), "project": self.project_key, "total_issues": 0}
+
+    def upload_roadmap(self, yaml_file: str, data: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Upload a roadmap from a YAML file to Jira
         
         Args:
             yaml_file: Path to the YAML file containing the roadmap
+            data: Already parsed contents of yaml_file, to skip parsing it again
             
         Returns:
             Dictionary with summary of created issues
         """
+        self.run_id = f"{datetime.now():%Y%m%dT%H%M%S}-{uuid.uuid4().hex[:8]}"
         try:
-            # Check if connection to Jira works
-            if not self.connect_handler.test_connection():
-                raise JiraError(
-                    "Failed to connect to Jira instance",
-                    "CONNECTION_ERROR",
-                    {"jira_instance": self.auth_handler.get_jira_instance()},
-                    {"file": "create_handler"}
-                )
-                
-            # Process the YAML file
-            self.process_yaml_file(yaml_file)
+            # Process the YAML file (connectivity is checked by the first project lookup)
+            self.process_yaml_file(yaml_file, data)
             
             # Return summary
             return {
                 "success": True,
                 "project": self.project_key,
+                "run_id": self.run_id,
                 "created_issues": {
                     "epics": self.created_issues["epics"],
                     "tasks": self.created_issues["tasks"],
                     "subtasks": self.created_issues["subtasks"]
-                }
+                },
+                "attachments": self._collect_attachments()
             }
         except Exception as e:
             self.logger.error(f"Error uploading roadmap: {str(e)}")
@@ -312,8 +545,16 @@ class JiraCreateHandler:
                 "success": False,
                 "error": str(e),
                 "project": self.project_key,
-                "created_issues": self.created_issues
+                "run_id": self.run_id,
+                "created_issues": self.created_issues,
+                "attachments": self._collect_attachments()
             }
+        finally:
+            if self._creation_log is not None:
+                with profile_span("persist"):
+                    self._creation_log.flush()
+            if self._attachment_handler is not None:
+                self._attachment_handler.close()
 
 if __name__ == "__main__":
     # Example usage
@@ -0,0 +1,350 @@
+import os
+import json
+import time
+import uuid
+import queue
+import hmac
+import logging
+import threading
+import itertools
+import contextvars
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, List, Optional
+
+from .error_handler import JiraError
+
+# Job runner: (params, progress) -> result; progress(event_dict) streams an event
+JobRunner = Callable[[Dict[str, Any], Callable[[Dict[str, Any]], None]], Any]
+
+PRIORITIES = {"high": 0, "normal": 5, "low": 9}
+FINISHED_STATES = ("succeeded", "failed", "cancelled")
+# Id of the job being run; pool threads inherit it through ContextThreadPoolExecutor
+_current_job_id: contextvars.ContextVar = contextvars.ContextVar("jira_daemon_job", default=None)
+
+
+class DaemonJob:
+    """One queued job and the progress events it has produced so far"""
+
+    def __init__(self, job_type: str, params: Dict[str, Any], priority: int):
+        self.id = uuid.uuid4().hex[:12]
+        self.type = job_type
+        self.params = params
+        self.priority = priority
+        self.status = "queued"
+        self.result: Any = None
+        self.error: Optional[str] = None
+        self.created_at = time.time()
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+        self.events: List[Dict[str, Any]] = []
+        self._changed = threading.Condition()
+
+    @property
+    def finished(self) -> bool:
+        return self.status in FINISHED_STATES
+
+    def emit(self, event: Dict[str, Any]) -> None:
+        with self._changed:
+            self.events.append({"time": round(time.time(), 3), "job": self.id, **event})
+            self._changed.notify_all()
+
+    def set_status(self, status: str, **fields: Any) -> None:
+        self.status = status
+        self.emit({"event": "status", "status": status, **fields})
+
+    def wait_events(self, start: int, timeout: float = 15.0) -> List[Dict[str, Any]]:
+        """Return events from index start, waiting up to timeout for new ones"""
+        with self._changed:
+            if len(self.events) <= start and not self.finished:
+                self._changed.wait(timeout)
+            return self.events[start:]
+
+    def to_dict(self, include_result: bool = False) -> Dict[str, Any]:
+        data = {
+            "id": self.id,
+            "type": self.type,
+            "priority": self.priority,
+            "status": self.status,
+            "params": self.params,
+            "created_at": self.created_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+            "error": self.error
+        }
+        if include_result:
+            data["result"] = self.result
+        return data
+
+
+class _JobLogHandler(logging.Handler):
+    """Forward log records emitted while running a job (in any of its threads) as progress events"""
+
+    def __init__(self, daemon: "JiraDaemon"):
+        super().__init__(level=logging.INFO)
+        self.daemon = daemon
+
+    def emit(self, record: logging.LogRecord) -> None:
+        job_id = _current_job_id.get()
+        job = self.daemon.jobs.get(job_id) if job_id else None
+        if job is not None:
+            job.emit({"event": "log", "level": record.levelname, "message": record.getMessage()})
+
+
+class JiraDaemon:
+    """Long-running job server that keeps handlers and caches warm between jobs
+
+    Jobs are submitted over a local HTTP endpoint, queued by priority and run
+    by a small worker pool against the same runners (and so the same
+    transport pool, project snapshots and user directory) every time.
+
+    Endpoints:
+        POST   /jobs              {"type": ..., "params": {...}, "priority": "high"|"normal"|"low"|int}
+        GET    /jobs              list jobs
+        GET    /jobs/{id}         job status and result
+        GET    /jobs/{id}/events  NDJSON progress stream until the job finishes
+        DELETE /jobs/{id}         cancel a queued job
+        GET    /health            queue depth and uptime
+        POST   /shutdown          stop after the running jobs
+    """
+
+    MAX_FINISHED_JOBS = 500
+
+    def __init__(self, runners: Dict[str, JobRunner], host: str = "127.0.0.1", port: int = 8765,
+                 workers: int = 1, token: Optional[str] = None):
+        self.runners = runners
+        self.host = host
+        self.port = port
+        self.workers = max(1, workers)
+        # Optional shared secret checked against the X-Daemon-Token header
+        self.token = token if token is not None else os.getenv("JIRA_DAEMON_TOKEN") or None
+        self.logger = logging.getLogger(__name__)
+
+        self.jobs: Dict[str, DaemonJob] = {}
+        self._queue: "queue.PriorityQueue" = queue.PriorityQueue()
+        self._sequence = itertools.count()
+        # Guards the job table and the queued -> running/cancelled transitions
+        self._lock = threading.Lock()
+        self._stopping = threading.Event()
+        self._threads: List[threading.Thread] = []
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._log_handler = _JobLogHandler(self)
+        self.started_at = time.time()
+
+    def submit(self, job_type: str, params: Optional[Dict[str, Any]] = None, priority: Any = "normal") -> DaemonJob:
+        """Queue a job; lower priority numbers run first, FIFO within a priority"""
+        if job_type not in self.runners:
+            raise JiraError(
+                f"Unknown job type: {job_type}",
+                "INVALID_JOB",
+                {"job_type": job_type, "supported": sorted(self.runners)},
+                {"file": "daemon_handler"}
+            )
+        if isinstance(priority, str):
+            if priority not in PRIORITIES:
+                raise JiraError(f"Unknown priority: {priority}", "INVALID_JOB",
+                                {"priority": priority, "supported": list(PRIORITIES)}, {"file": "daemon_handler"})
+            priority = PRIORITIES[priority]
+
+        job = DaemonJob(job_type, params or {}, int(priority))
+        with self._lock:
+            self.jobs[job.id] = job
+            self._prune()
+        job.set_status("queued")
+        self._queue.put((job.priority, next(self._sequence), job.id))
+        return job
+
+    def cancel(self, job_id: str) -> bool:
+        """Cancel a job that has not started yet"""
+        with self._lock:
+            job = self.jobs.get(job_id)
+            if job is None or job.status != "queued":
+                return False
+            job.finished_at = time.time()
+            job.set_status("cancelled")
+        return True
+
+    def _prune(self) -> None:
+        """Forget the oldest finished jobs beyond MAX_FINISHED_JOBS"""
+        finished = [job for job in self.jobs.values() if job.finished]
+        for job in finished[:max(0, len(finished) - self.MAX_FINISHED_JOBS)]:
+            del self.jobs[job.id]
+
+    def _worker(self) -> None:
+        while not self._stopping.is_set():
+            try:
+                _, _, job_id = self._queue.get(timeout=0.5)
+            except queue.Empty:
+                continue
+            with self._lock:
+                job = self.jobs.get(job_id)
+                if job is None or job.status != "queued":
+                    continue
+                job.started_at = time.time()
+                job.set_status("running")
+
+            token = _current_job_id.set(job.id)
+            try:
+                job.result = self.runners[job.type](job.params, job.emit)
+                job.finished_at = time.time()
+                job.set_status("succeeded", elapsed_seconds=round(job.finished_at - job.started_at, 3))
+            except Exception as e:
+                job.error = str(e)
+                job.finished_at = time.time()
+                self.logger.error(f"Job {job.id} ({job.type}) failed: {job.error}")
+                job.set_status("failed", error=job.error)
+            finally:
+                _current_job_id.reset(token)
+
+    def health(self) -> Dict[str, Any]:
+        statuses: Dict[str, int] = {}
+        for job in list(self.jobs.values()):
+            statuses[job.status] = statuses.get(job.status, 0) + 1
+        return {
+            "status": "stopping" if self._stopping.is_set() else "ok",
+            "uptime_seconds": round(time.time() - self.started_at, 1),
+            "workers": self.workers,
+            "job_types": sorted(self.runners),
+            "jobs": statuses
+        }
+
+    def start(self) -> "JiraDaemon":
+        """Start the worker threads and the HTTP server (in a background thread)"""
+        logging.getLogger().addHandler(self._log_handler)
+        for i in range(self.workers):
+            thread = threading.Thread(target=self._worker, name=f"jira-daemon-worker-{i}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+        self._server = ThreadingHTTPServer((self.host, self.port), _make_request_handler(self))
+        self._server.daemon_threads = True
+        self.port = self._server.server_address[1]
+        threading.Thread(target=self._server.serve_forever, name="jira-daemon-http", daemon=True).start()
+        self.logger.info(f"Jira daemon listening on http://{self.host}:{self.port} with {self.workers} workers")
+        return self
+
+    def serve_forever(self) -> None:
+        """Run until shutdown() is called or the process is interrupted"""
+        if self._server is None:
+            self.start()
+        try:
+            while not self._stopping.wait(0.5):
+                pass
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self.shutdown()
+
+    def shutdown(self) -> None:
+        """Stop accepting jobs, let running jobs finish and close the server"""
+        self._stopping.set()
+        for thread in self._threads:
+            thread.join()
+        self._threads = []
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+        logging.getLogger().removeHandler(self._log_handler)
+
+
+def _make_request_handler(daemon: JiraDaemon):
+    class DaemonRequestHandler(BaseHTTPRequestHandler):
+        server_version = "JiraDaemon/1.0"
+
+        def log_message(self, format: str, *args: Any) -> None:
+            daemon.logger.debug("%s - %s", self.address_string(), format % args)
+
+        def _send_json(self, status: int, body: Any) -> None:
+            payload = json.dumps(body, ensure_ascii=False, default=str).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def _authorized(self) -> bool:
+            if not daemon.token:
+                return True
+            if hmac.compare_digest(self.headers.get("X-Daemon-Token", ""), daemon.token):
+                return True
+            self._send_json(401, {"error": "Missing or invalid X-Daemon-Token"})
+            return False
+
+        def _job_path(self):
+            parts = self.path.split("?", 1)[0].strip("/").split("/")
+            job = daemon.jobs.get(parts[1]) if len(parts) >= 2 and parts[0] == "jobs" else None
+            return parts, job
+
+        def do_GET(self) -> None:
+            if not self._authorized():
+                return
+            parts, job = self._job_path()
+            if parts == ["health"]:
+                self._send_json(200, daemon.health())
+            elif parts == ["jobs"]:
+                self._send_json(200, [j.to_dict() for j in list(daemon.jobs.values())])
+            elif job is None:
+                self._send_json(404, {"error": "Not found"})
+            elif len(parts) == 2:
+                self._send_json(200, job.to_dict(include_result=True))
+            elif len(parts) == 3 and parts[2] == "events":
+                self._stream_events(job)
+            else:
+                self._send_json(404, {"error": "Not found"})
+
+        def _stream_events(self, job: DaemonJob) -> None:
+            """Stream progress as NDJSON; the response ends when the job finishes"""
+            self.send_response(200)
+            self.send_header("Content-Type", "application/x-ndjson")
+            self.send_header("Cache-Control", "no-cache")
+            self.send_header("Connection", "close")
+            self.end_headers()
+            sent = 0
+            try:
+                while True:
+                    events = job.wait_events(sent)
+                    for event in events:
+                        self.wfile.write(json.dumps(event, ensure_ascii=False, default=str).encode("utf-8") + b"\n")
+                    self.wfile.flush()
+                    sent += len(events)
+                    if job.finished and sent >= len(job.events):
+                        break
+            except (BrokenPipeError, ConnectionResetError):
+                pass
+            self.close_connection = True
+
+        def do_POST(self) -> None:
+            if not self._authorized():
+                return
+            parts, _ = self._job_path()
+            if parts == ["shutdown"]:
+                self._send_json(202, {"status": "stopping"})
+                daemon._stopping.set()
+                return
+            if parts != ["jobs"]:
+                self._send_json(404, {"error": "Not found"})
+                return
+            try:
+                length = int(self.headers.get("Content-Length") or 0)
+                body = json.loads(self.rfile.read(length) or b"{}")
+                job = daemon.submit(body.get("type", ""), body.get("params"), body.get("priority", "normal"))
+            except (ValueError, AttributeError) as e:
+                self._send_json(400, {"error": f"Invalid job request: {e}"})
+                return
+            except JiraError as e:
+                self._send_json(400, {"error": e.message, "details": e.details})
+                return
+            self._send_json(202, {"id": job.id, "status": job.status, "events": f"/jobs/{job.id}/events"})
+
+        def do_DELETE(self) -> None:
+            if not self._authorized():
+                return
+            parts, job = self._job_path()
+            if job is None or len(parts) != 2:
+                self._send_json(404, {"error": "Not found"})
+            elif daemon.cancel(job.id):
+                self._send_json(200, job.to_dict())
+            else:
+                self._send_json(409, {"error": f"Job is {job.status} and can no longer be cancelled"})
+
+    return DaemonRequestHandler
@@ -1,10 +1,20 @@
 import json
+import queue
+import atexit
 import logging
-from typing import Optional, Dict, Any
+import threading
+import contextvars
+from contextlib import contextmanager
+from concurrent.futures import Future, ThreadPoolExecutor
+from logging.handlers import QueueHandler, QueueListener
+from typing import Optional, Dict, Any, Callable, Iterator
 from functools import wraps
+from pathlib import Path
 import traceback
 import os
 
+from .metrics_handler import metrics
+
 class JiraError(Exception):
     """Base exception class for Jira API errors"""
     def __init__(self, message: str, error_code: Optional[str] = None, details: Optional[Dict] = None, location: Optional[Dict] = None):
@@ -26,29 +36,157 @@ class JiraFileError(JiraError):
     """Exception for file operation errors"""
     pass
 
+# Relative log paths resolve against the repository root, not the working directory
+PACKAGE_ROOT = Path(__file__).resolve().parents[2]
+DEFAULT_LOG_FILE = "logs/jira_errors.log"
+
+# Context attached to every log record: endpoint, issue and hierarchy path
+_error_context: contextvars.ContextVar = contextvars.ContextVar("jira_error_context", default={})
+CONTEXT_FIELDS = ("endpoint", "issue", "hierarchy_path")
+
+
+@contextmanager
+def error_context(**fields: Any) -> Iterator[None]:
+    """Attach endpoint / issue / hierarchy_path to errors logged inside the block"""
+    context = {**_error_context.get(), **{k: v for k, v in fields.items() if v is not None}}
+    token = _error_context.set(context)
+    try:
+        yield
+    except Exception as e:
+        # Keep the innermost context on the exception so outer handlers can report it
+        if not hasattr(e, "jira_context"):
+            try:
+                e.jira_context = context
+            except AttributeError:
+                pass
+        raise
+    finally:
+        _error_context.reset(token)
+
+
+def current_error_context() -> Dict[str, Any]:
+    return dict(_error_context.get())
+
+
+class ContextThreadPoolExecutor(ThreadPoolExecutor):
+    """ThreadPoolExecutor running each task in a copy of the submitter's context
+
+    Pool threads otherwise start with an empty context, losing the error
+    context and the daemon job that log records are forwarded to.
+    """
+
+    def submit(self, fn: Callable[..., Any], /, *args: Any, **kwargs: Any) -> Future:
+        return super().submit(contextvars.copy_context().run, fn, *args, **kwargs)
+
+
+class _ContextFilter(logging.Filter):
+    """Copy the current error context onto the record in the calling thread"""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        for key, value in _error_context.get().items():
+            if not hasattr(record, key):
+                setattr(record, key, value)
+        return True
+
+
+class _InProcessQueueHandler(QueueHandler):
+    """QueueHandler that defers all formatting to the listener thread
+
+    The default prepare() formats the message and traceback in the caller;
+    records never leave the process here, so they are queued as-is.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+class StructuredFormatter(logging.Formatter):
+    """One JSON object per record, including context fields and traceback"""
+
+    EXTRA_FIELDS = CONTEXT_FIELDS + ("error_code", "error_type", "function", "source")
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "time": self.formatTime(record),
+            "logger": record.name,
+            "level": record.levelname,
+            "message": record.getMessage()
+        }
+        for field in self.EXTRA_FIELDS:
+            value = getattr(record, field, None)
+            if value is not None:
+                entry[field] = value
+        text = getattr(record, "traceback_text", None)
+        if text is not None:
+            entry["traceback"] = text
+        elif record.exc_info:
+            entry["traceback"] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+class ContextFormatter(logging.Formatter):
+    """Human-readable formatter that appends context fields without tracebacks"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        message = f"{self.formatTime(record)} - {record.name} - {record.levelname} - {record.getMessage()}"
+        context = [f"{field}={getattr(record, field)}" for field in CONTEXT_FIELDS if getattr(record, field, None)]
+        return f"{message} [{', '.join(context)}]" if context else message
+
+
 class ErrorHandler:
-    def __init__(self, log_file: str = "logs/jira_errors.log"):
-        """Initialize error handler with logging configuration"""
+    """Process-wide error and log pipeline
+
+    ErrorHandler() always returns the same instance. Records go through a
+    QueueHandler to a background QueueListener that owns the file and
+    console handlers, so log I/O and record formatting happen off the hot
+    path and handlers are attached exactly once.
+    """
+
+    _instance: Optional["ErrorHandler"] = None
+    _instance_lock = threading.Lock()
+
+    def __new__(cls, log_file: str = DEFAULT_LOG_FILE):
+        with cls._instance_lock:
+            if cls._instance is None:
+                instance = super().__new__(cls)
+                instance._setup(log_file)
+                cls._instance = instance
+        return cls._instance
+
+    def __init__(self, log_file: str = DEFAULT_LOG_FILE):
+        """Initialization happens once in _setup; repeated construction is free"""
+
+    def _setup(self, log_file: str) -> None:
+        """Initialize error handler with queue-based logging configuration"""
         self.logger = logging.getLogger("jira_api")
         self.logger.setLevel(logging.DEBUG)
         
-        # File handler
-        file_handler = logging.FileHandler(log_file)
+        # File handler (structured JSON lines)
+        log_file = PACKAGE_ROOT / log_file
+        log_file.parent.mkdir(parents=True, exist_ok=True)
+        file_handler = logging.FileHandler(log_file, encoding="utf-8")
         file_handler.setLevel(logging.DEBUG)
+        file_handler.setFormatter(StructuredFormatter())
         
         # Console handler
         console_handler = logging.StreamHandler()
         console_handler.setLevel(logging.ERROR)
+        console_handler.setFormatter(ContextFormatter())
         
-        # Formatter
-        formatter = logging.Formatter(
-            '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-        )
-        file_handler.setFormatter(formatter)
-        console_handler.setFormatter(formatter)
+        self._queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+        queue_handler = _InProcessQueueHandler(self._queue)
+        queue_handler.addFilter(_ContextFilter())
+        self.logger.addHandler(queue_handler)
         
-        self.logger.addHandler(file_handler)
-        self.logger.addHandler(console_handler)
+        self._listener = QueueListener(self._queue, file_handler, console_handler, respect_handler_level=True)
+        self._listener.start()
+        atexit.register(self.shutdown)
+
+    def shutdown(self) -> None:
+        """Flush queued records and stop the listener thread"""
+        if self._listener is not None:
+            self._listener.stop()
+            self._listener = None
 
     def handle_api_error(self, response) -> None:
         """Handle API response errors"""
@@ -118,10 +256,16 @@ def error_handler(func):
     def wrapper(*args, **kwargs):
         try:
             return func(*args, **kwargs)
-        except JiraError:
+        except JiraError as e:
+            # Count each error once, where it first surfaces, not at every decorated frame
+            if metrics.enabled and not getattr(e, "_metrics_recorded", False):
+                metrics.record_error(func.__qualname__, e.error_code or type(e).__name__)
+                e._metrics_recorded = True
             # Re-raise Jira-specific errors
             raise
         except json.JSONDecodeError as e:
+            if metrics.enabled:
+                metrics.record_error(func.__qualname__, "JSON_PARSE_ERROR")
             # Handle JSON parsing errors
             file_path = kwargs.get('json_file', 'unknown_file')
             if not os.path.isabs(file_path):
@@ -149,9 +293,25 @@ def error_handler(func):
                 f"Error: {str(e)}"
             )
 
-            ErrorHandler().logger.error(f"{error_message}\n{traceback.format_exc()}")
-            raise JiraError(error_message, "UNEXPECTED_ERROR", {
+            if metrics.enabled:
+                metrics.record_error(func.__qualname__, type(e).__name__)
+            
+            # Formatted once, here: a string shared by the log record and the error keeps no frames alive
+            traceback_text = "".join(traceback.format_exception(type(e), e, e.__traceback__))
+            context = {**current_error_context(), **getattr(e, "jira_context", {})}
+            ErrorHandler().logger.error(error_message, extra={
+                **context,
+                "traceback_text": traceback_text,
+                "error_code": "UNEXPECTED_ERROR",
+                "error_type": type(e).__name__,
+                "function": func.__qualname__,
+                "source": f"{location['file']}:{location['line_number']}"
+            })
+            error = JiraError(error_message, "UNEXPECTED_ERROR", {
                 "error_type": type(e).__name__,
-                "traceback": traceback.format_exc()
+                "traceback": traceback_text,
+                **context
             }, location)
+            error._metrics_recorded = True
+            raise error
     return wrapper
@@ -0,0 +1,151 @@
+import logging
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+import pandas as pd
+
+from .error_handler import error_handler, JiraError
+
+
+def _require_pyarrow():
+    """Import pyarrow lazily; it is only needed for columnar export"""
+    try:
+        import pyarrow as pa
+        import pyarrow.dataset as ds
+        return pa, ds
+    except ImportError:
+        raise JiraError(
+            "Columnar export requires the 'pyarrow' package (pip install pyarrow)",
+            "MISSING_DEPENDENCY",
+            {"dependency": "pyarrow"},
+            {"file": "export_handler"}
+        )
+
+
+class JiraExportHandler:
+    """Columnar (Parquet / Arrow IPC) export of synced work items for analytics
+
+    Hot fields are flattened into one row per issue, low-cardinality columns
+    are dictionary-encoded, and the dataset is partitioned by project and
+    created month so reports can read back only the columns they chart.
+    """
+
+    FORMATS = {"parquet": "parquet", "arrow": "ipc", "ipc": "ipc"}
+    PARTITION_COLUMNS = ["project", "month"]
+    CATEGORY_COLUMNS = ["issue_type", "status", "status_category", "priority", "assignee", "assignee_id", "reporter"]
+    LIST_COLUMNS = ["labels", "components", "fix_versions"]
+    DATE_COLUMNS = ["created", "updated", "resolutiondate", "duedate"]
+
+    def __init__(self, base_dir: str = "data/analytics", fmt: str = "parquet"):
+        if fmt not in self.FORMATS:
+            raise JiraError(f"Unsupported export format: {fmt}", "INVALID_FORMAT",
+                            {"format": fmt, "supported": list(self.FORMATS)}, {"file": "export_handler"})
+        self.base_dir = Path(base_dir)
+        self.fmt = fmt
+        self.logger = logging.getLogger(__name__)
+
+    @property
+    def dataset_dir(self) -> Path:
+        return self.base_dir / f"work_items_{self.fmt}"
+
+    @staticmethod
+    def _flatten(issue: Dict[str, Any]) -> Dict[str, Any]:
+        """Flatten the hot fields of one search result issue"""
+        fields = issue.get("fields") or {}
+        status = fields.get("status") or {}
+        assignee = fields.get("assignee") or {}
+        created = fields.get("created") or ""
+        key = issue.get("key", "")
+        return {
+            "key": key,
+            "id": issue.get("id"),
+            "project": (fields.get("project") or {}).get("key") or key.rsplit("-", 1)[0],
+            "month": created[:7] or "unknown",
+            "summary": fields.get("summary"),
+            "issue_type": (fields.get("issuetype") or {}).get("name"),
+            "hierarchy_level": (fields.get("issuetype") or {}).get("hierarchyLevel"),
+            "status": status.get("name"),
+            "status_category": (status.get("statusCategory") or {}).get("key"),
+            "priority": (fields.get("priority") or {}).get("name"),
+            "assignee": assignee.get("displayName"),
+            "assignee_id": assignee.get("accountId"),
+            "reporter": (fields.get("reporter") or {}).get("displayName"),
+            "parent": (fields.get("parent") or {}).get("key"),
+            "labels": list(fields.get("labels") or []),
+            "components": [c.get("name") for c in fields.get("components") or []],
+            "fix_versions": [v.get("name") for v in fields.get("fixVersions") or []],
+            "created": created or None,
+            "updated": fields.get("updated"),
+            "resolutiondate": fields.get("resolutiondate"),
+            "duedate": fields.get("duedate")
+        }
+
+    def to_frame(self, issues: Iterable[Dict[str, Any]]) -> pd.DataFrame:
+        """Build a flattened, category-typed DataFrame from search result issues"""
+        frame = pd.DataFrame.from_records([self._flatten(issue) for issue in issues])
+        if frame.empty:
+            return frame
+        for column in self.DATE_COLUMNS:
+            frame[column] = pd.to_datetime(frame[column], utc=True, errors="coerce", format="ISO8601")
+        for column in self.CATEGORY_COLUMNS:
+            frame[column] = frame[column].astype("category")
+        return frame
+
+    @error_handler
+    def export_work_items(self, work_items: Any) -> Path:
+        """Write work items as a dataset partitioned by project and month
+
+        Args:
+            work_items: Search response dict (with "issues") or a list of issues
+
+        Returns:
+            Path of the dataset directory
+        """
+        pa, ds = _require_pyarrow()
+        issues = work_items.get("issues", []) if isinstance(work_items, dict) else work_items
+        frame = self.to_frame(issues)
+        if frame.empty:
+            self.logger.warning("No work items to export")
+            return self.dataset_dir
+
+        table = pa.Table.from_pandas(frame, preserve_index=False)
+        # Dictionary-encode the values of list columns such as labels
+        for column in self.LIST_COLUMNS:
+            index = table.schema.get_field_index(column)
+            values = table.column(column).combine_chunks()
+            if pa.types.is_list(values.type) and pa.types.is_string(values.type.value_type):
+                encoded = pa.ListArray.from_arrays(values.offsets, values.values.dictionary_encode(), mask=values.is_null())
+                table = table.set_column(index, column, encoded)
+
+        ds.write_dataset(
+            table,
+            self.dataset_dir,
+            format=self.FORMATS[self.fmt],
+            partitioning=self.PARTITION_COLUMNS,
+            partitioning_flavor="hive",
+            existing_data_behavior="delete_matching"
+        )
+        self.logger.info(f"Exported {table.num_rows} work items to {self.dataset_dir}")
+        return self.dataset_dir
+
+    @error_handler
+    def load_frame(self, columns: Optional[List[str]] = None, projects: Optional[List[str]] = None,
+                   months: Optional[List[str]] = None) -> pd.DataFrame:
+        """Read back only the requested columns (and partitions) of the export
+
+        Args:
+            columns: Columns to read; None reads every column
+            projects: Only read these project partitions
+            months: Only read these "YYYY-MM" partitions
+        """
+        pa, ds = _require_pyarrow()
+        if not self.dataset_dir.exists():
+            return pd.DataFrame(columns=columns or [])
+
+        dataset = ds.dataset(self.dataset_dir, format=self.FORMATS[self.fmt], partitioning="hive")
+        expression = None
+        for column, values in (("project", projects), ("month", months)):
+            if values:
+                condition = ds.field(column).isin(values)
+                expression = condition if expression is None else expression & condition
+        return dataset.to_table(columns=columns, filter=expression).to_pandas()
@@ -1,14 +1,41 @@
 from .connect_handler import JiraConnectHandler
 from .json_handler import JsonHandler
 from .error_handler import error_handler, JiraError, JiraAPIError
-from typing import Dict, List, Optional, Any
+from .profile_handler import profile_span
+from .hierarchy_index import HierarchyIndex
+from typing import Callable, Dict, List, Optional, Any, Tuple
 import os
+import logging
+import threading
 
 class JiraGetHandler:
-    def __init__(self):
-        self.connect_handler = JiraConnectHandler()
+    # Fields kept per work item; webhook payloads are trimmed to the same set
+    WORK_ITEM_FIELDS = [
+        "summary",
+        "description",
+        "issuetype",
+        "priority",
+        "status",
+        "assignee",
+        "reporter",
+        "labels",
+        "components",
+        "fixVersions",
+        "duedate",
+        "created",
+        "updated",
+        "resolutiondate",
+        "parent",
+        "project",
+        "customfield_10001"  # Epic Name field
+    ]
+    
+    def __init__(self, connect_handler: Optional[JiraConnectHandler] = None):
+        self.connect_handler = connect_handler or JiraConnectHandler()
         self.json_handler = JsonHandler()
         self.project_key = os.getenv("PROJECT_KEY", "NEUN")
+        self.logger = logging.getLogger(__name__)
+        self.page_size = int(os.getenv("JIRA_PAGE_SIZE", "100"))
         
         # Cache for frequently accessed data
         self._cache = {
@@ -20,21 +47,43 @@ class JiraGetHandler:
             'field_map': None,
             'issue_type_map': None
         }
+        
+        # Incremental (webhook) changes not yet written to disk
+        self._lock = threading.RLock()
+        self._flush_lock = threading.Lock()
+        self._dirty: set = set()
+        self._pending_items: Dict[str, Optional[Dict[str, Any]]] = {}
+        self._work_item_index: Optional[Dict[str, int]] = None
+        # Bumped on every change to the work items; keys the memoized report handler
+        self._work_items_version = 0
+        self._report_handler: Optional[Tuple[Any, int, Any]] = None
+        self._hierarchy: Optional[HierarchyIndex] = None
+        self._epic_link_field: Optional[str] = None
+        # Open snapshot reader, reopened only when the file on disk is replaced
+        self._snapshot_lock = threading.Lock()
+        self._snapshot: Optional[Tuple[Tuple[int, int, int], Any]] = None
 
     def clear_cache(self, cache_key: Optional[str] = None) -> None:
         """Clear specific or all cache entries"""
-        if cache_key:
-            if cache_key in self._cache:
-                self._cache[cache_key] = None
-        else:
-            for key in self._cache:
-                self._cache[key] = None
+        with self._lock:
+            if cache_key:
+                if cache_key in self._cache:
+                    self._cache[cache_key] = None
+                    self._dirty.discard(cache_key)
+            else:
+                for key in self._cache:
+                    self._cache[key] = None
+                self._dirty.clear()
+            if cache_key in (None, 'work_items'):
+                self._work_item_index = None
+                self._work_items_version += 1
+                self._hierarchy = None
 
     def get_issue_types(self) -> List[Dict[str, Any]]:
         """Get available issue types for the current project"""
-        project_data = self.connect_handler.get_project(self.project_key)
-        if project_data and "issueTypes" in project_data:
-            return project_data["issueTypes"]
+        snapshot = self.connect_handler.get_project_snapshot(self.project_key)
+        if snapshot:
+            return snapshot.issue_type_list()
         else:
             self.logger.warning(f"Could not retrieve issue types for project {self.project_key}")
             return []
@@ -60,11 +109,9 @@ class JiraGetHandler:
         Returns:
             Issue type ID or None if not found
         """
-        issue_types = self.get_issue_types()
-        for issue_type in issue_types:
-            if issue_type.get("hierarchyLevel") == hierarchy_level:
-                return issue_type.get("id")
-        return None
+        snapshot = self.connect_handler.get_project_snapshot(self.project_key)
+        issue_type = snapshot.issue_type_by_hierarchy(hierarchy_level) if snapshot else None
+        return issue_type.get("id") if issue_type else None
     
     @error_handler
     def get_fields_to_json(self) -> List[Dict]:
@@ -204,41 +251,290 @@ class JiraGetHandler:
         return self._cache['versions']
 
     @error_handler
-    def get_work_items_to_json(self, jql: Optional[str] = None, fields: Optional[List[str]] = None) -> Dict:
-        """Get work items based on JQL"""
+    def get_work_items_to_json(self, jql: Optional[str] = None, fields: Optional[List[str]] = None,
+                               expand: Optional[str] = None) -> Dict:
+        """Get all work items matching JQL, paging through search results
+        
+        Args:
+            expand: Search expand option, e.g. "changelog" for cycle time reports
+        """
         if not jql:
             jql = f'project = {self.project_key} ORDER BY created DESC'
         
-        if not fields:
-            fields = [
-                "summary",
-                "description",
-                "issuetype",
-                "priority",
-                "status",
-                "assignee",
-                "reporter",
-                "labels",
-                "components",
-                "fixVersions",
-                "duedate",
-                "customfield_10001"  # Epic Name field
-            ]
+        fields = fields or self.work_item_fields()
         
-        params = {
-            "jql": jql,
-            "maxResults": 100,
-            "fields": ",".join(fields)
-        }
+        issues: List[Dict[str, Any]] = []
+        page: Dict[str, Any] = {}
+        while True:
+            params = {
+                "jql": jql,
+                "startAt": len(issues),
+                "maxResults": self.page_size,
+                "fields": ",".join(fields)
+            }
+            if expand:
+                params["expand"] = expand
+            
+            response = self.connect_handler._make_request("GET", "search", params=params)
+            if response.status_code != 200:
+                raise JiraAPIError(f"Failed to get work items: {response.status_code}")
+            
+            with profile_span("load"):
+                page = response.json()
+            batch = page.get("issues", [])
+            issues.extend(batch)
+            if not batch or len(issues) >= page.get("total", 0):
+                break
         
-        response = self.connect_handler._make_request("GET", "search", params=params)
-        if response.status_code == 200:
-            work_items = response.json()
-            self.json_handler.save_json(work_items, "work_items.json")
+        work_items = {**page, "startAt": 0, "maxResults": len(issues), "issues": issues}
+        self.json_handler.save_json(work_items, "work_items.json", compact=True)
+        # Indexed copy for single-issue lookups without loading the whole file
+        self.json_handler.write_snapshot(issues, "work_items.snap")
+        with self._lock:
+            # A full fetch supersedes incremental changes received so far
             self._cache['work_items'] = work_items
-            return work_items
+            self._work_item_index = None
+            self._work_items_version += 1
+            self._hierarchy = None
+            self._pending_items.clear()
+            self._dirty.discard('work_items')
+        return work_items
+
+    def apply_work_item(self, issue_key: str, issue: Optional[Dict[str, Any]]) -> None:
+        """Insert or replace (issue) or remove (None) one work item in the local store
+        
+        The change is visible to get_local_issue immediately and written to
+        work_items.json / work_items.snap by flush_local_changes.
+        """
+        with self._lock:
+            work_items = self._cache['work_items']
+            if work_items is None:
+                work_items = self.json_handler.load_json("work_items.json") or \
+                    {"startAt": 0, "maxResults": 0, "total": 0, "issues": []}
+                self._cache['work_items'] = work_items
+            issues = work_items["issues"]
+            if self._work_item_index is None:
+                self._work_item_index = {item.get("key"): i for i, item in enumerate(issues)}
+            position = self._work_item_index.get(issue_key)
+            
+            if issue is not None and position is not None:
+                issues[position] = issue
+            elif issue is not None:
+                # Newest first, matching the default ORDER BY created DESC
+                issues.insert(0, issue)
+                self._work_item_index = None
+            elif position is not None:
+                del issues[position]
+                self._work_item_index = None
+            
+            work_items["total"] = work_items["maxResults"] = len(issues)
+            self._work_items_version += 1
+            self._pending_items[issue_key] = issue
+            if self._hierarchy is not None:
+                if issue is None:
+                    self._hierarchy.remove(issue_key)
+                else:
+                    self._hierarchy.upsert(issue)
+            self._dirty.add('work_items')
+
+    def _indexed_work_items(self) -> Optional[Dict[str, Any]]:
+        """Loaded local work items with the key index built, or None when there are none (lock held)"""
+        work_items = self._cache['work_items'] or self.json_handler.load_json("work_items.json")
+        if not work_items:
+            return None
+        self._cache['work_items'] = work_items
+        if self._work_item_index is None:
+            self._work_item_index = {item.get("key"): i for i, item in enumerate(work_items["issues"])}
+        return work_items
+
+    def patch_work_item(self, issue_key: str, patch: Callable[[Dict[str, Any]], Dict[str, Any]]) -> bool:
+        """Merge changed fields (e.g. after a bulk edit) into a locally stored work item
+        
+        Args:
+            patch: Receives the stored fields and returns the changed ones
+        
+        Returns:
+            False when the issue is not in the local store
+        """
+        with self._lock:
+            work_items = self._indexed_work_items()
+            position = self._work_item_index.get(issue_key) if work_items else None
+            if position is None:
+                return False
+            issue = work_items["issues"][position]
+            fields = issue.get("fields") or {}
+            self.apply_work_item(issue_key, {**issue, "fields": {**fields, **patch(fields)}})
+            return True
+
+    def discard_work_items(self, issue_keys: List[str]) -> int:
+        """Remove deleted issues from the local store in one pass; unknown keys are ignored
+        
+        Returns:
+            Number of work items removed
+        """
+        with self._lock:
+            work_items = self._indexed_work_items()
+            known = {key for key in issue_keys if work_items and key in self._work_item_index}
+            if not known:
+                return 0
+            work_items["issues"] = [item for item in work_items["issues"] if item.get("key") not in known]
+            work_items["total"] = work_items["maxResults"] = len(work_items["issues"])
+            self._work_item_index = None
+            self._work_items_version += 1
+            for key in known:
+                self._pending_items[key] = None
+                if self._hierarchy is not None:
+                    self._hierarchy.remove(key)
+            self._dirty.add('work_items')
+            return len(known)
+
+    def apply_metadata(self, cache_key: str, item_id: str, item: Optional[Dict[str, Any]]) -> bool:
+        """Insert or replace (item) or remove (None) a component or version in its loaded cache
+        
+        Returns:
+            False when the cache is not loaded (the next lookup fetches it fresh anyway)
+        """
+        with self._lock:
+            items = self._cache.get(cache_key)
+            if items is None:
+                return False
+            remaining = [existing for existing in items if str(existing.get("id")) != str(item_id)]
+            if item is not None:
+                position = next((i for i, existing in enumerate(items) if str(existing.get("id")) == str(item_id)),
+                                len(remaining))
+                remaining.insert(position, item)
+            self._cache[cache_key] = remaining
+            self._dirty.add(cache_key)
+            return True
+
+    def flush_local_changes(self) -> List[str]:
+        """Write caches changed by apply_work_item / apply_metadata to disk
+        
+        Returns:
+            Names of the caches written
+        """
+        with self._flush_lock:
+            with self._lock:
+                dirty = sorted(self._dirty)
+                self._dirty.clear()
+                data = {name: self._cache[name] for name in dirty}
+                if 'work_items' in data:
+                    data['work_items'] = {**data['work_items'], "issues": list(data['work_items']["issues"])}
+                pending = dict(self._pending_items)
+            
+            for name, value in data.items():
+                if name == 'work_items':
+                    self.json_handler.save_json(value, "work_items.json", compact=True)
+                    self.json_handler.write_snapshot(value["issues"], "work_items.snap")
+                else:
+                    self.json_handler.save_json(value, f"{name}.json")
+            
+            with self._lock:
+                # Keep overlay entries that changed again while writing
+                for key, issue in pending.items():
+                    if self._pending_items.get(key, issue) is issue:
+                        self._pending_items.pop(key, None)
+            return dirty
+
+    def export_work_items(self, fmt: str = "parquet") -> Any:
+        """Export the fetched work items as a columnar dataset for analytics"""
+        from .export_handler import JiraExportHandler
+        work_items = self._cache['work_items'] or self.json_handler.load_json("work_items.json")
+        if not work_items:
+            work_items = self.get_work_items_to_json()
+        return JiraExportHandler(base_dir=str(self.json_handler.base_dir / "analytics"), fmt=fmt).export_work_items(work_items)
+
+    def load_work_items_frame(self, columns: Optional[List[str]] = None, fmt: str = "parquet", **filters: Any) -> Any:
+        """Load selected columns of the columnar work items export as a DataFrame"""
+        from .export_handler import JiraExportHandler
+        return JiraExportHandler(base_dir=str(self.json_handler.base_dir / "analytics"), fmt=fmt).load_frame(columns, **filters)
+
+    @property
+    def epic_link_field(self) -> Optional[str]:
+        """ID of the Epic Link custom field, from the fetched fields when available"""
+        if self._epic_link_field is None:
+            fields = self._cache['fields'] or self.json_handler.load_json("jira_fields.json")
+            if fields:
+                self._epic_link_field = next((f["id"] for f in fields if f.get("name") == "Epic Link"), "")
+            else:
+                self._epic_link_field = self.connect_handler.find_epic_link_field(self.project_key) or ""
+        return self._epic_link_field or None
+
+    def work_item_fields(self) -> List[str]:
+        """Fields fetched per work item: WORK_ITEM_FIELDS plus the epic link field"""
+        epic_link = self.epic_link_field
+        return self.WORK_ITEM_FIELDS + [epic_link] if epic_link and epic_link not in self.WORK_ITEM_FIELDS \
+            else list(self.WORK_ITEM_FIELDS)
+
+    def get_hierarchy(self) -> HierarchyIndex:
+        """Epic -> task -> subtask index over the fetched work items
+        
+        Built once from the local work items (fetched if there are none) and then
+        kept current by apply_work_item and record_created_issue.
+        """
+        with self._lock:
+            if self._hierarchy is None:
+                work_items = self._cache['work_items'] or self.json_handler.load_json("work_items.json") or \
+                    self.get_work_items_to_json()
+                self._hierarchy = HierarchyIndex.build(work_items.get("issues", []), self.epic_link_field)
+            return self._hierarchy
+
+    def record_created_issue(self, issue_key: str, summary: str, hierarchy_level: int,
+                             parent_key: Optional[str] = None) -> None:
+        """Add an issue created by this process to the hierarchy index, if one is built"""
+        with self._lock:
+            if self._hierarchy is not None:
+                self._hierarchy.add(issue_key, parent_key, summary=summary, level=hierarchy_level,
+                                    status_category="new")
+
+    def get_report(self, sections: Optional[List[str]] = None, days: int = 30, version: Optional[str] = None,
+                   as_of: Optional[Any] = None) -> Dict[str, Any]:
+        """Build the analytics report (see JiraReportHandler) over the fetched work items
+        
+        The flattened frame is kept until the work items change, so repeated
+        reports (e.g. in daemon mode) skip re-reading the issues.
+        """
+        from .report_handler import JiraReportHandler
+        with self._lock:
+            work_items = self._cache['work_items']
+            memo = self._report_handler
+            current = (id(work_items), self._work_items_version)
+        if work_items is not None and memo is not None and memo[:2] == current:
+            handler = memo[2]
         else:
-            raise JiraAPIError(f"Failed to get work items: {response.status_code}")
+            work_items = work_items or self.json_handler.load_json("work_items.json") or self.get_work_items_to_json()
+            handler = JiraReportHandler(work_items)
+            if work_items is self._cache['work_items']:
+                self._report_handler = (*current, handler)
+        return handler.report(sections, days=days, version=version, as_of=as_of)
+
+    def get_local_issue(self, issue_key: str) -> Optional[Dict[str, Any]]:
+        """Look up one issue in the local work items snapshot without hitting the API"""
+        with self._lock:
+            if issue_key in self._pending_items:
+                return self._pending_items[issue_key]
+        with self._snapshot_lock:
+            reader = self._snapshot_reader()
+            return reader.get(issue_key) if reader is not None else None
+
+    def _snapshot_reader(self) -> Optional[Any]:
+        """Return the cached snapshot reader, reopening it if the snapshot changed (caller holds _snapshot_lock)"""
+        try:
+            stat = (self.json_handler.base_dir / "work_items.snap").stat()
+        except FileNotFoundError:
+            stat = None
+        signature = (stat.st_ino, stat.st_mtime_ns, stat.st_size) if stat else None
+        if self._snapshot is not None and self._snapshot[0] == signature:
+            return self._snapshot[1]
+        if self._snapshot is not None:
+            self._snapshot[1].close()
+            self._snapshot = None
+        if signature is None:
+            return None
+        reader = self.json_handler.open_snapshot("work_items.snap")
+        if reader is not None:
+            self._snapshot = (signature, reader)
+        return reader
 
     @error_handler
     def fetch_all_data(self) -> Dict[str, Any]:
@@ -254,7 +550,7 @@ class JiraGetHandler:
         }
         
         # Save combined results
-        self.json_handler.save_json(results, "all_jira_data.json")
+        self.json_handler.save_json(results, "all_jira_data.json", compact=True)
         return results
 
 def main():
@@ -0,0 +1,170 @@
+import threading
+from collections import Counter
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+# Epic -> task -> subtask; deeper chains only come from bad data (or cycles)
+MAX_DEPTH = 8
+
+
+def _hierarchy_level(issuetype: Dict[str, Any]) -> int:
+    """hierarchyLevel of an issue type, placed by name when Jira does not send it"""
+    if issuetype.get("hierarchyLevel") is not None:
+        return int(issuetype["hierarchyLevel"])
+    if issuetype.get("subtask"):
+        return -1
+    name = (issuetype.get("name") or "").lower()
+    return 1 if name == "epic" else -1 if "sub" in name or "하위" in name else 0
+
+
+class HierarchyIndex:
+    """Epic -> task -> subtask tree over fetched issues
+
+    Built in one pass from each issue's parent (or epic link field), it keeps
+    parent pointers and ordered child sets, so children and parent lookups
+    are O(1), ancestors are O(depth) and a subtree costs only its own size.
+    upsert() and remove() keep it valid as single issues change.
+    """
+
+    def __init__(self, epic_link_field: Optional[str] = None):
+        self.epic_link_field = epic_link_field
+        self._lock = threading.RLock()
+        self._nodes: Dict[str, Dict[str, Any]] = {}
+        self._parents: Dict[str, str] = {}
+        # Ordered sets (dict keys): O(1) insert and delete, creation order kept
+        self._children: Dict[str, Dict[str, None]] = {}
+
+    @classmethod
+    def build(cls, issues: Iterable[Dict[str, Any]], epic_link_field: Optional[str] = None) -> "HierarchyIndex":
+        """Index search result issues in a single pass"""
+        index = cls(epic_link_field)
+        for issue in issues:
+            index.upsert(issue)
+        return index
+
+    def _parent_key(self, fields: Dict[str, Any]) -> Optional[str]:
+        parent = (fields.get("parent") or {}).get("key")
+        if parent or not self.epic_link_field:
+            return parent
+        # Classic projects link tasks to epics through a custom field holding the epic key
+        epic = fields.get(self.epic_link_field)
+        return epic.get("key") if isinstance(epic, dict) else epic
+
+    def upsert(self, issue: Dict[str, Any]) -> None:
+        """Add or update one search result issue"""
+        fields = issue.get("fields") or {}
+        issuetype = fields.get("issuetype") or {}
+        status = fields.get("status") or {}
+        self.add(
+            issue["key"],
+            self._parent_key(fields),
+            summary=fields.get("summary"),
+            issue_type=issuetype.get("name"),
+            level=_hierarchy_level(issuetype),
+            status=status.get("name"),
+            status_category=(status.get("statusCategory") or {}).get("key")
+        )
+
+    def add(self, key: str, parent: Optional[str], **node: Any) -> None:
+        """Add or update a node, re-linking it when its parent changed"""
+        with self._lock:
+            previous = self._parents.get(key)
+            if previous != parent:
+                if previous is not None:
+                    siblings = self._children.get(previous)
+                    if siblings is not None:
+                        siblings.pop(key, None)
+                        if not siblings:
+                            del self._children[previous]
+                    del self._parents[key]
+                if parent is not None:
+                    self._parents[key] = parent
+                    self._children.setdefault(parent, {})[key] = None
+            self._nodes[key] = {"key": key, **self._nodes.get(key, {}), **node}
+
+    def remove(self, key: str) -> None:
+        """Drop a node; its children keep pointing at it until they change too"""
+        with self._lock:
+            self._nodes.pop(key, None)
+            parent = self._parents.pop(key, None)
+            if parent is not None:
+                siblings = self._children.get(parent)
+                if siblings is not None:
+                    siblings.pop(key, None)
+                    if not siblings:
+                        del self._children[parent]
+
+    def __len__(self) -> int:
+        return len(self._nodes)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._nodes
+
+    def node(self, key: str) -> Optional[Dict[str, Any]]:
+        return self._nodes.get(key)
+
+    def parent(self, key: str) -> Optional[str]:
+        return self._parents.get(key)
+
+    def children(self, key: str) -> List[str]:
+        return list(self._children.get(key, ()))
+
+    def ancestors(self, key: str) -> List[str]:
+        """Parent, grandparent, ... (nearest first)"""
+        result: List[str] = []
+        current = self._parents.get(key)
+        while current is not None and len(result) < MAX_DEPTH and current != key:
+            result.append(current)
+            current = self._parents.get(current)
+        return result
+
+    def epic_of(self, key: str) -> Optional[str]:
+        """Nearest epic at or above an issue"""
+        for candidate in [key, *self.ancestors(key)]:
+            if (self._nodes.get(candidate) or {}).get("level") == 1:
+                return candidate
+        return None
+
+    def roots(self) -> List[str]:
+        """Indexed issues without an indexed parent"""
+        return [key for key in self._nodes if self._parents.get(key) not in self._nodes]
+
+    def iter_subtree(self, key: str, include_root: bool = True) -> Iterator[str]:
+        """Depth-first, pre-order keys below (and including) key"""
+        stack = [key] if include_root else list(reversed(self.children(key)))
+        seen = set()
+        while stack:
+            current = stack.pop()
+            if current in seen:
+                continue
+            seen.add(current)
+            yield current
+            stack.extend(reversed(self.children(current)))
+
+    def rollup(self, key: str) -> Dict[str, Any]:
+        """Status counts and completion of a subtree; progress counts leaf issues only"""
+        categories: Counter = Counter()
+        leaves = done = 0
+        for current in self.iter_subtree(key):
+            category = (self._nodes.get(current) or {}).get("status_category")
+            categories[category or "unknown"] += 1
+            if current not in self._children:
+                leaves += 1
+                done += category == "done"
+        return {
+            "key": key,
+            "issues": sum(categories.values()),
+            "status_categories": dict(categories),
+            "leaves": leaves,
+            "done": done,
+            "percent": round(100.0 * done / leaves, 1) if leaves else None
+        }
+
+    def rollups(self, level: int = 1) -> List[Dict[str, Any]]:
+        """rollup() of every indexed issue at a hierarchy level (default: epics); O(n) overall"""
+        return [self.rollup(key) for key, node in list(self._nodes.items()) if node.get("level") == level]
+
+    def tree(self, key: str, _depth: int = 0) -> Dict[str, Any]:
+        """Nested dict of a subtree, e.g. for JSON output"""
+        children = self.children(key) if _depth < MAX_DEPTH else []
+        return {**(self._nodes.get(key) or {"key": key}),
+                "children": [self.tree(child, _depth + 1) for child in children]}
@@ -1,35 +1,648 @@
 import json
 import os
+import gzip
+import io
+import mmap
+import struct
+import tempfile
+import threading
 from pathlib import Path
-from typing import Dict, List, Optional, Any
-from .error_handler import error_handler, JiraError
+from typing import Dict, List, Optional, Any, BinaryIO, Iterable, Iterator, Tuple
+from .error_handler import error_handler, JiraError, JiraDataError, JiraFileError
+from .profile_handler import profile_span
+
+# Optional fast serializer and zstd backends
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+GZIP_MAGIC = b"\x1f\x8b"
+ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+COMPRESSION_SUFFIXES = {".gz": "gzip", ".zst": "zstd"}
+JSONL_SUFFIXES = (".jsonl", ".ndjson")
+# Read once at import: querying the umask means briefly changing it, which is not thread-safe
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+
+def dumps_bytes(data: Any, compact: bool = True) -> bytes:
+    """Serialize data to UTF-8 JSON bytes, using orjson when it is installed"""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | (0 if compact else orjson.OPT_INDENT_2)
+        return orjson.dumps(data, option=option)
+    if compact:
+        return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    return json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8")
+
+
+def loads_bytes(raw: bytes) -> Any:
+    """Deserialize JSON bytes, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw.decode("utf-8"))
+
+
+def decompress_bytes(raw: bytes) -> bytes:
+    """Transparently decompress gzip or zstd content based on its magic bytes"""
+    if raw[:2] == GZIP_MAGIC:
+        return gzip.decompress(raw)
+    if raw[:4] == ZSTD_MAGIC:
+        if zstandard is None:
+            raise JiraFileError("zstd-compressed file requires the 'zstandard' package", "MISSING_DEPENDENCY",
+                                {"dependency": "zstandard"}, {"file": "json_handler"})
+        return zstandard.ZstdDecompressor().decompressobj().decompress(raw)
+    return raw
+
+
+class AtomicWriter:
+    """Binary file writer that renames a temp file over the target on success
+
+    A crash or exception mid-write leaves the previous file untouched. The
+    result keeps the mode of the file it replaces (new files get 0666 & ~umask
+    rather than mkstemp's 0600).
+    """
+
+    def __init__(self, file_path: Path, compression: Optional[str] = None):
+        self.file_path = Path(file_path)
+        self.compression = compression
+        self._raw: Optional[BinaryIO] = None
+        self._stream: Optional[BinaryIO] = None
+
+    def __enter__(self) -> BinaryIO:
+        fd, self._tmp_path = tempfile.mkstemp(dir=self.file_path.parent, prefix=f".{self.file_path.name}.", suffix=".tmp")
+        self._raw = os.fdopen(fd, "wb")
+        try:
+            mode = os.stat(self.file_path).st_mode & 0o7777
+        except FileNotFoundError:
+            mode = 0o666 & ~_UMASK
+        os.chmod(self._tmp_path, mode)
+        if self.compression == "gzip":
+            self._stream = gzip.GzipFile(fileobj=self._raw, mode="wb", compresslevel=6)
+        elif self.compression == "zstd":
+            if zstandard is None:
+                self._abort()
+                raise JiraFileError("zstd compression requires the 'zstandard' package", "MISSING_DEPENDENCY",
+                                    {"dependency": "zstandard"}, {"file": str(self.file_path)})
+            self._stream = zstandard.ZstdCompressor(level=3).stream_writer(self._raw, closefd=False)
+        else:
+            self._stream = self._raw
+        return self._stream
+
+    def _abort(self) -> None:
+        try:
+            self._raw.close()
+        finally:
+            if os.path.exists(self._tmp_path):
+                os.remove(self._tmp_path)
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        if exc_type is not None:
+            self._abort()
+            return False
+        if self._stream is not self._raw:
+            self._stream.close()
+        self._raw.flush()
+        os.fsync(self._raw.fileno())
+        self._raw.close()
+        os.replace(self._tmp_path, self.file_path)
+        return False
+
+
+class JsonlLog:
+    """Append-only NDJSON log with a sidecar offset index
+
+    Appends are buffered and written in batches (O(1) per record). The
+    "<file>.idx" sidecar holds one "offset<TAB>key" line per record, so a
+    record can be read by number or key without scanning the log. When a
+    key_field is set, compact() rewrites the log keeping the latest record
+    per key; compact_every triggers that automatically after N appends.
+    """
+
+    def __init__(self, file_path: Path, key_field: Optional[str] = None,
+                 flush_every: int = 100, compact_every: int = 0):
+        self.file_path = Path(file_path)
+        self.index_path = self.file_path.with_name(self.file_path.name + ".idx")
+        self.key_field = key_field
+        self.flush_every = max(1, flush_every)
+        self.compact_every = compact_every
+        self._lock = threading.RLock()
+        self._buffer: List[Tuple[bytes, str]] = []
+        self._offsets: List[int] = []
+        self._keys: Dict[str, int] = {}
+        self._size = 0
+        self._appends_since_compact = 0
+        self._load_index()
+
+    def configure(self, key_field: Optional[str], flush_every: int, compact_every: int) -> None:
+        """Change the log's settings, re-indexing the keys when key_field changes"""
+        with self._lock:
+            self.flush()
+            self.flush_every = max(1, flush_every)
+            self.compact_every = compact_every
+            if key_field != self.key_field:
+                self.key_field = key_field
+                self._rebuild_index()
+
+    def _record_key(self, record: Any) -> str:
+        if self.key_field and isinstance(record, dict) and record.get(self.key_field) is not None:
+            return str(record[self.key_field])
+        return ""
+
+    def _load_index(self) -> None:
+        """Load the sidecar index, rebuilding it if it does not match the log"""
+        self._size = self.file_path.stat().st_size if self.file_path.exists() else 0
+        if self.index_path.exists():
+            with open(self.index_path, "r", encoding="utf-8") as f:
+                for line in f:
+                    offset, _, key = line.rstrip("\n").partition("\t")
+                    self._register(int(offset), key)
+            indexed_end = self._offsets[-1] if self._offsets else 0
+            if indexed_end <= self._size and self._covers_tail(indexed_end):
+                return
+        self._rebuild_index()
+
+    def _covers_tail(self, last_offset: int) -> bool:
+        """True when the last indexed record is also the last line of the log"""
+        if not self._offsets:
+            return self._size == 0
+        with open(self.file_path, "rb") as f:
+            f.seek(last_offset)
+            f.readline()
+            return f.tell() == self._size
+
+    def _register(self, offset: int, key: str) -> None:
+        if key:
+            self._keys[key] = len(self._offsets)
+        self._offsets.append(offset)
+
+    def _rebuild_index(self) -> None:
+        """Scan the log once and rewrite the sidecar index (e.g. after a crash)"""
+        self._offsets, self._keys = [], {}
+        lines = []
+        if self.file_path.exists():
+            with open(self.file_path, "rb") as f:
+                offset = 0
+                for line in f:
+                    if line.strip():
+                        key = self._record_key(loads_bytes(line))
+                        self._register(offset, key)
+                        lines.append(f"{offset}\t{key}\n")
+                    offset += len(line)
+        with AtomicWriter(self.index_path) as f:
+            f.write("".join(lines).encode("utf-8"))
+
+    def append(self, record: Any) -> int:
+        """Buffer a record for appending and return its record number"""
+        with self._lock:
+            self._buffer.append((dumps_bytes(record) + b"\n", self._record_key(record)))
+            number = len(self._offsets) + len(self._buffer) - 1
+            self._appends_since_compact += 1
+            if len(self._buffer) >= self.flush_every:
+                self.flush()
+            return number
+
+    def flush(self) -> None:
+        """Write buffered records and their index entries"""
+        with self._lock:
+            if not self._buffer:
+                return
+            index_lines = []
+            with open(self.file_path, "ab") as f:
+                for line, key in self._buffer:
+                    index_lines.append(f"{self._size}\t{key}\n")
+                    self._register(self._size, key)
+                    f.write(line)
+                    self._size += len(line)
+            with open(self.index_path, "a", encoding="utf-8") as f:
+                f.write("".join(index_lines))
+            self._buffer = []
+            if self.compact_every and self.key_field and self._appends_since_compact >= self.compact_every:
+                self.compact()
+
+    def __len__(self) -> int:
+        return len(self._offsets) + len(self._buffer)
+
+    def get(self, number: int) -> Any:
+        """Read a single record by its record number"""
+        with self._lock:
+            self.flush()
+            with open(self.file_path, "rb") as f:
+                f.seek(self._offsets[number])
+                return loads_bytes(f.readline())
+
+    def get_by_key(self, key: str) -> Optional[Any]:
+        """Read the latest record for a key (requires key_field)"""
+        # One lock hold, so compact() cannot move the record between the lookup and the read
+        with self._lock:
+            self.flush()
+            number = self._keys.get(str(key))
+            return self.get(number) if number is not None else None
+
+    def keys(self) -> List[str]:
+        with self._lock:
+            self.flush()
+            return list(self._keys)
+
+    def __iter__(self) -> Iterator[Any]:
+        """Stream records from disk without loading the whole log"""
+        self.flush()
+        if not self.file_path.exists():
+            return
+        with open(self.file_path, "rb") as f:
+            for line in f:
+                if line.strip():
+                    yield loads_bytes(line)
+
+    def compact(self) -> int:
+        """Rewrite the log keeping only the latest record per key
+
+        Returns:
+            Number of records dropped
+        """
+        with self._lock:
+            self.flush()
+            latest = set(self._keys.values())
+            before = len(self._offsets)
+            with AtomicWriter(self.file_path) as out, open(self.file_path, "rb") as f:
+                for number, offset in enumerate(self._offsets):
+                    f.seek(offset)
+                    line = f.readline()
+                    if not self.key_field or number in latest or not self._record_key(loads_bytes(line)):
+                        out.write(line)
+            self._size = self.file_path.stat().st_size
+            self._rebuild_index()
+            self._appends_since_compact = 0
+            return before - len(self._offsets)
+
+    def close(self) -> None:
+        self.flush()
+
+    def __enter__(self) -> "JsonlLog":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        self.close()
+        return False
+
+
+SNAPSHOT_MAGIC = b"JSNAP2\n"
+# Snapshots written before the index was embedded keep it in a "<file>.idx" sidecar
+LEGACY_SNAPSHOT_MAGIC = b"JSNAP1\n"
+RECORD_HEADER = struct.Struct("<I")
+# Offset of the embedded index, stored in the last bytes of the file
+INDEX_TRAILER = struct.Struct("<Q")
+
+
+class SnapshotWriter:
+    """Write records as length-prefixed JSON blobs plus a key -> (offset, length) index
+
+    The index is appended to the snapshot itself, so one atomic rename
+    publishes records and index together.
+    """
+
+    def __init__(self, file_path: Path):
+        self.file_path = Path(file_path)
+        self._atomic = AtomicWriter(self.file_path)
+        self._index: Dict[str, Tuple[int, int]] = {}
+
+    def __enter__(self) -> "SnapshotWriter":
+        self._stream = self._atomic.__enter__()
+        self._stream.write(SNAPSHOT_MAGIC)
+        self._offset = len(SNAPSHOT_MAGIC)
+        return self
+
+    def write(self, key: str, record: Any) -> None:
+        payload = dumps_bytes(record)
+        self._stream.write(RECORD_HEADER.pack(len(payload)))
+        self._stream.write(payload)
+        self._index[str(key)] = (self._offset + RECORD_HEADER.size, len(payload))
+        self._offset += RECORD_HEADER.size + len(payload)
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        if exc_type is None:
+            self._stream.write(dumps_bytes(self._index))
+            self._stream.write(INDEX_TRAILER.pack(self._offset))
+        self._atomic.__exit__(exc_type, exc, tb)
+        return False
+
+
+class SnapshotReader:
+    """Random-access reader over a memory-mapped snapshot
+
+    Only the requested records are decoded; the mapping is read-only, so
+    several processes reading the same snapshot share the OS page cache.
+    """
+
+    def __init__(self, file_path: Path):
+        self.file_path = Path(file_path)
+        self._file = open(self.file_path, "rb")
+        try:
+            self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self._file.close()
+            raise JiraFileError(f"Not a snapshot file: {self.file_path}", "INVALID_SNAPSHOT",
+                                {}, {"file": str(self.file_path)})
+        magic = self._mm[:len(SNAPSHOT_MAGIC)]
+        if magic == SNAPSHOT_MAGIC and len(self._mm) >= len(SNAPSHOT_MAGIC) + INDEX_TRAILER.size:
+            trailer = len(self._mm) - INDEX_TRAILER.size
+            (self._end,) = INDEX_TRAILER.unpack_from(self._mm, trailer)
+            self._index: Dict[str, List[int]] = loads_bytes(self._mm[self._end:trailer])
+        elif magic == LEGACY_SNAPSHOT_MAGIC:
+            with open(self.file_path.with_name(self.file_path.name + ".idx"), "rb") as f:
+                self._index = loads_bytes(f.read())
+            self._end = len(self._mm)
+        else:
+            self.close()
+            raise JiraFileError(f"Not a snapshot file: {self.file_path}", "INVALID_SNAPSHOT",
+                                {}, {"file": str(self.file_path)})
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._index
+
+    def keys(self) -> List[str]:
+        return list(self._index)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Decode a single record by key"""
+        entry = self._index.get(key)
+        if entry is None:
+            return default
+        offset, length = entry
+        return loads_bytes(self._mm[offset:offset + length])
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, Any]:
+        """Decode several records, skipping unknown keys"""
+        return {key: self.get(key) for key in keys if key in self._index}
+
+    def __iter__(self) -> Iterator[Any]:
+        """Decode every record in file order"""
+        offset = len(SNAPSHOT_MAGIC)
+        while offset < self._end:
+            (length,) = RECORD_HEADER.unpack_from(self._mm, offset)
+            offset += RECORD_HEADER.size
+            yield loads_bytes(self._mm[offset:offset + length])
+            offset += length
+
+    def close(self) -> None:
+        self._mm.close()
+        self._file.close()
+
+    def __enter__(self) -> "SnapshotReader":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        self.close()
+        return False
+
+
+# Required fields are checked with a single set operation per item
+WORK_ITEM_REQUIRED_FIELDS = (
+    "project_key", "issue_type", "summary", "description",
+    "priority", "labels", "components", "fix_versions"
+)
+SUBTASK_REQUIRED_FIELDS = ("summary", "description", "issue_type")
+_REQUIRED_SETS = {fields: frozenset(fields) for fields in (WORK_ITEM_REQUIRED_FIELDS, SUBTASK_REQUIRED_FIELDS)}
+
+
+def _missing_fields(item: Any, required: Tuple[str, ...]) -> List[str]:
+    """Return missing required fields in declaration order (empty when valid)"""
+    if not isinstance(item, dict):
+        return list(required)
+    if _REQUIRED_SETS[required].issubset(item.keys()):
+        return []
+    return [field for field in required if field not in item]
+
+
+def _open_text(file_path: Path):
+    """Open a possibly gzip/zstd-compressed file as a UTF-8 text stream"""
+    with open(file_path, "rb") as f:
+        magic = f.read(4)
+    if magic[:2] == GZIP_MAGIC:
+        return gzip.open(file_path, "rt", encoding="utf-8")
+    if magic == ZSTD_MAGIC:
+        if zstandard is None:
+            raise JiraFileError("zstd-compressed file requires the 'zstandard' package", "MISSING_DEPENDENCY",
+                                {"dependency": "zstandard"}, {"file": str(file_path)})
+        return io.TextIOWrapper(zstandard.ZstdDecompressor().stream_reader(open(file_path, "rb"), closefd=True),
+                                encoding="utf-8")
+    return open(file_path, "r", encoding="utf-8")
+
+
+_VALUE_DELIMITERS = " \t\r\n,]}"
+
+
+def iter_json_array(file_path: Path, key: str, chunk_size: int = 1 << 16, required: bool = False) -> Iterator[Any]:
+    """Incrementally yield the elements of the top-level array stored under key
+
+    Only the current element (and any skipped sibling value) is held in
+    memory. Other top-level keys are decoded and discarded. With required,
+    a missing key or a non-array value raises JiraDataError.
+    """
+    decoder = json.JSONDecoder()
+    with _open_text(file_path) as f:
+        buf, pos, eof = "", 0, False
+
+        def fill() -> bool:
+            nonlocal buf, pos, eof
+            chunk = f.read(chunk_size)
+            if not chunk:
+                eof = True
+                return False
+            buf = buf[pos:] + chunk
+            pos = 0
+            return True
+
+        def skip_ws() -> str:
+            nonlocal pos
+            while True:
+                while pos < len(buf) and buf[pos] in " \t\r\n":
+                    pos += 1
+                if pos < len(buf) or not fill():
+                    return buf[pos] if pos < len(buf) else ""
+
+        def expect(chars: str) -> str:
+            nonlocal pos
+            ch = skip_ws()
+            if not ch or ch not in chars:
+                raise json.JSONDecodeError(f"Expected one of {chars!r}", buf, pos)
+            pos += 1
+            return ch
+
+        def decode() -> Any:
+            nonlocal pos
+            skip_ws()
+            while True:
+                try:
+                    value, end = decoder.raw_decode(buf, pos)
+                    # Strings, objects and arrays end at their own closing character; a number or
+                    # literal is only complete once a delimiter follows it ("1." decodes as 1)
+                    if eof or buf[pos] in '"{[' or (end < len(buf) and buf[end] in _VALUE_DELIMITERS):
+                        pos = end
+                        return value
+                except json.JSONDecodeError:
+                    if eof:
+                        raise
+                fill()
+
+        def missing(reason: str) -> JiraDataError:
+            return JiraDataError(f"Could not load {file_path.name}: {reason}", "INVALID_JSON_STRUCTURE",
+                                 {"key": key}, {"file": str(file_path)})
+
+        found = False
+        expect("{")
+        if skip_ws() == "}":
+            if required:
+                raise missing(f"no '{key}' list")
+            return
+        while True:
+            name = decode()
+            expect(":")
+            if name == key and required and skip_ws() != "[":
+                raise missing(f"'{key}' is not a list")
+            if name == key and skip_ws() == "[":
+                found = True
+                pos += 1
+                if skip_ws() == "]":
+                    pos += 1
+                else:
+                    while True:
+                        yield decode()
+                        if expect(",]") == "]":
+                            break
+            else:
+                decode()
+            if expect(",}") == "}":
+                if required and not found:
+                    raise missing(f"no '{key}' list")
+                return
+
+
+# Open logs are shared per path so concurrent writers keep one consistent index;
+# the flag records whether the log was opened with explicit settings
+_open_logs: Dict[Path, Tuple[JsonlLog, bool]] = {}
+_open_logs_lock = threading.Lock()
+
 
 class JsonHandler:
-    def __init__(self, base_dir="data"):
-        """Initialize JsonHandler with base directory for JSON files"""
-        self.base_dir = Path(base_dir)
+    def __init__(self, base_dir: Optional[str] = None, compact: bool = False, compression: Optional[str] = None):
+        """Initialize JsonHandler with base directory for JSON files
+        
+        Args:
+            base_dir: Directory JSON files are read from and written to; defaults to JIRA_DATA_DIR or "data"
+            compact: Write JSON without indentation by default
+            compression: Default compression ("gzip", "zstd" or None); defaults to JIRA_JSON_COMPRESSION
+        """
+        self.base_dir = Path(base_dir or os.getenv("JIRA_DATA_DIR", "data"))
         self.base_dir.mkdir(parents=True, exist_ok=True)
+        self.compact = compact
+        self.compression = compression or os.getenv("JIRA_JSON_COMPRESSION") or None
+
+    def _resolve_compression(self, filename: str, compression: Optional[str]) -> Optional[str]:
+        """Pick the compression from the argument, the file suffix or the handler default"""
+        if compression is not None:
+            return compression or None
+        return COMPRESSION_SUFFIXES.get(Path(filename).suffix, self.compression)
     
     @error_handler
-    def save_json(self, data: Any, filename: str) -> Path:
-        """Save data to a JSON file"""
+    def save_json(self, data: Any, filename: str, compact: Optional[bool] = None,
+                  compression: Optional[str] = None) -> Path:
+        """Save data to a JSON file atomically
+        
+        Args:
+            data: JSON-serializable data
+            filename: File name relative to base_dir
+            compact: Override the handler's compact setting
+            compression: "gzip", "zstd", "" for none, or None to infer from the suffix
+        """
         file_path = self.base_dir / filename
-        with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+        with profile_span("persist"):
+            payload = dumps_bytes(data, compact=self.compact if compact is None else compact)
+            with AtomicWriter(file_path, self._resolve_compression(filename, compression)) as f:
+                f.write(payload)
         return file_path
-    
+
+    def open_log(self, filename: str, key_field: Optional[str] = None, flush_every: Optional[int] = None,
+                 compact_every: Optional[int] = None) -> JsonlLog:
+        """Open (or reuse) an append-only JSONL log under base_dir
+        
+        Settings left as None accept whatever the open log uses (defaults: no
+        key, flush every 100 appends, no compaction). A log opened without
+        settings (e.g. by load_json) adopts the first explicit ones; explicit
+        settings that conflict with an earlier opener's raise JiraFileError.
+        """
+        file_path = (self.base_dir / filename).resolve()
+        requested = {name: value for name, value in (("key_field", key_field), ("flush_every", flush_every),
+                                                     ("compact_every", compact_every)) if value is not None}
+        with _open_logs_lock:
+            if file_path not in _open_logs:
+                log = JsonlLog(file_path, key_field, 100 if flush_every is None else flush_every, compact_every or 0)
+                _open_logs[file_path] = (log, bool(requested))
+                return log
+            log, configured = _open_logs[file_path]
+            conflicts = {name: getattr(log, name) for name, value in requested.items() if getattr(log, name) != value}
+            if conflicts and configured:
+                raise JiraFileError(f"Log {filename} is already open with different settings", "LOG_SETTINGS_MISMATCH",
+                                    {"open": conflicts, "requested": requested}, {"file": str(file_path)})
+            if conflicts:
+                log.configure(requested.get("key_field", log.key_field), requested.get("flush_every", log.flush_every),
+                              requested.get("compact_every", log.compact_every))
+            if requested:
+                _open_logs[file_path] = (log, True)
+            return log
+
+    @error_handler
+    def write_snapshot(self, records: Iterable[Dict[str, Any]], filename: str = "work_items.snap",
+                       key_field: str = "key") -> Path:
+        """Write records to an indexed, memory-mappable snapshot file"""
+        with profile_span("persist"), SnapshotWriter(self.base_dir / filename) as writer:
+            for record in records:
+                writer.write(record[key_field], record)
+        return self.base_dir / filename
+
+    @error_handler
+    def open_snapshot(self, filename: str = "work_items.snap") -> Optional[SnapshotReader]:
+        """Open a SnapshotReader for random lookups, or None if the snapshot does not exist"""
+        file_path = self.base_dir / filename
+        if not file_path.exists():
+            return None
+        return SnapshotReader(file_path)
+
     @error_handler
     def load_json(self, filename: str) -> Optional[Any]:
-        """Load data from a JSON file"""
+        """Load data from a JSON file, detecting gzip/zstd compression automatically
+        
+        JSONL logs (.jsonl/.ndjson) are returned as a list of records.
+        """
         file_path = self.base_dir / filename
         if not file_path.exists():
             return None
-        with open(file_path, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        if file_path.suffix in JSONL_SUFFIXES:
+            return list(self.open_log(filename))
+        with open(file_path, 'rb') as f:
+            raw = f.read()
+        # orjson.JSONDecodeError subclasses json.JSONDecodeError, so error_handler still applies
+        return loads_bytes(decompress_bytes(raw))
     
     @error_handler
     def append_json(self, data: Any, filename: str) -> Path:
-        """Append data to an existing JSON file or create new one"""
+        """Append a record to a JSON list file, or to a JSONL log in O(1) for .jsonl/.ndjson names
+        
+        Either way load_json reads the file back as a list.
+        """
+        if Path(filename).suffix in JSONL_SUFFIXES:
+            log = self.open_log(filename)
+            log.append(data)
+            log.flush()
+            return log.file_path
         existing_data = self.load_json(filename) or []
         if isinstance(existing_data, list):
             existing_data.append(data)
@@ -37,68 +650,72 @@ class JsonHandler:
             existing_data = [existing_data, data]
         return self.save_json(existing_data, filename)
 
+    def iter_jira_tasks(self, filename: str = "tasks.json") -> Iterator[Tuple[str, Dict]]:
+        """Stream and validate tasks.json work items one at a time
+        
+        Work items are parsed incrementally, so memory stays bounded and the
+        first item can be handed to payload preparation while the rest of
+        the file is still being read.
+        
+        Yields:
+            (category, item) tuples where category is "epic", "task",
+            "subtask" or "error"
+        """
+        file_path = self.base_dir / filename
+        if not file_path.exists() or not file_path.stat().st_size:
+            raise JiraDataError(f"Could not load {filename} or file is empty", "EMPTY_FILE",
+                                {}, {"file": str(file_path)})
+
+        for item in iter_json_array(file_path, "work_items", required=True):
+            missing = _missing_fields(item, WORK_ITEM_REQUIRED_FIELDS)
+            if missing:
+                yield "error", {
+                    "type": "item_validation",
+                    "summary": item.get("summary", "Unknown") if isinstance(item, dict) else "Unknown",
+                    "error": f"Missing required fields in work item: {', '.join(missing)}"
+                }
+                continue
+
+            if item["issue_type"] == "Epic":
+                yield "epic", item
+            elif item["issue_type"] == "Task":
+                yield "task", item
+                for subtask in item.get("subtasks", []):
+                    missing = _missing_fields(subtask, SUBTASK_REQUIRED_FIELDS)
+                    if missing:
+                        yield "error", {
+                            "type": "subtask_validation",
+                            "parent_summary": item["summary"],
+                            "subtask_summary": subtask.get("summary", "Unknown") if isinstance(subtask, dict) else "Unknown",
+                            "error": f"Missing required fields in subtask: {', '.join(missing)}"
+                        }
+                    else:
+                        yield "subtask", {"parent_summary": item["summary"], **subtask}
+
     @error_handler
     def process_jira_tasks(self, filename: str = "tasks.json") -> Dict:
         """Process tasks.json file and prepare data for Jira issue creation"""
-        tasks_data = self.load_json(filename)
-        if not tasks_data:
-            raise JiraError(f"Could not load {filename} or file is empty")
-
         results = {
             "epics": [],
             "tasks": [],
             "subtasks": [],
             "errors": []
         }
-
-        # Process and validate work items
-        for item in tasks_data.get("work_items", []):
-            try:
-                self._validate_work_item(item)
-                if item["issue_type"] == "Epic":
-                    results["epics"].append(item)
-                elif item["issue_type"] == "Task":
-                    results["tasks"].append(item)
-                    # Process subtasks if they exist
-                    for subtask in item.get("subtasks", []):
-                        try:
-                            self._validate_subtask(subtask)
-                            results["subtasks"].append({
-                                "parent_summary": item["summary"],
-                                **subtask
-                            })
-                        except Exception as e:
-                            results["errors"].append({
-                                "type": "subtask_validation",
-                                "parent_summary": item["summary"],
-                                "subtask_summary": subtask.get("summary", "Unknown"),
-                                "error": str(e)
-                            })
-            except Exception as e:
-                results["errors"].append({
-                    "type": "item_validation",
-                    "summary": item.get("summary", "Unknown"),
-                    "error": str(e)
-                })
+        
+        for category, item in self.iter_jira_tasks(filename):
+            results[f"{category}s"].append(item)
 
         return results
 
     def _validate_work_item(self, item: Dict) -> None:
         """Validate required fields in a work item"""
-        required_fields = [
-            "project_key", "issue_type", "summary", "description",
-            "priority", "labels", "components", "fix_versions"
-        ]
-        
-        missing_fields = [field for field in required_fields if field not in item]
+        missing_fields = _missing_fields(item, WORK_ITEM_REQUIRED_FIELDS)
         if missing_fields:
             raise JiraError(f"Missing required fields in work item: {', '.join(missing_fields)}")
 
     def _validate_subtask(self, subtask: Dict) -> None:
         """Validate required fields in a subtask"""
-        required_fields = ["summary", "description", "issue_type"]
-        
-        missing_fields = [field for field in required_fields if field not in subtask]
+        missing_fields = _missing_fields(subtask, SUBTASK_REQUIRED_FIELDS)
         if missing_fields:
             raise JiraError(f"Missing required fields in subtask: {', '.join(missing_fields)}")
 
@@ -0,0 +1,237 @@
+import os
+import re
+import json
+import time
+import random
+import threading
+from bisect import bisect_left
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+# Latency histogram bucket upper bounds in seconds (Prometheus-style, +Inf implied)
+LATENCY_BUCKETS = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+# Samples kept per endpoint for percentile estimates (reservoir sampling)
+RESERVOIR_SIZE = 4096
+
+_ISSUE_KEY = re.compile(r"^[A-Z][A-Z0-9_]+-\d+$")
+_NUMERIC = re.compile(r"^\d+$")
+# Segments that follow these resources are identifiers rather than sub-resources
+_KEYED_RESOURCES = {"project": "{key}", "user": None, "fieldconfiguration": None}
+_RESERVED_SEGMENTS = {"search", "type", "recent", "bulk", "createmeta", "picker", "properties"}
+
+
+@lru_cache(maxsize=1024)
+def endpoint_template(endpoint: str) -> str:
+    """Collapse concrete keys and ids in an endpoint into a template
+
+    e.g. "project/NEUN/components" -> "project/{key}/components",
+         "issue/NEUN-12/transitions" -> "issue/{key}/transitions",
+         "version/10001" -> "version/{id}"
+    """
+    segments = endpoint.split("?", 1)[0].strip("/").split("/")
+    template: List[str] = []
+    for i, segment in enumerate(segments):
+        previous = segments[i - 1] if i else None
+        if _ISSUE_KEY.match(segment):
+            template.append("{key}")
+        elif _NUMERIC.match(segment):
+            template.append("{id}")
+        elif previous in _KEYED_RESOURCES and _KEYED_RESOURCES[previous] and segment not in _RESERVED_SEGMENTS:
+            template.append(_KEYED_RESOURCES[previous])
+        else:
+            template.append(segment)
+    return "/".join(template)
+
+
+class _Histogram:
+    """Bucketed latency histogram with a bounded sample reservoir for percentiles"""
+
+    __slots__ = ("buckets", "count", "total", "samples", "maximum")
+
+    def __init__(self):
+        self.buckets = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.samples: List[float] = []
+        self.maximum = 0.0
+
+    def observe(self, value: float) -> None:
+        self.buckets[bisect_left(LATENCY_BUCKETS, value)] += 1
+        self.count += 1
+        self.total += value
+        self.maximum = max(self.maximum, value)
+        if len(self.samples) < RESERVOIR_SIZE:
+            self.samples.append(value)
+        else:
+            slot = random.randrange(self.count)
+            if slot < RESERVOIR_SIZE:
+                self.samples[slot] = value
+
+    def quantile(self, q: float) -> float:
+        if not self.samples:
+            return 0.0
+        ordered = sorted(self.samples)
+        return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+class MetricsRegistry:
+    """Process-wide request and error metrics
+
+    Disabled by default (enable with JIRA_METRICS=1 or metrics.enable());
+    instrumented code checks `metrics.enabled` before doing any work, so the
+    disabled cost is one attribute read per request.
+    """
+
+    def __init__(self):
+        self.enabled = os.getenv("JIRA_METRICS", "").lower() in ("1", "true", "yes")
+        self._lock = threading.Lock()
+        self.reset()
+
+    def enable(self) -> None:
+        self.enabled = True
+
+    def disable(self) -> None:
+        self.enabled = False
+
+    def reset(self) -> None:
+        with self._lock:
+            self.started_at = time.time()
+            self._requests: Dict[Tuple[str, str], Dict[str, Any]] = {}
+            self._errors: Dict[Tuple[str, str], int] = {}
+
+    def _endpoint(self, method: str, endpoint: str) -> Dict[str, Any]:
+        key = (method, endpoint_template(endpoint))
+        entry = self._requests.get(key)
+        if entry is None:
+            entry = self._requests[key] = {
+                "count": 0, "statuses": {}, "retries": 0, "throttled": 0,
+                "bytes_in": 0, "bytes_out": 0, "latency": _Histogram()
+            }
+        return entry
+
+    def record_request(self, method: str, endpoint: str, status: Optional[int], seconds: float,
+                       bytes_in: int = 0, bytes_out: int = 0) -> None:
+        """Record one completed request (after retries); a final 429 also counts as throttled"""
+        with self._lock:
+            entry = self._endpoint(method, endpoint)
+            entry["count"] += 1
+            if status == 429:
+                entry["throttled"] += 1
+            status_key = str(status) if status is not None else "error"
+            entry["statuses"][status_key] = entry["statuses"].get(status_key, 0) + 1
+            entry["bytes_in"] += bytes_in
+            entry["bytes_out"] += bytes_out
+            entry["latency"].observe(seconds)
+
+    def record_retry(self, method: str, endpoint: str, status: int) -> None:
+        """Record a retried attempt; 429 responses are also counted as throttled"""
+        with self._lock:
+            entry = self._endpoint(method, endpoint)
+            entry["retries"] += 1
+            if status == 429:
+                entry["throttled"] += 1
+
+    def record_error(self, function: str, error_type: str) -> None:
+        with self._lock:
+            key = (function, error_type)
+            self._errors[key] = self._errors.get(key, 0) + 1
+
+    def summary(self) -> Dict[str, Any]:
+        """JSON-friendly summary of everything recorded so far"""
+        with self._lock:
+            endpoints = []
+            totals = {"requests": 0, "retries": 0, "throttled": 0, "failures": 0, "bytes_in": 0, "bytes_out": 0}
+            all_samples: List[float] = []
+            for (method, template), entry in sorted(self._requests.items()):
+                latency: _Histogram = entry["latency"]
+                failures = sum(n for s, n in entry["statuses"].items() if s == "error" or int(s) >= 400)
+                endpoints.append({
+                    "method": method,
+                    "endpoint": template,
+                    "count": entry["count"],
+                    "statuses": dict(entry["statuses"]),
+                    "retries": entry["retries"],
+                    "throttled": entry["throttled"],
+                    "failures": failures,
+                    "bytes_in": entry["bytes_in"],
+                    "bytes_out": entry["bytes_out"],
+                    "latency_avg": round(latency.total / latency.count, 4) if latency.count else 0.0,
+                    "latency_p50": round(latency.quantile(0.50), 4),
+                    "latency_p95": round(latency.quantile(0.95), 4),
+                    "latency_max": round(latency.maximum, 4)
+                })
+                all_samples.extend(latency.samples)
+                totals["requests"] += entry["count"]
+                totals["failures"] += failures
+                for field in ("retries", "throttled", "bytes_in", "bytes_out"):
+                    totals[field] += entry[field]
+
+            all_samples.sort()
+            elapsed = time.time() - self.started_at
+            totals["elapsed_seconds"] = round(elapsed, 3)
+            totals["requests_per_second"] = round(totals["requests"] / elapsed, 2) if elapsed > 0 else 0.0
+            totals["latency_p50"] = round(all_samples[int(0.50 * (len(all_samples) - 1))], 4) if all_samples else 0.0
+            totals["latency_p95"] = round(all_samples[int(0.95 * (len(all_samples) - 1))], 4) if all_samples else 0.0
+
+            return {
+                "totals": totals,
+                "endpoints": endpoints,
+                "errors": [{"function": f, "error_type": t, "count": n} for (f, t), n in sorted(self._errors.items())]
+            }
+
+    def to_prometheus(self) -> str:
+        """Render metrics in the Prometheus text exposition format"""
+        lines = [
+            "# HELP jira_api_requests_total Jira REST requests by endpoint template and status",
+            "# TYPE jira_api_requests_total counter"
+        ]
+        with self._lock:
+            items = sorted(self._requests.items())
+            errors = sorted(self._errors.items())
+            for (method, template), entry in items:
+                for status, count in sorted(entry["statuses"].items()):
+                    lines.append(f'jira_api_requests_total{{method="{method}",endpoint="{template}",status="{status}"}} {count}')
+            for name, field, help_text in (
+                ("jira_api_retries_total", "retries", "Retried attempts"),
+                ("jira_api_throttled_total", "throttled", "429 responses"),
+                ("jira_api_bytes_received_total", "bytes_in", "Response bytes"),
+                ("jira_api_bytes_sent_total", "bytes_out", "Request body bytes")
+            ):
+                lines += [f"# HELP {name} {help_text}", f"# TYPE {name} counter"]
+                for (method, template), entry in items:
+                    lines.append(f'{name}{{method="{method}",endpoint="{template}"}} {entry[field]}')
+
+            lines += ["# HELP jira_api_request_seconds Request latency", "# TYPE jira_api_request_seconds histogram"]
+            for (method, template), entry in items:
+                latency: _Histogram = entry["latency"]
+                labels = f'method="{method}",endpoint="{template}"'
+                cumulative = 0
+                for bound, count in zip(LATENCY_BUCKETS + (float("inf"),), latency.buckets):
+                    cumulative += count
+                    le = "+Inf" if bound == float("inf") else repr(bound)
+                    lines.append(f'jira_api_request_seconds_bucket{{{labels},le="{le}"}} {cumulative}')
+                lines.append(f"jira_api_request_seconds_sum{{{labels}}} {latency.total:.6f}")
+                lines.append(f"jira_api_request_seconds_count{{{labels}}} {latency.count}")
+
+            lines += ["# HELP jira_api_errors_total Errors caught by error_handler", "# TYPE jira_api_errors_total counter"]
+            for (function, error_type), count in errors:
+                lines.append(f'jira_api_errors_total{{function="{function}",error_type="{error_type}"}} {count}')
+        return "\n".join(lines) + "\n"
+
+    def export(self, directory: Optional[str] = None) -> Dict[str, Path]:
+        """Write metrics.prom (textfile collector) and metrics.json into directory"""
+        out_dir = Path(directory or os.getenv("JIRA_METRICS_DIR", "data/metrics"))
+        out_dir.mkdir(parents=True, exist_ok=True)
+        paths = {"prometheus": out_dir / "metrics.prom", "json": out_dir / "metrics.json"}
+        # Write-then-rename so a textfile collector never reads a partial file
+        for kind, path in paths.items():
+            content = self.to_prometheus() if kind == "prometheus" else json.dumps(self.summary(), indent=2)
+            tmp = path.with_name(f".{path.name}.tmp")
+            tmp.write_text(content, encoding="utf-8")
+            os.replace(tmp, path)
+        return paths
+
+
+# Shared by the transport, the error_handler decorator and the CLI
+metrics = MetricsRegistry()
@@ -0,0 +1,786 @@
+import re
+import json
+import math
+import mimetypes
+import time
+import random
+import logging
+import argparse
+import threading
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from email.parser import BytesParser
+from email import policy
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+from .metrics_handler import endpoint_template
+
+API_PREFIX = "/rest/api/3/"
+
+# Issue types of a default company-managed project
+DEFAULT_ISSUE_TYPES = [
+    {"id": "10000", "key": "10000", "name": "Epic", "hierarchyLevel": 1, "subtask": False},
+    {"id": "10001", "key": "10001", "name": "Task", "hierarchyLevel": 0, "subtask": False},
+    {"id": "10002", "key": "10002", "name": "Story", "hierarchyLevel": 0, "subtask": False},
+    {"id": "10003", "key": "10003", "name": "Sub-task", "hierarchyLevel": -1, "subtask": True}
+]
+
+DEFAULT_FIELDS = [
+    {"id": "summary", "key": "summary", "name": "Summary", "custom": False, "schema": {"type": "string"}},
+    {"id": "description", "key": "description", "name": "Description", "custom": False, "schema": {"type": "string"}},
+    {"id": "issuetype", "key": "issuetype", "name": "Issue Type", "custom": False, "schema": {"type": "issuetype"}},
+    {"id": "project", "key": "project", "name": "Project", "custom": False, "schema": {"type": "project"}},
+    {"id": "parent", "key": "parent", "name": "Parent", "custom": False, "schema": {"type": "issuelink"}},
+    {"id": "priority", "key": "priority", "name": "Priority", "custom": False, "schema": {"type": "priority"}},
+    {"id": "assignee", "key": "assignee", "name": "Assignee", "custom": False, "schema": {"type": "user"}},
+    {"id": "labels", "key": "labels", "name": "Labels", "custom": False, "schema": {"type": "array", "items": "string"}},
+    {"id": "components", "key": "components", "name": "Components", "custom": False, "schema": {"type": "array", "items": "component"}},
+    {"id": "fixVersions", "key": "fixVersions", "name": "Fix versions", "custom": False, "schema": {"type": "array", "items": "version"}},
+    {"id": "duedate", "key": "duedate", "name": "Due date", "custom": False, "schema": {"type": "date"}},
+    {"id": "customfield_10011", "key": "customfield_10011", "name": "Epic Name", "custom": True, "schema": {"type": "string"}},
+    {"id": "customfield_10014", "key": "customfield_10014", "name": "Epic Link", "custom": True, "schema": {"type": "any"}},
+    {"id": "customfield_10040", "key": "customfield_10040", "name": "Team Components", "custom": True, "schema": {"type": "array", "items": "string"}}
+]
+
+# Simplified workflow: every status can move to every other one through the transition named after it
+DEFAULT_STATUSES = [
+    {"id": "10000", "name": "To Do", "statusCategory": {"key": "new"}},
+    {"id": "3", "name": "In Progress", "statusCategory": {"key": "indeterminate"}},
+    {"id": "10001", "name": "Done", "statusCategory": {"key": "done"}}
+]
+TRANSITION_IDS = {"To Do": "11", "In Progress": "21", "Done": "31"}
+
+LatencySampler = Callable[[random.Random], float]
+
+
+def parse_latency(spec: Optional[str]) -> LatencySampler:
+    """Build a latency sampler (seconds) from a spec string
+
+    Supported specs:
+        "0.05" or "fixed:0.05"       constant
+        "uniform:0.02,0.2"           uniform between bounds
+        "normal:0.08,0.02"           normal(mean, stdev), clipped at 0
+        "lognormal:0.08,0.5"         log-normal with the given median and sigma (long tail)
+    """
+    if not spec:
+        return lambda rng: 0.0
+    kind, _, args = spec.partition(":") if ":" in spec else ("fixed", "", spec)
+    try:
+        values = [float(v) for v in args.split(",")] if args else []
+        if kind == "fixed":
+            return lambda rng: values[0]
+        if kind == "uniform":
+            low, high = values
+            return lambda rng: rng.uniform(low, high)
+        if kind == "normal":
+            mean, stdev = values
+            return lambda rng: max(0.0, rng.gauss(mean, stdev))
+        if kind == "lognormal":
+            median, sigma = values
+            mu = math.log(median) if median > 0 else 0.0
+            return lambda rng: rng.lognormvariate(mu, sigma)
+    except ValueError:
+        pass
+    raise ValueError(f"Invalid latency spec: {spec!r}")
+
+
+@dataclass
+class MockJiraConfig:
+    """Fault and latency injection settings for MockJiraServer"""
+    latency: Optional[str] = None
+    # Per endpoint template overrides, e.g. {"POST issue": "uniform:0.2,0.6"}
+    endpoint_latency: Dict[str, str] = field(default_factory=dict)
+    # Token bucket; requests beyond it get 429 with Retry-After (0 = unlimited)
+    rate_limit: float = 0.0
+    burst: int = 10
+    # Probability of a 429 independent of the rate limit
+    throttle_probability: float = 0.0
+    retry_after: float = 1.0
+    # Probability and status codes of injected server errors
+    fault_rate: float = 0.0
+    fault_statuses: Tuple[int, ...] = (500, 502, 503)
+    # Search page size cap, like Jira Cloud's 100
+    max_results: int = 100
+    seed: Optional[int] = None
+
+
+class MockJiraState:
+    """In-memory projects, users and issues behind the mock endpoints"""
+
+    def __init__(self, base_url: str = ""):
+        self.base_url = base_url
+        self.lock = threading.RLock()
+        self.fields = [dict(f) for f in DEFAULT_FIELDS]
+        self.issue_types = [dict(it) for it in DEFAULT_ISSUE_TYPES]
+        self.users: List[Dict[str, Any]] = [
+            {"accountId": "mock-0001", "displayName": "Mock Admin", "emailAddress": "admin@example.com", "active": True}
+        ]
+        self.projects: Dict[str, Dict[str, Any]] = {}
+        self.issues: Dict[str, Dict[str, Any]] = {}
+        # Attachment id -> metadata, and id -> content
+        self.attachments: Dict[str, Dict[str, Any]] = {}
+        self.attachment_content: Dict[str, bytes] = {}
+        self._next_id = 10000
+        self._project_counters: Dict[str, int] = {}
+        # Bumped by every issue mutation; search results are cached per (jql, version)
+        self.version = 0
+        # Paging through a large result set re-runs the same JQL; reuse the match until issues change
+        self._search_cache: Tuple[Optional[Tuple[str, int]], List[Dict[str, Any]]] = (None, [])
+
+    def _changed(self) -> None:
+        """Record an issue mutation (call with the lock held)"""
+        self.version += 1
+        self._search_cache = (None, [])
+
+    def _id(self) -> str:
+        self._next_id += 1
+        return str(self._next_id)
+
+    def add_project(self, key: str, name: Optional[str] = None,
+                    components: Optional[List[str]] = None, versions: Optional[List[str]] = None) -> Dict[str, Any]:
+        with self.lock:
+            project = self.projects.get(key)
+            if project is None:
+                project = self.projects[key] = {
+                    "id": self._id(), "key": key, "name": name or key, "projectTypeKey": "software",
+                    "lead": self.users[0], "components": [], "versions": []
+                }
+                self._project_counters[key] = 0
+            for component in components or []:
+                self.add_component(key, {"name": component})
+            for version in versions or []:
+                self.add_version(key, {"name": version})
+            return project
+
+    def add_user(self, display_name: str, email: Optional[str] = None) -> Dict[str, Any]:
+        with self.lock:
+            user = {"accountId": f"mock-{len(self.users) + 1:04d}", "displayName": display_name,
+                    "emailAddress": email, "active": True}
+            self.users.append(user)
+            return user
+
+    def add_component(self, project_key: str, data: Dict[str, Any]) -> Dict[str, Any]:
+        with self.lock:
+            project = self.projects[project_key]
+            existing = next((c for c in project["components"] if c["name"] == data["name"]), None)
+            if existing:
+                return existing
+            component = {"id": self._id(), "name": data["name"], "description": data.get("description", ""),
+                         "project": project_key}
+            project["components"].append(component)
+            return component
+
+    def add_version(self, project_key: str, data: Dict[str, Any]) -> Dict[str, Any]:
+        with self.lock:
+            project = self.projects[project_key]
+            existing = next((v for v in project["versions"] if v["name"] == data["name"]), None)
+            if existing:
+                return existing
+            version = {"id": self._id(), "name": data["name"], "released": bool(data.get("released", False)),
+                       "archived": False, "releaseDate": data.get("releaseDate"), "projectId": int(project["id"])}
+            project["versions"].append(version)
+            return version
+
+    def project_response(self, key: str) -> Optional[Dict[str, Any]]:
+        project = self.projects.get(key)
+        if project is None:
+            return None
+        return {**project, "self": f"{self.base_url}{API_PREFIX}project/{key}", "issueTypes": self.issue_types}
+
+    def _issue_type(self, value: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        return next((it for it in self.issue_types
+                     if it["id"] == str(value.get("id")) or it["name"] == value.get("name")), None)
+
+    def create_issue(self, fields: Dict[str, Any]) -> Tuple[Optional[Dict[str, Any]], Dict[str, str]]:
+        """Validate fields like Jira does and store the issue; returns (issue, errors)"""
+        errors: Dict[str, str] = {}
+        with self.lock:
+            project_key = (fields.get("project") or {}).get("key")
+            project = self.projects.get(project_key)
+            if project is None:
+                errors["project"] = "valid project is required"
+            issue_type = self._issue_type(fields.get("issuetype") or {})
+            if issue_type is None:
+                errors["issuetype"] = "valid issue type is required"
+            if not fields.get("summary"):
+                errors["summary"] = "You must specify a summary of the issue."
+
+            parent_key = (fields.get("parent") or {}).get("key")
+            parent = self.issues.get(parent_key) if parent_key else None
+            if parent_key and parent is None:
+                errors["parent"] = f"Issue '{parent_key}' does not exist"
+            if issue_type and issue_type["subtask"] and parent is None:
+                errors["parent"] = "Sub-tasks must have a parent"
+
+            assignee = None
+            account_id = (fields.get("assignee") or {}).get("accountId")
+            if account_id:
+                assignee = next((u for u in self.users if u["accountId"] == account_id), None)
+                if assignee is None:
+                    errors["assignee"] = f"User '{account_id}' does not exist"
+            for field_name, known in (("components", "components"), ("fixVersions", "versions")):
+                for item in fields.get(field_name) or []:
+                    if project and not any(x["name"] == item.get("name") for x in project[known]):
+                        errors[field_name] = f"'{item.get('name')}' is not valid for project {project_key}"
+            if errors:
+                return None, errors
+
+            self._project_counters[project_key] += 1
+            key = f"{project_key}-{self._project_counters[project_key]}"
+            now = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.000+0000")
+            issue_id = self._id()
+            stored = {
+                **{k: v for k, v in fields.items() if k.startswith("customfield_")},
+                "summary": fields["summary"],
+                "description": fields.get("description"),
+                "issuetype": issue_type,
+                "project": {"id": project["id"], "key": project_key, "name": project["name"]},
+                "status": dict(DEFAULT_STATUSES[0]),
+                "priority": {"name": (fields.get("priority") or {}).get("name", "Medium")},
+                "assignee": assignee,
+                "reporter": self.users[0],
+                "labels": list(fields.get("labels") or []),
+                "components": [{"name": c.get("name")} for c in fields.get("components") or []],
+                "fixVersions": [{"name": v.get("name")} for v in fields.get("fixVersions") or []],
+                "duedate": fields.get("duedate"),
+                "created": now,
+                "updated": now,
+                "resolutiondate": None,
+                "parent": {"id": parent["id"], "key": parent_key} if parent else None
+            }
+            issue = {"id": issue_id, "key": key, "self": f"{self.base_url}{API_PREFIX}issue/{issue_id}", "fields": stored}
+            self.issues[key] = issue
+            self._changed()
+            return issue, {}
+
+    def seed_issues(self, project_key: str, count: int, subtasks_per_task: int = 0) -> List[str]:
+        """Create count synthetic epics/tasks (and sub-tasks) for search and export load tests"""
+        self.add_project(project_key)
+        keys = []
+        epic_key = None
+        for i in range(count):
+            is_epic = i % 20 == 0
+            fields = {"project": {"key": project_key}, "summary": f"{'Epic' if is_epic else 'Task'} {i}",
+                      "issuetype": {"name": "Epic" if is_epic else "Task"},
+                      "labels": [f"label-{i % 7}"]}
+            if not is_epic and epic_key:
+                fields["parent"] = {"key": epic_key}
+            issue, _ = self.create_issue(fields)
+            keys.append(issue["key"])
+            if is_epic:
+                epic_key = issue["key"]
+            for j in range(0 if is_epic else subtasks_per_task):
+                subtask, _ = self.create_issue({"project": {"key": project_key}, "summary": f"Sub-task {i}.{j}",
+                                                "issuetype": {"name": "Sub-task"}, "parent": {"key": issue["key"]}})
+                keys.append(subtask["key"])
+        return keys
+
+    def transitions(self, key: str) -> Optional[List[Dict[str, Any]]]:
+        issue = self.issues.get(key)
+        if issue is None:
+            return None
+        current = issue["fields"]["status"]["name"]
+        return [{"id": TRANSITION_IDS[status["name"]], "name": status["name"], "to": status}
+                for status in DEFAULT_STATUSES if status["name"] != current]
+
+    def transition_issue(self, key: str, transition_id: str) -> Optional[str]:
+        """Move an issue through a transition; returns an error message or None"""
+        with self.lock:
+            transition = next((t for t in self.transitions(key) or [] if t["id"] == str(transition_id)), None)
+            if transition is None:
+                return f"Transition id '{transition_id}' is not valid for this issue."
+            fields = self.issues[key]["fields"]
+            now = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.000+0000")
+            fields["status"] = dict(transition["to"])
+            fields["resolutiondate"] = now if transition["to"]["statusCategory"]["key"] == "done" else None
+            fields["updated"] = now
+            self._changed()
+            return None
+
+    def edit_issue(self, key: str, body: Dict[str, Any]) -> Dict[str, str]:
+        """Apply "fields" (set) and "update" (add/remove/set operations) of an edit; returns errors"""
+        with self.lock:
+            fields = self.issues[key]["fields"]
+            changes = {name: [{"set": value}] for name, value in (body.get("fields") or {}).items()}
+            for name, operations in (body.get("update") or {}).items():
+                changes.setdefault(name, []).extend(operations)
+            if any(name in ("project", "issuetype", "status") for name in changes):
+                return {name: "Field cannot be set." for name in changes if name in ("project", "issuetype", "status")}
+            for name, operations in changes.items():
+                for operation in operations:
+                    for op, value in operation.items():
+                        if op == "set":
+                            fields[name] = value
+                        elif op == "add":
+                            fields[name] = [*(fields.get(name) or []), *([] if value in (fields.get(name) or []) else [value])]
+                        elif op == "remove":
+                            fields[name] = [v for v in fields.get(name) or [] if v != value]
+            fields["updated"] = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.000+0000")
+            self._changed()
+            return {}
+
+    def subtasks(self, key: str) -> List[Dict[str, Any]]:
+        """The fields.subtasks entries of an issue"""
+        with self.lock:
+            return [{"id": issue["id"], "key": issue["key"], "self": issue["self"],
+                     "fields": {f: issue["fields"].get(f) for f in ("summary", "status", "priority", "issuetype")}}
+                    for issue in self.issues.values()
+                    if (issue["fields"].get("parent") or {}).get("key") == key and issue["fields"]["issuetype"]["subtask"]]
+
+    def delete_issue(self, key: str, delete_subtasks: bool) -> Optional[str]:
+        """Delete an issue (and its sub-tasks when asked); returns an error message or None"""
+        with self.lock:
+            subtasks = [k for k, issue in self.issues.items()
+                        if (issue["fields"].get("parent") or {}).get("key") == key and issue["fields"]["issuetype"]["subtask"]]
+            if subtasks and not delete_subtasks:
+                return "The issue has subtasks. Set deleteSubtasks to true to delete them along with it."
+            for subtask in subtasks:
+                del self.issues[subtask]
+            del self.issues[key]
+            self._changed()
+            return None
+
+    def add_attachments(self, key: str, files: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Attach uploaded files ({"filename", "mimeType", "content"}) to an issue"""
+        with self.lock:
+            now = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.000+0000")
+            added = []
+            for upload in files:
+                attachment_id = self._id()
+                attachment = {
+                    "id": attachment_id, "self": f"{self.base_url}{API_PREFIX}attachment/{attachment_id}",
+                    "filename": upload["filename"], "author": self.users[0], "created": now,
+                    "size": len(upload["content"]), "mimeType": upload["mimeType"],
+                    "content": f"{self.base_url}{API_PREFIX}attachment/content/{attachment_id}"
+                }
+                self.attachments[attachment_id] = attachment
+                self.attachment_content[attachment_id] = upload["content"]
+                added.append(attachment)
+            fields = self.issues[key]["fields"]
+            fields["attachment"] = [*(fields.get("attachment") or []), *added]
+            self._changed()
+            return added
+
+    _CLAUSE = re.compile(r'^\s*(\w+)\s*(=|!=|not\s+in|in)\s*(.+?)\s*$', re.IGNORECASE)
+
+    def unknown_keys(self, jql: str) -> List[str]:
+        """Issue keys named in key = / key in clauses that do not exist (Jira rejects those queries)"""
+        query = re.split(r"\border\s+by\b", jql or "", maxsplit=1, flags=re.IGNORECASE)[0]
+        keys = []
+        for part in re.split(r"\band\b", query, flags=re.IGNORECASE):
+            match = self._CLAUSE.match(part)
+            if match and match.group(1).lower() == "key":
+                keys += [v.strip().strip('"\'') for v in match.group(3).strip("()").split(",")]
+        with self.lock:
+            return [key for key in keys if key and key not in self.issues]
+
+    def search(self, jql: str) -> List[Dict[str, Any]]:
+        """Evaluate a small JQL subset: AND-ed =, != and in clauses plus ORDER BY created"""
+        query, *order = re.split(r"\border\s+by\b", jql or "", maxsplit=1, flags=re.IGNORECASE)
+        order = order[0] if order else ""
+        clauses = []
+        for part in re.split(r"\band\b", query, flags=re.IGNORECASE):
+            match = self._CLAUSE.match(part)
+            if match:
+                name, op, raw = match.groups()
+                values = {v.strip().strip('"\'') for v in raw.strip("()").split(",")}
+                clauses.append((name.lower(), " ".join(op.lower().split()), values))
+
+        def value_of(issue: Dict[str, Any], name: str) -> Optional[str]:
+            fields = issue["fields"]
+            if name == "key":
+                return issue["key"]
+            if name in ("project", "issuetype", "status", "priority"):
+                return (fields.get(name) or {}).get("key" if name == "project" else "name")
+            if name == "parent":
+                return (fields.get("parent") or {}).get("key")
+            if name == "assignee":
+                return (fields.get("assignee") or {}).get("accountId")
+            return None
+
+        # Checked, evaluated and cached under one lock hold, so a result always matches its version
+        with self.lock:
+            cache_key, cached = self._search_cache
+            if cache_key == (jql, self.version):
+                return cached
+            matched = [issue for issue in self.issues.values()
+                       if all((value_of(issue, name) in values) == (op in ("=", "in")) for name, op, values in clauses)]
+            if "asc" not in order.lower():
+                matched.reverse()
+            self._search_cache = ((jql, self.version), matched)
+        return matched
+
+    def create_meta(self, project_keys: List[str], issue_type_names: List[str]) -> Dict[str, Any]:
+        projects = []
+        for key in project_keys:
+            project = self.projects.get(key)
+            if project is None:
+                continue
+            issue_types = [it for it in self.issue_types if not issue_type_names or it["name"] in issue_type_names]
+            field_meta = {f["id"]: {"name": f["name"], "required": f["id"] in ("summary", "issuetype", "project"),
+                                    "schema": f["schema"]} for f in self.fields}
+            projects.append({"id": project["id"], "key": key, "name": project["name"],
+                             "issuetypes": [{**it, "fields": field_meta} for it in issue_types]})
+        return {"projects": projects}
+
+
+class _TokenBucket:
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.capacity = max(1, burst)
+        self.tokens = float(self.capacity)
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def take(self) -> bool:
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return True
+            return False
+
+
+class MockJiraServer:
+    """Localhost fake of the Jira REST v3 endpoints used by this package
+
+    Serves myself, field, issuetype, project/{key} (+ components, versions),
+    component, version, user/search, search (paginated), issue, issue/{key},
+    issue/bulk and issue/createmeta from in-memory state, with configurable
+    latency, 429 throttling (with Retry-After) and 5xx fault injection so
+    throughput, retry and concurrency behaviour can be exercised offline.
+
+    Usage:
+        with MockJiraServer(MockJiraConfig(latency="uniform:0.02,0.08", rate_limit=20)) as server:
+            server.state.add_project("NEUN", components=["Backend"])
+            os.environ["JIRA_URL"] = server.url
+    """
+
+    def __init__(self, config: Optional[MockJiraConfig] = None, host: str = "127.0.0.1", port: int = 0):
+        self.config = config or MockJiraConfig()
+        self.host = host
+        self.port = port
+        self.state = MockJiraState()
+        self.logger = logging.getLogger(__name__)
+        self._rng = random.Random(self.config.seed)
+        self._rng_lock = threading.Lock()
+        self._latency = parse_latency(self.config.latency)
+        self._endpoint_latency = {k: parse_latency(v) for k, v in self.config.endpoint_latency.items()}
+        self._bucket = _TokenBucket(self.config.rate_limit, self.config.burst) if self.config.rate_limit > 0 else None
+        self._stats_lock = threading.Lock()
+        self.stats: Dict[str, Any] = {"requests": 0, "throttled": 0, "faults": 0, "endpoints": {}}
+        self._server: Optional[ThreadingHTTPServer] = None
+
+    @property
+    def url(self) -> str:
+        return f"http://{self.host}:{self.port}"
+
+    def start(self) -> "MockJiraServer":
+        self._server = ThreadingHTTPServer((self.host, self.port), _make_request_handler(self))
+        self._server.daemon_threads = True
+        self.port = self._server.server_address[1]
+        self.state.base_url = self.url
+        threading.Thread(target=self._server.serve_forever, name="mock-jira", daemon=True).start()
+        self.logger.info(f"Mock Jira listening on {self.url}")
+        return self
+
+    def stop(self) -> None:
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def __enter__(self) -> "MockJiraServer":
+        return self.start()
+
+    def __exit__(self, *exc: Any) -> None:
+        self.stop()
+
+    def reset_stats(self) -> None:
+        with self._stats_lock:
+            self.stats = {"requests": 0, "throttled": 0, "faults": 0, "endpoints": {}}
+
+    def _count(self, name: str, endpoint: str) -> None:
+        with self._stats_lock:
+            self.stats[name] += 1
+            if name == "requests":
+                self.stats["endpoints"][endpoint] = self.stats["endpoints"].get(endpoint, 0) + 1
+
+    def _random(self) -> float:
+        with self._rng_lock:
+            return self._rng.random()
+
+    def inject(self, endpoint: str) -> Optional[Tuple[int, Dict[str, str]]]:
+        """Apply latency and decide whether to fail this request; returns (status, headers) to fail with"""
+        self._count("requests", endpoint)
+        sampler = self._endpoint_latency.get(endpoint, self._latency)
+        with self._rng_lock:
+            delay = sampler(self._rng)
+        if delay > 0:
+            time.sleep(delay)
+
+        if (self._bucket is not None and not self._bucket.take()) or \
+                (self.config.throttle_probability and self._random() < self.config.throttle_probability):
+            self._count("throttled", endpoint)
+            return 429, {"Retry-After": f"{self.config.retry_after:g}"}
+        if self.config.fault_rate and self._random() < self.config.fault_rate:
+            self._count("faults", endpoint)
+            with self._rng_lock:
+                status = self._rng.choice(self.config.fault_statuses)
+            return status, {}
+        return None
+
+    def route(self, method: str, path: str, query: Dict[str, List[str]],
+              body: Any) -> Tuple[int, Any]:
+        """Dispatch one API call to the in-memory state"""
+        state = self.state
+        parts = path.strip("/").split("/")
+        arg = lambda name, default=None: (query.get(name) or [default])[0]
+
+        if method == "GET" and parts == ["myself"]:
+            return 200, state.users[0]
+        if method == "GET" and parts == ["field"]:
+            return 200, state.fields
+        if method == "GET" and parts == ["issuetype"]:
+            return 200, state.issue_types
+        if method == "GET" and parts[0] == "project" and len(parts) >= 2:
+            project = state.project_response(parts[1])
+            if project is None:
+                return 404, {"errorMessages": [f"No project could be found with key '{parts[1]}'."], "errors": {}}
+            if len(parts) == 2:
+                return 200, project
+            if len(parts) == 3 and parts[2] in ("components", "versions"):
+                return 200, project[parts[2]]
+        if method == "POST" and parts in (["component"], ["version"]):
+            if (body or {}).get("project") not in state.projects or not (body or {}).get("name"):
+                return 400, {"errorMessages": [], "errors": {"project": "valid project and name are required"}}
+            add = state.add_component if parts == ["component"] else state.add_version
+            return 201, add(body["project"], body)
+        if method == "GET" and parts == ["user", "search"]:
+            needle = (arg("query") or "").lower()
+            users = [u for u in state.users
+                     if needle and (needle in u["displayName"].lower() or needle == (u.get("emailAddress") or "").lower())]
+            return 200, users[:int(arg("maxResults", 50))]
+        if method == "GET" and parts == ["search"]:
+            return self._search(arg("jql", ""), int(arg("startAt", 0)), int(arg("maxResults", 50)), arg("fields"),
+                                arg("validateQuery", "strict"))
+        if method == "POST" and parts == ["search"]:
+            body = body or {}
+            return self._search(body.get("jql", ""), int(body.get("startAt", 0)), int(body.get("maxResults", 50)),
+                                ",".join(body.get("fields") or []) or None, str(body.get("validateQuery", "strict")))
+        if method == "GET" and parts == ["issue", "createmeta"]:
+            keys = [k for v in query.get("projectKeys", []) for k in v.split(",")]
+            names = [n for v in query.get("issuetypeNames", []) for n in v.split(",")]
+            return 200, state.create_meta(keys, names)
+        if method == "POST" and parts == ["issue"]:
+            issue, errors = state.create_issue((body or {}).get("fields") or {})
+            if errors:
+                return 400, {"errorMessages": [], "errors": errors}
+            return 201, {"id": issue["id"], "key": issue["key"], "self": issue["self"]}
+        if method == "POST" and parts == ["issue", "bulk"]:
+            created, failed = [], []
+            for index, update in enumerate((body or {}).get("issueUpdates") or []):
+                issue, errors = state.create_issue(update.get("fields") or {})
+                if errors:
+                    failed.append({"status": 400, "elementErrors": {"errorMessages": [], "errors": errors},
+                                   "failedElementNumber": index})
+                else:
+                    created.append({"id": issue["id"], "key": issue["key"], "self": issue["self"]})
+            return 201, {"issues": created, "errors": failed}
+        if parts[0] == "issue" and (parts[2:] == ["transitions"] or (method != "GET" and len(parts) == 2)) \
+                and parts[1] not in state.issues:
+            return 404, {"errorMessages": ["Issue does not exist or you do not have permission to see it."], "errors": {}}
+        if method == "GET" and parts[0] == "issue" and parts[2:] == ["transitions"]:
+            return 200, {"transitions": state.transitions(parts[1])}
+        if method == "POST" and parts[0] == "issue" and parts[2:] == ["transitions"]:
+            error = state.transition_issue(parts[1], ((body or {}).get("transition") or {}).get("id"))
+            if error:
+                return 400, {"errorMessages": [error], "errors": {}}
+            return 204, None
+        if method == "PUT" and parts[0] == "issue" and len(parts) == 2:
+            errors = state.edit_issue(parts[1], body or {})
+            if errors:
+                return 400, {"errorMessages": [], "errors": errors}
+            return 204, None
+        if method == "POST" and parts[0] == "issue" and parts[2:] == ["attachments"]:
+            if parts[1] not in state.issues:
+                return 404, {"errorMessages": ["Issue does not exist or you do not have permission to see it."], "errors": {}}
+            if not isinstance(body, list) or not body:
+                return 400, {"errorMessages": ["A multipart body with a 'file' part is required"], "errors": {}}
+            return 200, state.add_attachments(parts[1], body)
+        if method == "GET" and parts[0] == "attachment" and len(parts) == 2:
+            attachment = state.attachments.get(parts[1])
+            if attachment is None:
+                return 404, {"errorMessages": [f"The attachment with id '{parts[1]}' does not exist"], "errors": {}}
+            return 200, attachment
+        if method == "DELETE" and parts[0] == "issue" and len(parts) == 2:
+            error = state.delete_issue(parts[1], arg("deleteSubtasks", "false").lower() == "true")
+            if error:
+                return 400, {"errorMessages": [error], "errors": {}}
+            return 204, None
+        if method == "GET" and parts[0] == "issue" and len(parts) == 2:
+            issue = state.issues.get(parts[1]) or next((i for i in state.issues.values() if i["id"] == parts[1]), None)
+            if issue is None:
+                return 404, {"errorMessages": ["Issue does not exist or you do not have permission to see it."], "errors": {}}
+            return 200, {**issue, "fields": {**issue["fields"], "subtasks": state.subtasks(issue["key"])}}
+        return 404, {"errorMessages": [f"No mock for {method} {path}"], "errors": {}}
+
+    def _search(self, jql: str, start_at: int, max_results: int, fields: Optional[str],
+                validate: str = "strict") -> Tuple[int, Dict[str, Any]]:
+        messages = [f"An issue with key '{key}' does not exist for field 'key'." for key in self.state.unknown_keys(jql)]
+        if messages and validate.lower() in ("strict", "true"):
+            return 400, {"errorMessages": messages, "errors": {}}
+        matched = self.state.search(jql)
+        max_results = max(0, min(max_results, self.config.max_results))
+        page = matched[start_at:start_at + max_results]
+        wanted = {f for f in fields.split(",") if f} if fields and fields not in ("*all", "*navigable") else None
+        issues = [{**issue, "fields": {k: v for k, v in issue["fields"].items() if wanted is None or k in wanted}}
+                  for issue in page]
+        page = {"startAt": start_at, "maxResults": max_results, "total": len(matched), "issues": issues}
+        if messages and validate.lower() == "warn":
+            page["warningMessages"] = messages
+        return 200, page
+
+
+def _make_request_handler(server: MockJiraServer):
+    class MockJiraRequestHandler(BaseHTTPRequestHandler):
+        server_version = "MockJira/1.0"
+        protocol_version = "HTTP/1.1"
+        # Headers and body go out as separate writes; without TCP_NODELAY each keep-alive
+        # response waits on the client's delayed ACK (~40ms) and swamps the configured latency
+        disable_nagle_algorithm = True
+
+        def log_message(self, format: str, *args: Any) -> None:
+            server.logger.debug("%s - %s", self.address_string(), format % args)
+
+        def _respond(self, status: int, body: Any, headers: Optional[Dict[str, str]] = None) -> None:
+            payload = json.dumps(body).encode("utf-8") if body is not None else b""
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(payload)))
+            for name, value in (headers or {}).items():
+                self.send_header(name, value)
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def _respond_content(self, attachment_id: str) -> None:
+            """Attachment bytes, honouring a single "bytes=start-[end]" Range"""
+            content = server.state.attachment_content.get(attachment_id)
+            if content is None:
+                self._respond(404, {"errorMessages": [f"The attachment with id '{attachment_id}' does not exist"], "errors": {}})
+                return
+            status, start, end = 200, 0, len(content)
+            match = re.fullmatch(r"bytes=(\d+)-(\d*)", self.headers.get("Range") or "")
+            if match:
+                start = int(match.group(1))
+                end = min(end, int(match.group(2)) + 1) if match.group(2) else end
+                if start >= len(content):
+                    self._respond(416, None, {"Content-Range": f"bytes */{len(content)}"})
+                    return
+                status = 206
+            attachment = server.state.attachments[attachment_id]
+            self.send_response(status)
+            self.send_header("Content-Type", attachment["mimeType"])
+            self.send_header("Content-Length", str(end - start))
+            if status == 206:
+                self.send_header("Content-Range", f"bytes {start}-{end - 1}/{len(content)}")
+            self.end_headers()
+            self.wfile.write(content[start:end])
+
+        def _parse_multipart(self, raw: bytes) -> List[Dict[str, Any]]:
+            """File parts of a multipart/form-data body"""
+            header = f"Content-Type: {self.headers.get('Content-Type')}\r\n\r\n".encode("latin-1")
+            message = BytesParser(policy=policy.default).parsebytes(header + raw)
+            return [{"filename": part.get_filename(),
+                     "mimeType": part.get_content_type() if part.get("Content-Type") else
+                     mimetypes.guess_type(part.get_filename())[0] or "application/octet-stream",
+                     "content": part.get_payload(decode=True) or b""}
+                    for part in message.iter_parts() if part.get_filename()]
+
+        def _handle(self, method: str) -> None:
+            length = int(self.headers.get("Content-Length") or 0)
+            raw = self.rfile.read(length) if length else b""
+            url = urlsplit(self.path)
+            if not url.path.startswith(API_PREFIX):
+                self._respond(404, {"errorMessages": ["Not a REST v3 path"], "errors": {}})
+                return
+            if not self.headers.get("Authorization"):
+                self._respond(401, {"errorMessages": ["You are not authenticated."], "errors": {}})
+                return
+
+            path = url.path[len(API_PREFIX):]
+            endpoint = f"{method} {endpoint_template(path)}"
+            injected = server.inject(endpoint)
+            if injected is not None:
+                status, headers = injected
+                self._respond(status, {"errorMessages": ["Injected fault" if status != 429 else "Rate limit exceeded"]},
+                              headers)
+                return
+            if method == "GET" and path.startswith("attachment/content/"):
+                self._respond_content(path[len("attachment/content/"):].strip("/"))
+                return
+            try:
+                if (self.headers.get("Content-Type") or "").startswith("multipart/form-data"):
+                    # Jira rejects attachment uploads without the XSRF opt-out header
+                    if (self.headers.get("X-Atlassian-Token") or "").lower() != "no-check":
+                        self._respond(403, {"errorMessages": ["XSRF check failed"], "errors": {}})
+                        return
+                    body = self._parse_multipart(raw)
+                else:
+                    body = json.loads(raw) if raw else None
+            except ValueError:
+                self._respond(400, {"errorMessages": ["Invalid JSON body"], "errors": {}})
+                return
+            status, response = server.route(method, path, parse_qs(url.query), body)
+            self._respond(status, response)
+
+        def do_GET(self) -> None:
+            self._handle("GET")
+
+        def do_POST(self) -> None:
+            self._handle("POST")
+
+        def do_PUT(self) -> None:
+            self._handle("PUT")
+
+        def do_DELETE(self) -> None:
+            self._handle("DELETE")
+
+    return MockJiraRequestHandler
+
+
+def main() -> None:
+    """Run the mock server in the foreground, e.g. for manual load tests"""
+    parser = argparse.ArgumentParser(description="Local mock Jira REST v3 server")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--project", default="NEUN")
+    parser.add_argument("--seed-issues", type=int, default=0, help="Synthetic issues to create in --project")
+    parser.add_argument("--latency", default=None, help='e.g. "uniform:0.02,0.08" or "lognormal:0.05,0.6"')
+    parser.add_argument("--rate-limit", type=float, default=0.0, help="Requests per second before 429s (0 = unlimited)")
+    parser.add_argument("--throttle", type=float, default=0.0, help="Probability of a random 429")
+    parser.add_argument("--retry-after", type=float, default=1.0)
+    parser.add_argument("--fault-rate", type=float, default=0.0, help="Probability of a 5xx response")
+    parser.add_argument("--seed", type=int, default=None, help="Random seed for reproducible runs")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    config = MockJiraConfig(latency=args.latency, rate_limit=args.rate_limit, throttle_probability=args.throttle,
+                            retry_after=args.retry_after, fault_rate=args.fault_rate, seed=args.seed)
+    server = MockJiraServer(config, port=args.port).start()
+    server.state.add_project(args.project)
+    if args.seed_issues:
+        server.state.seed_issues(args.project, args.seed_issues)
+    print(f"Mock Jira running at {server.url} (JIRA_URL={server.url}); Ctrl+C to stop")
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,268 @@
+import os
+import sys
+import json
+import time
+import pstats
+import cProfile
+import logging
+import itertools
+import threading
+import functools
+import contextvars
+from collections import Counter
+from contextlib import contextmanager, nullcontext
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+MODES = ("cprofile", "sample", "all")
+# Stages tagged by profile_span in the handlers
+STAGES = ("load", "validate", "prepare", "send", "persist")
+
+# Returned by profile_span / profile_operation while profiling is off; reusable, so no allocation per call
+_NULL_SPAN = nullcontext()
+
+
+# Operation and stage stack of the current context; ContextThreadPoolExecutor carries both into pool threads
+_current_operation: contextvars.ContextVar = contextvars.ContextVar("jira_profile_operation", default=None)
+_current_stages: contextvars.ContextVar = contextvars.ContextVar("jira_profile_stages", default=())
+
+
+class _Operation:
+    """State of one top-level profiled operation"""
+
+    def __init__(self, name: str, owner: int):
+        self.name = name
+        self.owner = owner
+        self.lock = threading.Lock()
+        self.stage_times: Dict[str, List[float]] = {}
+        self.samples: Counter = Counter()
+        self.sampling = threading.Event()
+
+
+class Profiler:
+    """Per-operation profiler with stage spans
+
+    Disabled by default (enable with JIRA_PROFILE=cprofile|sample|all or
+    --profile). Each profiled operation writes, into JIRA_PROFILE_DIR (<time>
+    is the timestamp with milliseconds, pid and a per-process sequence number):
+      - <operation>-<time>.pstats      deterministic profile (cprofile/all)
+      - <operation>-<time>.collapsed   sampled stacks for flamegraph.pl/speedscope (sample/all),
+                                       rooted at the operation and the active stage
+      - <operation>-<time>.json        wall time per stage
+    cProfile only sees the thread that started the operation; the sampler
+    covers every thread working for it. Operations started concurrently in
+    unrelated contexts (a daemon job and a webhook flush) are profiled
+    separately; one started inside another becomes a span of the outer one.
+    """
+
+    def __init__(self):
+        mode = os.getenv("JIRA_PROFILE", "").strip().lower()
+        self.enabled = False
+        self.mode = "all"
+        self.interval = float(os.getenv("JIRA_PROFILE_INTERVAL", "0.005"))
+        self.output_dir = Path(os.getenv("JIRA_PROFILE_DIR", "data/profiles"))
+        self.logger = logging.getLogger(__name__)
+        self._lock = threading.Lock()
+        self._operations: List[_Operation] = []
+        # Thread ident -> (operation, active stages) of the span or operation it is in, read by the samplers
+        self._threads: Dict[int, Tuple[Optional[_Operation], Tuple[str, ...]]] = {}
+        self._samplers: set = set()
+        # Keeps file names unique when one operation runs several times within a second
+        self._sequence = itertools.count(1)
+        if mode and mode not in ("0", "off", "false"):
+            self.enable(mode if mode in MODES else "all")
+
+    def enable(self, mode: str = "all", output_dir: Optional[str] = None) -> None:
+        if mode not in MODES:
+            raise ValueError(f"Unknown profile mode: {mode} (expected one of {', '.join(MODES)})")
+        self.mode = mode
+        if output_dir:
+            self.output_dir = Path(output_dir)
+        self.enabled = True
+
+    def disable(self) -> None:
+        self.enabled = False
+
+    @contextmanager
+    def _thread_state(self, operation: Optional[_Operation], stages: Tuple[str, ...]) -> Iterator[None]:
+        """Publish this thread's operation and stages to the samplers for the duration of the block"""
+        ident = threading.get_ident()
+        with self._lock:
+            previous = self._threads.get(ident)
+            self._threads[ident] = (operation, stages)
+        try:
+            yield
+        finally:
+            with self._lock:
+                if previous is None:
+                    self._threads.pop(ident, None)
+                else:
+                    self._threads[ident] = previous
+
+    @contextmanager
+    def span(self, stage: str) -> Iterator[None]:
+        """Time a stage and tag samples taken inside it"""
+        operation = _current_operation.get()
+        stages = _current_stages.get() + (stage,)
+        token = _current_stages.set(stages)
+        started = time.perf_counter()
+        try:
+            with self._thread_state(operation, stages):
+                yield
+        finally:
+            elapsed = time.perf_counter() - started
+            _current_stages.reset(token)
+            if operation is not None:
+                with operation.lock:
+                    entry = operation.stage_times.setdefault(stage, [0, 0.0])
+                    entry[0] += 1
+                    entry[1] += elapsed
+
+    @contextmanager
+    def operation(self, name: str) -> Iterator[Optional[Dict[str, Path]]]:
+        """Profile one top-level operation; operations nested in its context only add a span"""
+        if _current_operation.get() is not None:
+            with self.span(name):
+                yield None
+            return
+
+        operation = _Operation(name, threading.get_ident())
+        token = _current_operation.set(operation)
+        stages_token = _current_stages.set(())
+        with self._lock:
+            self._operations.append(operation)
+        profile = cProfile.Profile() if self.mode in ("cprofile", "all") else None
+        sampler = None
+        if self.mode in ("sample", "all"):
+            operation.sampling.set()
+            sampler = threading.Thread(target=self._sample_loop, args=(operation,),
+                                       name="jira-profiler", daemon=True)
+            sampler.start()
+        started = time.perf_counter()
+        paths: Dict[str, Path] = {}
+        try:
+            with self._thread_state(operation, ()):
+                if profile is not None:
+                    profile.enable()
+                try:
+                    yield paths
+                finally:
+                    if profile is not None:
+                        profile.disable()
+        finally:
+            elapsed = time.perf_counter() - started
+            if sampler is not None:
+                operation.sampling.clear()
+                sampler.join()
+            with self._lock:
+                self._operations.remove(operation)
+            _current_stages.reset(stages_token)
+            _current_operation.reset(token)
+            paths.update(self._write(operation, elapsed, profile))
+            self.logger.info(f"Profile of {name} written to {', '.join(str(p) for p in paths.values())}")
+
+    def _sample_loop(self, operation: _Operation) -> None:
+        """Collect stacks of the threads working for an operation until its sampling stops
+
+        Threads outside any profiled span (e.g. idle pool workers) are only
+        attributed when a single operation is running.
+        """
+        me = threading.get_ident()
+        with self._lock:
+            self._samplers.add(me)
+        names = {}
+        try:
+            while operation.sampling.is_set():
+                with self._lock:
+                    threads = dict(self._threads)
+                    alone = len(self._operations) == 1
+                    samplers = set(self._samplers)
+                for ident, frame in sys._current_frames().items():
+                    if ident in samplers:
+                        continue
+                    owner, stages = threads.get(ident, (None, ()))
+                    if owner is not operation and (owner is not None or not alone):
+                        continue
+                    stack = []
+                    while frame is not None:
+                        code = frame.f_code
+                        stack.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})")
+                        frame = frame.f_back
+                    if ident not in names:
+                        names = {t.ident: t.name for t in threading.enumerate()}
+                    root = [f"op:{operation.name}"] if ident == operation.owner else [f"thread:{names.get(ident, ident)}"]
+                    if stages:
+                        root.append(f"stage:{stages[-1]}")
+                    operation.samples[";".join(root + stack[::-1])] += 1
+                time.sleep(self.interval)
+        finally:
+            with self._lock:
+                self._samplers.discard(me)
+
+    def _write(self, operation: _Operation, elapsed: float, profile: Optional[cProfile.Profile]) -> Dict[str, Path]:
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        now = datetime.now()
+        name = operation.name
+        stem = self.output_dir / f"{name}-{now:%Y%m%d-%H%M%S}-{now.microsecond // 1000:03d}-{os.getpid()}-{next(self._sequence)}"
+        paths: Dict[str, Path] = {}
+        if profile is not None:
+            paths["pstats"] = stem.with_suffix(".pstats")
+            profile.dump_stats(str(paths["pstats"]))
+        if operation.samples:
+            paths["collapsed"] = stem.with_suffix(".collapsed")
+            with open(paths["collapsed"], "w", encoding="utf-8") as f:
+                for stack, count in operation.samples.most_common():
+                    f.write(f"{stack} {count}\n")
+        paths["summary"] = stem.with_suffix(".json")
+        summary = {
+            "operation": name,
+            "mode": self.mode,
+            "elapsed_seconds": round(elapsed, 4),
+            "samples": sum(operation.samples.values()),
+            "stages": {stage: {"count": count, "seconds": round(total, 4)}
+                       for stage, (count, total) in sorted(operation.stage_times.items(), key=lambda s: -s[1][1])}
+        }
+        paths["summary"].write_text(json.dumps(summary, indent=2), encoding="utf-8")
+        return paths
+
+    @staticmethod
+    def top_functions(pstats_path: str, limit: int = 20) -> str:
+        """Render the slowest functions (cumulative) of a .pstats file"""
+        from io import StringIO
+        out = StringIO()
+        pstats.Stats(pstats_path, stream=out).sort_stats("cumulative").print_stats(limit)
+        return out.getvalue()
+
+
+# Shared by JiraManager operations and the stage spans in the handlers
+profiler = Profiler()
+
+
+def profile_span(stage: str) -> Any:
+    """Context manager tagging a stage; a shared no-op while profiling is off"""
+    if not profiler.enabled:
+        return _NULL_SPAN
+    return profiler.span(stage)
+
+
+def profile_operation(name: str) -> Any:
+    """Context manager profiling a whole operation; a shared no-op while profiling is off"""
+    if not profiler.enabled:
+        return _NULL_SPAN
+    return profiler.operation(name)
+
+
+def profiled(name: Optional[str] = None) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """Decorator profiling every call as an operation; calls straight through while profiling is off"""
+    def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+        operation = name or func.__name__
+
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            if not profiler.enabled:
+                return func(*args, **kwargs)
+            with profiler.operation(operation):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
@@ -0,0 +1,115 @@
+import os
+import time
+import threading
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple
+
+
+@dataclass(frozen=True)
+class ProjectSnapshot:
+    """Immutable view of a single GET project/{key} response"""
+    key: str
+    id: str
+    name: str
+    project_type: str
+    lead: Mapping[str, Any]
+    issue_types: Tuple[Mapping[str, Any], ...]
+    components: Tuple[Mapping[str, Any], ...]
+    versions: Tuple[Mapping[str, Any], ...]
+    raw: Mapping[str, Any] = field(repr=False)
+    fetched_at: float = field(default_factory=time.time)
+
+    # Expand options needed to serve every project lookup from one request
+    EXPAND = "description,lead,issueTypes"
+
+    @classmethod
+    def from_response(cls, data: Dict[str, Any]) -> "ProjectSnapshot":
+        """Build a snapshot from a project API response"""
+        return cls(
+            key=data.get("key", ""),
+            id=str(data.get("id", "")),
+            name=data.get("name", ""),
+            project_type=data.get("projectTypeKey", ""),
+            lead=MappingProxyType(dict(data.get("lead") or {})),
+            issue_types=tuple(MappingProxyType(dict(it)) for it in data.get("issueTypes", [])),
+            components=tuple(MappingProxyType(dict(c)) for c in data.get("components", [])),
+            versions=tuple(MappingProxyType(dict(v)) for v in data.get("versions", [])),
+            raw=MappingProxyType(data)
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return a mutable copy of the original project response"""
+        return dict(self.raw)
+
+    def issue_type_list(self) -> List[Dict[str, Any]]:
+        """Return the project's issue types as plain dictionaries"""
+        return [dict(it) for it in self.issue_types]
+
+    @property
+    def issue_type_names(self) -> frozenset:
+        return frozenset(it.get("name") for it in self.issue_types)
+
+    @property
+    def component_names(self) -> frozenset:
+        return frozenset(c.get("name") for c in self.components)
+
+    @property
+    def version_names(self) -> frozenset:
+        return frozenset(v.get("name") for v in self.versions)
+
+    def issue_type_by_hierarchy(self, hierarchy_level: int) -> Optional[Mapping[str, Any]]:
+        """Get the first issue type at a hierarchy level (1 Epic, 0 Task, -1 Sub-task)"""
+        return next((it for it in self.issue_types if it.get("hierarchyLevel") == hierarchy_level), None)
+
+    def is_expired(self, ttl_seconds: float) -> bool:
+        return time.time() - self.fetched_at >= ttl_seconds
+
+
+class ProjectSnapshotCache:
+    """Thread-safe, per-project-key memo of ProjectSnapshot objects with a TTL"""
+
+    def __init__(self, ttl_seconds: Optional[float] = None):
+        self.ttl_seconds = ttl_seconds if ttl_seconds is not None else float(os.getenv("JIRA_PROJECT_CACHE_TTL", "300"))
+        self._snapshots: Dict[str, ProjectSnapshot] = {}
+        self._lock = threading.Lock()
+        self._key_locks: Dict[str, threading.Lock] = {}
+
+    def get(self, project_key: str, fetch: Callable[[str], Optional[ProjectSnapshot]],
+            refresh: bool = False) -> Optional[ProjectSnapshot]:
+        """Return the cached snapshot or fetch it once, even under concurrent callers"""
+        with self._lock:
+            snapshot = self._snapshots.get(project_key)
+            if snapshot and not refresh and not snapshot.is_expired(self.ttl_seconds):
+                return snapshot
+            key_lock = self._key_locks.setdefault(project_key, threading.Lock())
+
+        with key_lock:
+            # Another thread may have refreshed it while we waited
+            with self._lock:
+                snapshot = self._snapshots.get(project_key)
+            if snapshot and not refresh and not snapshot.is_expired(self.ttl_seconds):
+                return snapshot
+
+            snapshot = fetch(project_key)
+            if snapshot is not None:
+                with self._lock:
+                    self._snapshots[project_key] = snapshot
+            return snapshot
+
+    def key_for_id(self, project_id: str) -> Optional[str]:
+        """Key of the cached snapshot with this project id, if any"""
+        with self._lock:
+            return next((key for key, snapshot in self._snapshots.items() if snapshot.id == str(project_id)), None)
+
+    def invalidate(self, project_key: Optional[str] = None) -> None:
+        """Drop one or all cached snapshots"""
+        with self._lock:
+            if project_key:
+                self._snapshots.pop(project_key, None)
+            else:
+                self._snapshots.clear()
+
+
+# Shared by every handler in the process so one upload fetches each project once
+project_snapshot_cache = ProjectSnapshotCache()
@@ -0,0 +1,302 @@
+import logging
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from .error_handler import JiraError
+
+SECTIONS = ("counts", "progress", "slippage", "cycle_time", "burndown")
+# Status categories for changelog statuses that are nobody's current status
+DONE_STATUS_NAMES = ["done", "closed", "resolved", "완료"]
+TODO_STATUS_NAMES = ["to do", "open", "backlog", "new", "할 일"]
+DAY = pd.Timedelta(days=1)
+# Flattened columns the report reads; a subset of the analytics export columns
+COLUMNS = ("key", "summary", "issue_type", "hierarchy_level", "status", "status_category", "assignee", "parent",
+           "components", "fix_versions", "created", "resolutiondate", "duedate")
+DATE_COLUMNS = ("created", "resolutiondate", "duedate")
+CATEGORY_COLUMNS = ("issue_type", "status", "status_category", "assignee")
+_EMPTY: Dict[str, Any] = {}
+
+
+def build_frame(issues: List[Dict[str, Any]]) -> pd.DataFrame:
+    """Flatten search result issues into report columns in a single pass"""
+    columns: Dict[str, List[Any]] = {name: [] for name in COLUMNS}
+    (key, summary, issue_type, hierarchy_level, status, status_category, assignee, parent,
+     components, fix_versions, created, resolutiondate, duedate) = (columns[name].append for name in COLUMNS)
+    for issue in issues:
+        fields = issue.get("fields") or _EMPTY
+        issuetype = fields.get("issuetype") or _EMPTY
+        current = fields.get("status") or _EMPTY
+        key(issue.get("key"))
+        summary(fields.get("summary"))
+        issue_type(issuetype.get("name"))
+        hierarchy_level(issuetype.get("hierarchyLevel"))
+        status(current.get("name"))
+        status_category((current.get("statusCategory") or _EMPTY).get("key"))
+        assignee((fields.get("assignee") or _EMPTY).get("displayName"))
+        parent((fields.get("parent") or _EMPTY).get("key"))
+        components([c.get("name") for c in fields.get("components") or ()])
+        fix_versions([v.get("name") for v in fields.get("fixVersions") or ()])
+        created(fields.get("created"))
+        resolutiondate(fields.get("resolutiondate"))
+        duedate(fields.get("duedate"))
+
+    frame = pd.DataFrame(columns)
+    for name in DATE_COLUMNS:
+        frame[name] = pd.to_datetime(frame[name], utc=True, errors="coerce", format="ISO8601")
+    for name in CATEGORY_COLUMNS:
+        frame[name] = frame[name].astype("category")
+    return frame
+
+
+def _percentiles(days: pd.Series) -> Dict[str, Any]:
+    """Summary statistics of a duration series given in days"""
+    if days.empty:
+        return {"count": 0}
+    values = days.to_numpy(dtype=float)
+    p50, p85, p95 = np.percentile(values, [50, 85, 95])
+    return {
+        "count": int(values.size),
+        "mean": round(float(values.mean()), 2),
+        "p50": round(float(p50), 2),
+        "p85": round(float(p85), 2),
+        "p95": round(float(p95), 2),
+        "max": round(float(values.max()), 2)
+    }
+
+
+def _counts(series: pd.Series) -> Dict[str, int]:
+    counts = series.value_counts()
+    return {str(name): int(count) for name, count in counts[counts > 0].items()}
+
+
+class JiraReportHandler:
+    """Analytics over fetched work items, computed column-wise with pandas/NumPy
+
+    The issues are flattened once (the same columns as the analytics export)
+    and every section works on whole columns: counts by status, assignee and
+    component; progress rolled up epic -> task -> subtask through parent
+    links; due date slippage; cycle time from changelogs (fetch with
+    changelog, otherwise created -> resolved lead time); daily burndown.
+    """
+
+    def __init__(self, work_items: Any, as_of: Optional[Any] = None):
+        issues = work_items.get("issues", []) if isinstance(work_items, dict) else list(work_items)
+        self.logger = logging.getLogger(__name__)
+        self.issues = issues
+        self.frame = build_frame(issues)
+        self.as_of = as_of
+        self._positions: Optional[Dict[str, np.ndarray]] = None
+
+    def _reference_time(self, as_of: Optional[Any] = None) -> pd.Timestamp:
+        """Reference time for overdue and burndown: as_of, else the handler's, else now (UTC)"""
+        reference = pd.Timestamp(as_of or self.as_of or datetime.now(timezone.utc))
+        return reference.tz_localize("UTC") if reference.tzinfo is None else reference
+
+    def report(self, sections: Optional[Iterable[str]] = None, days: int = 30,
+               version: Optional[str] = None, as_of: Optional[Any] = None) -> Dict[str, Any]:
+        """Compute the requested sections (default: all)
+
+        as_of applies to this call only, so one handler can serve concurrent
+        reports for different reference times.
+        """
+        sections = list(sections or SECTIONS)
+        unknown = [s for s in sections if s not in SECTIONS]
+        if unknown:
+            raise JiraError(f"Unknown report sections: {', '.join(unknown)}", "INVALID_REPORT",
+                            {"sections": unknown, "supported": list(SECTIONS)}, {"file": "report_handler"})
+        reference = self._reference_time(as_of)
+        result: Dict[str, Any] = {"issues": len(self.frame), "as_of": reference.isoformat()}
+        if self.frame.empty:
+            return {**result, **{section: {} for section in sections}}
+        for section in sections:
+            if section == "burndown":
+                result[section] = self.burndown(days, version, as_of=reference)
+            elif section == "slippage":
+                result[section] = self.slippage(as_of=reference)
+            else:
+                result[section] = getattr(self, section)()
+        return result
+
+    def counts(self) -> Dict[str, Dict[str, int]]:
+        """Issue counts by status, status category, assignee, component and issue type"""
+        f = self.frame
+        return {
+            "status": _counts(f["status"]),
+            "status_category": _counts(f["status_category"]),
+            "assignee": _counts(f["assignee"].astype(object).fillna("Unassigned")),
+            "component": _counts(f["components"].explode().dropna()),
+            "issue_type": _counts(f["issue_type"])
+        }
+
+    def _hierarchy(self) -> Dict[str, np.ndarray]:
+        """Row positions of each issue's parent, task and epic (-1 when none)"""
+        if self._positions is None:
+            f = self.frame
+            count = len(f)
+            parent = pd.Index(f["key"]).get_indexer(f["parent"])
+            # Issue types without hierarchyLevel are placed by name
+            names = f["issue_type"].astype(object).fillna("").str.lower()
+            by_name = np.where(names == "epic", 1, np.where(names.str.contains("sub|하위"), -1, 0))
+            levels = pd.to_numeric(f["hierarchy_level"], errors="coerce").fillna(pd.Series(by_name, index=f.index)).to_numpy()
+            ancestors = {}
+            for name, level in (("task", 0), ("epic", 1)):
+                found = np.full(count, -1)
+                current = np.arange(count)
+                # Subtask -> task -> epic: at most three steps up
+                for _ in range(3):
+                    valid = current >= 0
+                    safe = np.where(valid, current, 0)
+                    hit = valid & (found < 0) & (levels[safe] == level)
+                    found[hit] = current[hit]
+                    current = np.where(valid, parent[safe], -1)
+                ancestors[name] = found
+            has_children = np.zeros(count, dtype=bool)
+            has_children[parent[parent >= 0]] = True
+            self._positions = {"parent": parent, "levels": levels, "leaf": ~has_children, **ancestors}
+        return self._positions
+
+    def progress_frame(self, level: str = "epic") -> pd.DataFrame:
+        """Progress per epic or task: done share of the leaf issues below it (itself when it has none)"""
+        f = self.frame
+        positions = self._hierarchy()
+        done = (f["status_category"] == "done").to_numpy()
+        owner = positions[level]
+        leaves = positions["leaf"] & (owner >= 0)
+        total = np.bincount(owner[leaves], minlength=len(f))
+        finished = np.bincount(owner[leaves], weights=done[leaves], minlength=len(f)).astype(int)
+        children = np.bincount(positions["parent"][positions["parent"] >= 0], minlength=len(f))
+        rows = positions["levels"] == (1 if level == "epic" else 0)
+        result = pd.DataFrame({
+            "key": f["key"].to_numpy()[rows],
+            "summary": f["summary"].to_numpy()[rows],
+            "status": f["status"].astype(object).to_numpy()[rows],
+            "children": children[rows],
+            "leaves": total[rows],
+            "done": finished[rows]
+        })
+        result["percent"] = np.round(100.0 * result["done"] / result["leaves"].where(result["leaves"] > 0), 1)
+        return result
+
+    def progress(self) -> Dict[str, Any]:
+        """Per-epic rollup plus overall and per-task completion"""
+        positions = self._hierarchy()
+        done = (self.frame["status_category"] == "done").to_numpy()
+        leaf_done = done[positions["leaf"]]
+        tasks = self.progress_frame("task")
+        epics = self.progress_frame("epic").sort_values("key")
+        return {
+            "overall_percent": round(100.0 * leaf_done.mean(), 1) if leaf_done.size else None,
+            "tasks": {
+                "total": int(len(tasks)),
+                "done": int((tasks["percent"] == 100).sum()),
+                "in_progress": int(((tasks["percent"] > 0) & (tasks["percent"] < 100)).sum()),
+                "not_started": int((tasks["percent"] == 0).sum())
+            },
+            "epics": epics.replace({np.nan: None}).to_dict(orient="records")
+        }
+
+    def slippage(self, top: int = 10, as_of: Optional[Any] = None) -> Dict[str, Any]:
+        """Due date slippage: resolved late and still open past the due date (in days)"""
+        f = self.frame
+        reference = self._reference_time(as_of)
+        # A due date covers the whole day
+        due_end = f["duedate"] + DAY
+        resolved = f["resolutiondate"]
+        has_due = due_end.notna()
+        slip = (resolved.fillna(reference) - due_end).dt.total_seconds() / 86400
+        late = has_due & resolved.notna() & (slip > 0)
+        overdue = has_due & resolved.isna() & (slip > 0)
+        worst = f.loc[overdue, ["key", "assignee"]].assign(days=slip[overdue].round(1)).nlargest(top, "days")
+        return {
+            "with_due_date": int(has_due.sum()),
+            "resolved_on_time": int((has_due & resolved.notna() & ~late).sum()),
+            "resolved_late": int(late.sum()),
+            "open_overdue": int(overdue.sum()),
+            "resolved_late_days": _percentiles(slip[late]),
+            "open_overdue_days": _percentiles(slip[overdue]),
+            "most_overdue": worst.astype({"assignee": object}).replace({np.nan: None}).to_dict(orient="records")
+        }
+
+    def _status_transitions(self) -> pd.DataFrame:
+        """One row per status change found in the issues' changelogs (by frame row)"""
+        rows: List[int] = []
+        times: List[str] = []
+        statuses: List[str] = []
+        for row, issue in enumerate(self.issues):
+            for history in (issue.get("changelog") or _EMPTY).get("histories", ()):
+                for item in history.get("items", ()):
+                    if item.get("field") == "status":
+                        rows.append(row)
+                        times.append(history.get("created"))
+                        statuses.append(item.get("toString"))
+        return pd.DataFrame({
+            "row": np.asarray(rows, dtype=np.int64),
+            "time": pd.to_datetime(pd.Series(times, dtype=object), utc=True, errors="coerce", format="ISO8601"),
+            "status": statuses
+        })
+
+    def cycle_time(self) -> Dict[str, Any]:
+        """Days from first entering an in-progress status to last entering a done status
+
+        Without changelogs this falls back to created -> resolved lead time.
+        """
+        f = self.frame
+        done = f["status_category"] == "done"
+        transitions = self._status_transitions()
+        if transitions.empty:
+            lead = (f.loc[done, "resolutiondate"] - f.loc[done, "created"]).dt.total_seconds() / 86400
+            lead = lead.dropna()
+            by_type = lead.groupby(f.loc[lead.index, "issue_type"].astype(object)).median().round(2)
+            return {"method": "lead_time", **_percentiles(lead), "p50_by_issue_type": by_type.to_dict()}
+
+        # Categorize changelog statuses by the categories seen on current statuses
+        category_of = f[["status", "status_category"]].astype(object).drop_duplicates("status").set_index("status")
+        categories = transitions["status"].map(category_of["status_category"])
+        names = transitions["status"].str.lower()
+        categories = categories.fillna(pd.Series(np.where(names.isin(DONE_STATUS_NAMES), "done",
+                                                          np.where(names.isin(TODO_STATUS_NAMES), "new", "indeterminate")),
+                                                 index=transitions.index))
+        started = transitions[categories == "indeterminate"].groupby("row")["time"].min()
+        finished = transitions[categories == "done"].groupby("row")["time"].max()
+        spans = pd.concat([started.rename("start"), finished.rename("end")], axis=1, join="inner")
+        spans = spans[(spans["end"] > spans["start"]) & done.to_numpy()[spans.index.to_numpy()]]
+        cycle = (spans["end"] - spans["start"]).dt.total_seconds() / 86400
+        types = f["issue_type"].astype(object).to_numpy()[cycle.index.to_numpy()]
+        return {
+            "method": "changelog",
+            **_percentiles(cycle),
+            "p50_by_issue_type": cycle.groupby(types).median().round(2).to_dict()
+        }
+
+    def burndown(self, days: int = 30, version: Optional[str] = None, as_of: Optional[Any] = None) -> Dict[str, Any]:
+        """Daily created, resolved and remaining open issues over the last days
+
+        Args:
+            days: Length of the series ending at as_of
+            version: Only count issues with this fix version
+            as_of: End of the series (default: the handler's as_of, else now)
+        """
+        f = self.frame
+        if version:
+            in_version = f["fix_versions"].explode().eq(version).groupby(level=0).any()
+            f = f[in_version.reindex(f.index, fill_value=False)]
+        end = self._reference_time(as_of).floor("D")
+        dates = pd.date_range(end - (max(days, 1) - 1) * DAY, end, freq="D")
+        created = f["created"].dt.floor("D")
+        resolved = f["resolutiondate"].dt.floor("D")
+        open_at_start = int(((created < dates[0]) & ~(resolved < dates[0])).sum())
+        created_daily = created[created >= dates[0]].value_counts().reindex(dates, fill_value=0)
+        resolved_daily = resolved[resolved >= dates[0]].value_counts().reindex(dates, fill_value=0)
+        remaining = open_at_start + created_daily.cumsum() - resolved_daily.cumsum()
+        return {
+            "version": version,
+            "scope": int(len(f)),
+            "open_at_start": open_at_start,
+            "series": [
+                {"date": date.strftime("%Y-%m-%d"), "created": int(c), "resolved": int(r), "remaining": int(left)}
+                for date, c, r, left in zip(dates, created_daily.to_numpy(), resolved_daily.to_numpy(), remaining.to_numpy())
+            ]
+        }
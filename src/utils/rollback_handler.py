@@ -0,0 +1,202 @@
+import os
+import time
+import logging
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from .connect_handler import JiraConnectHandler, RateLimiter
+from .create_handler import CREATION_JOURNAL, JOURNAL_COMPACT_EVERY
+from .get_handler import JiraGetHandler
+from .json_handler import JsonHandler
+from .error_handler import JiraError, JiraAPIError, error_context, ContextThreadPoolExecutor
+
+# Deletion order: sub-tasks, then tasks, then epics
+LEVELS = (("subtasks", -1), ("tasks", 0), ("epics", 1))
+
+
+class JiraRollbackHandler:
+    """Delete the issues an upload created, newest level first
+
+    The issues come from the creation journal (by run_id) or from an upload
+    result's created_issues. Sub-tasks go first, then tasks, then epics, each
+    level in parallel. A task whose current sub-tasks were all created by
+    the run is deleted with deleteSubtasks=true instead of one call per
+    sub-task (journal entries carry the parent). A task that has gained
+    sub-tasks since is kept: only its created sub-tasks are deleted, one by
+    one, and the plan lists the others. Deletes are paced by their own token
+    bucket (JIRA_DELETE_RATE per second, default 10) on top of the shared
+    rate limit.
+    """
+
+    def __init__(self, connect_handler: Optional[JiraConnectHandler] = None,
+                 get_handler: Optional[JiraGetHandler] = None, max_workers: int = 4,
+                 rate: Optional[float] = None):
+        self.connect_handler = connect_handler or JiraConnectHandler(pool_size=max(10, max_workers * 2))
+        # Deleted issues are dropped from the local work items store (when a get handler is given)
+        self.get_handler = get_handler
+        self.max_workers = max_workers
+        self.limiter = RateLimiter(rate if rate is not None else float(os.getenv("JIRA_DELETE_RATE", "10")))
+        self.logger = logging.getLogger(__name__)
+        self._journal = None
+
+    @property
+    def journal(self):
+        """The creation journal written by JiraCreateHandler"""
+        if self._journal is None:
+            self._journal = JsonHandler().open_log(CREATION_JOURNAL, key_field="key",
+                                                   compact_every=JOURNAL_COMPACT_EVERY)
+        return self._journal
+
+    def list_runs(self) -> List[Dict[str, Any]]:
+        """Upload runs in the journal (oldest first) with their remaining created issue counts"""
+        runs: Dict[str, Dict[str, Any]] = {}
+        deleted = set()
+        for record in self.journal:
+            if record.get("event") == "deleted":
+                deleted.add(record.get("key"))
+            elif record.get("event") == "created" and record.get("run_id"):
+                run = runs.setdefault(record["run_id"], {"run_id": record["run_id"], "project": record.get("project"),
+                                                         "started": record.get("timestamp"), "keys": []})
+                run["keys"].append(record.get("key"))
+        return [{**{k: v for k, v in run.items() if k != "keys"},
+                 "issues": sum(1 for key in run["keys"] if key not in deleted)} for run in runs.values()]
+
+    def _journal_items(self, run_ids: Iterable[str]) -> List[Dict[str, Any]]:
+        """Created, not yet deleted journal entries of the given runs"""
+        wanted = set(run_ids)
+        created: Dict[str, Dict[str, Any]] = {}
+        for record in self.journal:
+            key = record.get("key")
+            if record.get("event") == "created" and record.get("run_id") in wanted and key:
+                created[key] = {"key": key, "level": record.get("hierarchy_level"), "parent": record.get("parent"),
+                                "summary": record.get("summary"), "run_id": record.get("run_id")}
+            elif record.get("event") == "deleted":
+                created.pop(key, None)
+        return list(created.values())
+
+    def _current_subtasks(self, key: str) -> Optional[List[str]]:
+        """Keys of an issue's sub-tasks right now, or None if the issue no longer exists"""
+        response = self.connect_handler._make_request("GET", f"issue/{key}", params={"fields": "subtasks"})
+        if response.status_code == 404:
+            return None
+        if response.status_code != 200:
+            raise JiraAPIError(f"Failed to read sub-tasks of {key}: {response.status_code}",
+                               str(response.status_code), {"response": response.text[:500]})
+        return [subtask["key"] for subtask in (response.json().get("fields") or {}).get("subtasks") or []]
+
+    def plan(self, run_ids: Optional[List[str]] = None,
+             created_issues: Optional[Dict[str, Dict[str, str]]] = None) -> Dict[str, Any]:
+        """What a rollback would delete, level by level, and how many delete calls it takes
+
+        Args:
+            run_ids: Upload runs looked up in the creation journal
+            created_issues: An upload result's {"epics"|"tasks"|"subtasks": {summary: key}} instead
+        """
+        if run_ids:
+            items = self._journal_items(run_ids)
+        elif created_issues:
+            items = [{"key": key, "level": level, "parent": None, "summary": summary, "run_id": None}
+                     for name, level in LEVELS for summary, key in (created_issues.get(name) or {}).items()]
+        else:
+            raise JiraError("A run id or created issues are required for a rollback", "INVALID_ROLLBACK",
+                            {}, {"file": "rollback_handler"})
+
+        keys = {item["key"] for item in items}
+        created_subtasks: Dict[str, set] = {}
+        for item in items:
+            if item["level"] == -1 and item["parent"] in keys:
+                created_subtasks.setdefault(item["parent"], set()).add(item["key"])
+        # deleteSubtasks=true would also take sub-tasks added by hand since the upload
+        parents = sorted(created_subtasks)
+        with ContextThreadPoolExecutor(max_workers=max(1, self.max_workers)) as executor:
+            current = dict(zip(parents, executor.map(self._current_subtasks, parents)))
+        kept = {parent: sorted(set(subtasks) - created_subtasks[parent])
+                for parent, subtasks in current.items() if subtasks is not None and set(subtasks) - created_subtasks[parent]}
+        # Sub-tasks whose parent is deleted with deleteSubtasks=true need no call of their own
+        covered = {key: parent for parent, created in created_subtasks.items() if parent not in kept for key in created}
+        levels: Dict[str, List[Dict[str, Any]]] = {name: [] for name, _ in LEVELS}
+        for item in items:
+            name = next((n for n, level in LEVELS if level == item["level"]), None)
+            if name is None or item["key"] in covered:
+                continue
+            levels[name].append({**item, "delete_subtasks": item["key"] in created_subtasks and item["key"] not in kept,
+                                 **({"kept_subtasks": kept[item["key"]]} if item["key"] in kept else {})})
+        return {
+            "run_ids": list(run_ids or []),
+            "issues": len(items),
+            "calls": sum(1 for level in levels.values() for item in level if "kept_subtasks" not in item),
+            "levels": levels,
+            "covered": covered,
+            # Parents that are not deleted because they have sub-tasks the run did not create
+            "kept": kept
+        }
+
+    def _delete(self, item: Dict[str, Any]) -> Dict[str, Any]:
+        key = item["key"]
+        if item.get("kept_subtasks"):
+            return {"result": "skipped",
+                    "reason": f"has sub-tasks not created by the upload: {', '.join(item['kept_subtasks'])}"}
+        params = {"deleteSubtasks": "true"} if item.get("delete_subtasks") else {}
+        with error_context(issue=key, operation="rollback"):
+            self.limiter.acquire()
+            try:
+                response = self.connect_handler._make_request("DELETE", f"issue/{key}", params=params)
+            except JiraError as e:
+                return {"result": "failed", "error": str(e)}
+        if response.status_code == 204:
+            return {"result": "deleted"}
+        if response.status_code == 404:
+            return {"result": "missing"}
+        return {"result": "failed", "status_code": response.status_code, "error": response.text[:500]}
+
+    def rollback(self, plan: Dict[str, Any], progress: Optional[Callable[[Dict[str, Any]], None]] = None) -> Dict[str, Any]:
+        """Delete the issues of a plan; returns per-issue results and counts"""
+        started = time.perf_counter()
+        results: Dict[str, Dict[str, Any]] = {}
+        by_key = {item["key"]: item for level in plan["levels"].values() for item in level}
+
+        def delete(item: Dict[str, Any]) -> None:
+            result = self._delete(item)
+            results[item["key"]] = result
+            if progress is not None:
+                progress({"event": "rollback", "issue": item["key"], **result})
+
+        with ContextThreadPoolExecutor(max_workers=max(1, self.max_workers)) as executor:
+            for name, _ in LEVELS:
+                level = plan["levels"].get(name) or []
+                if level:
+                    self.logger.info(f"Deleting {len(level)} {name}")
+                    # A level finishes before the next one starts, so parents outlive their children
+                    list(executor.map(delete, level))
+
+        for key, parent in plan.get("covered", {}).items():
+            parent_result = results.get(parent, {}).get("result")
+            results[key] = {"result": parent_result, "via": parent} if parent_result in ("deleted", "missing") else \
+                {"result": "failed", "error": f"parent {parent} was not deleted"}
+
+        gone = [key for key, result in results.items() if result["result"] in ("deleted", "missing")]
+        self._record(gone, plan, by_key)
+        counts = {"deleted": 0, "missing": 0, "skipped": 0, "failed": 0}
+        for result in results.values():
+            counts[result["result"]] += 1
+        return {
+            "success": counts["failed"] == 0,
+            "run_ids": plan.get("run_ids", []),
+            "kept": plan.get("kept", {}),
+            "total": len(results),
+            **counts,
+            "calls": plan["calls"],
+            "elapsed_seconds": round(time.perf_counter() - started, 3),
+            "issues": results
+        }
+
+    def _record(self, keys: List[str], plan: Dict[str, Any], by_key: Dict[str, Dict[str, Any]]) -> None:
+        """Journal the deletions and drop the issues from the local work items"""
+        timestamp = datetime.now().isoformat(timespec="seconds")
+        for key in keys:
+            item = by_key.get(key) or by_key.get(plan["covered"].get(key), {})
+            self.journal.append({"event": "deleted", "run_id": item.get("run_id"), "key": key,
+                                 "timestamp": timestamp})
+        self.journal.flush()
+        if self.get_handler is not None and self.get_handler.discard_work_items(keys):
+            self.get_handler.flush_local_changes()
@@ -0,0 +1,131 @@
+import os
+import time
+import logging
+import threading
+from typing import Dict, Iterable, List, Optional, Any
+
+from .connect_handler import JiraConnectHandler
+from .json_handler import JsonHandler
+from .error_handler import JiraError
+
+
+class JiraUserHandler:
+    """Resolve assignee values from YAML files to Jira Cloud accountIds
+
+    Results are memoized in a user directory file with a TTL, so each distinct
+    assignee costs a single user search until its entry expires.
+    """
+
+    def __init__(self, connect_handler: JiraConnectHandler, json_handler: Optional[JsonHandler] = None,
+                 cache_file: str = "user_directory.json", ttl_seconds: Optional[int] = None,
+                 negative_ttl_seconds: int = 3600):
+        self.connect = connect_handler
+        self.json_handler = json_handler or JsonHandler()
+        self.cache_file = cache_file
+        self.ttl_seconds = ttl_seconds if ttl_seconds is not None else int(os.getenv("JIRA_USER_CACHE_TTL", "86400"))
+        self.negative_ttl_seconds = negative_ttl_seconds
+        self.logger = logging.getLogger(__name__)
+
+        # identifier -> {"accountId": str | None, "displayName": str, "resolved_at": float}
+        self._directory: Optional[Dict[str, Dict[str, Any]]] = None
+        self._lock = threading.RLock()
+
+    def _load_directory(self) -> Dict[str, Dict[str, Any]]:
+        """Load the on-disk user directory once per handler"""
+        if self._directory is None:
+            try:
+                self._directory = self.json_handler.load_json(self.cache_file) or {}
+            except JiraError as e:
+                self.logger.warning(f"Ignoring unreadable user directory {self.cache_file}: {str(e)}")
+                self._directory = {}
+        return self._directory
+
+    def cached_account_id(self, identifier: str) -> Optional[str]:
+        """Get the accountId from the user directory without searching (None when not cached)"""
+        with self._lock:
+            return self._load_directory().get(str(identifier).strip(), {}).get("accountId")
+
+    def _is_fresh(self, entry: Dict[str, Any]) -> bool:
+        """Check whether a cached directory entry is still within its TTL"""
+        ttl = self.ttl_seconds if entry.get("accountId") else self.negative_ttl_seconds
+        return time.time() - entry.get("resolved_at", 0) < ttl
+
+    def _search_user(self, identifier: str) -> Dict[str, Any]:
+        """Look up a single identifier through the user search endpoint
+
+        Args:
+            identifier: Email, display name or accountId from the YAML file
+
+        Returns:
+            Directory entry with the resolved accountId (None when not found)
+        """
+        response = self.connect._make_request("GET", "user/search", params={"query": identifier, "maxResults": 10})
+        users = response.json() if response.status_code == 200 else []
+        users = [u for u in users if u.get("active", True) and u.get("accountType", "atlassian") == "atlassian"]
+
+        needle = identifier.lower()
+        match = None
+        for key in ("accountId", "emailAddress", "displayName"):
+            match = next((u for u in users if str(u.get(key, "")).lower() == needle), None)
+            if match:
+                break
+        if match is None and len(users) == 1:
+            match = users[0]
+
+        if match is None:
+            self.logger.warning(f"Could not resolve assignee '{identifier}' ({len(users)} candidates)")
+
+        return {
+            "accountId": match.get("accountId") if match else None,
+            "displayName": match.get("displayName", "") if match else "",
+            "resolved_at": time.time()
+        }
+
+    def resolve_users(self, identifiers: Iterable[str]) -> Dict[str, Optional[str]]:
+        """Resolve a set of assignee identifiers to accountIds in one pass
+
+        Cached entries within their TTL are reused; only the remaining distinct
+        identifiers are searched, and the directory is written back once.
+
+        Args:
+            identifiers: Assignee values collected from the roadmap
+
+        Returns:
+            Mapping of identifier to accountId (None when unresolved)
+        """
+        distinct = sorted({str(i).strip() for i in identifiers if i and str(i).strip()})
+        # Held for the whole pass so concurrent uploads never search the same user twice
+        with self._lock:
+            directory = self._load_directory()
+            pending: List[str] = [i for i in distinct if i not in directory or not self._is_fresh(directory[i])]
+
+            if pending:
+                self.logger.info(f"Resolving {len(pending)} of {len(distinct)} assignees via user search")
+                for identifier in pending:
+                    try:
+                        directory[identifier] = self._search_user(identifier)
+                    except JiraError as e:
+                        self.logger.warning(f"User search failed for '{identifier}': {str(e)}")
+                self.json_handler.save_json(directory, self.cache_file)
+
+            return {i: directory.get(i, {}).get("accountId") for i in distinct}
+
+    def get_account_id(self, identifier: str) -> Optional[str]:
+        """Get the accountId for a single identifier, searching on a cache miss"""
+        return self.resolve_users([identifier]).get(str(identifier).strip())
+
+    @staticmethod
+    def collect_assignees(data: Dict[str, Any]) -> List[str]:
+        """Collect every distinct assignee from a roadmap YAML structure"""
+        assignees = set()
+
+        def walk(items: List[Dict[str, Any]]) -> None:
+            for item in items or []:
+                if item.get("assignee"):
+                    assignees.add(str(item["assignee"]).strip())
+                walk(item.get("tasks", []))
+                walk(item.get("subtasks", []))
+
+        walk(data.get("epics", []))
+        walk(data.get("tasks", []))
+        return sorted(assignees)
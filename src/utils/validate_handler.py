@@ -1,8 +1,7 @@
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Set
 from .error_handler import error_handler, JiraError, JiraDataError
 from .connect_handler import JiraConnectHandler
 from .json_handler import JsonHandler
-import pandas as pd
 
 class JiraValidateHandler:
     def __init__(self, connect_handler: JiraConnectHandler):
@@ -12,30 +11,44 @@ class JiraValidateHandler:
     @error_handler
     def validate_project(self, project_key: str) -> bool:
         """Validate if a project exists"""
-        project = self.connect.get_project(project_key)
-        return project is not None
+        return self.connect.get_project_snapshot(project_key) is not None
 
     @error_handler
     def validate_component(self, project_key: str, component_name: str) -> bool:
         """Validate if a component exists in the project"""
-        response = self.connect._make_request("GET", f"project/{project_key}/components")
-        components = response.json()
-        return any(comp["name"] == component_name for comp in components)
+        return component_name in self._snapshot(project_key).component_names
 
     @error_handler
     def validate_version(self, project_key: str, version_name: str) -> bool:
         """Validate if a version exists in the project"""
-        response = self.connect._make_request("GET", f"project/{project_key}/versions")
-        versions = response.json()
-        return any(ver["name"] == version_name for ver in versions)
+        return version_name in self._snapshot(project_key).version_names
+
+    def _snapshot(self, project_key: str):
+        """Get the project snapshot or raise if the project cannot be read"""
+        snapshot = self.connect.get_project_snapshot(project_key)
+        if snapshot is None:
+            raise JiraError(
+                f"Project {project_key} does not exist",
+                "INVALID_PROJECT",
+                {"project_key": project_key},
+                {"file": "project_config"}
+            )
+        return snapshot
+
+    @error_handler
+    def get_component_names(self, project_key: str) -> Set[str]:
+        """Get the names of all components in the project"""
+        return set(self._snapshot(project_key).component_names)
+
+    @error_handler
+    def get_version_names(self, project_key: str) -> Set[str]:
+        """Get the names of all versions in the project"""
+        return set(self._snapshot(project_key).version_names)
 
     @error_handler
     def validate_issue_type(self, project_key: str, issue_type: str) -> bool:
         """Validate if an issue type is available for the project"""
-        response = self.connect._make_request("GET", f"project/{project_key}")
-        project_data = response.json()
-        issue_types = project_data.get("issueTypes", [])
-        return any(it["name"] == issue_type for it in issue_types)
+        return issue_type in self._snapshot(project_key).issue_type_names
 
     @error_handler
     def validate_epic(self, epic_key: str) -> bool:
@@ -74,9 +87,7 @@ class JiraValidateHandler:
     @error_handler
     def get_available_issue_types(self, project_key: str) -> List[Dict[str, Any]]:
         """Get all available issue types for a project"""
-        response = self.connect._make_request("GET", f"project/{project_key}")
-        project_data = response.json()
-        return project_data.get("issueTypes", [])
+        return self._snapshot(project_key).issue_type_list()
 
     @error_handler
     def validate_field(self, field_name: str) -> bool:
@@ -130,6 +141,8 @@ class JiraValidateHandler:
             Dict[str, Any]: Cleaned fields dictionary
         """
         try:
+            import pandas as pd
+            
             # Load field_map from JSON
             field_map_df = pd.DataFrame.from_dict(self.json_handler.load_json("field_map.json"), orient='index')
             
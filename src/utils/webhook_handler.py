@@ -0,0 +1,295 @@
+import os
+import json
+import time
+import hmac
+import hashlib
+import logging
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+from .error_handler import JiraError, JiraDataError
+from .get_handler import JiraGetHandler
+from .project_snapshot import project_snapshot_cache
+
+ISSUE_EVENTS = ("jira:issue_created", "jira:issue_updated", "jira:issue_deleted")
+# Version events also include released, unreleased, moved and merged
+DELETE_SUFFIXES = ("_deleted", "_merged")
+
+
+class JiraWebhookReceiver:
+    """Apply Jira webhook events to the local caches instead of polling search
+
+    Issue created/updated/deleted events update the work items store of a
+    JiraGetHandler (in memory at once, on disk every flush_interval seconds).
+    Version and component events update the loaded metadata caches, and any
+    project, version or component event drops the cached project snapshot.
+    Redelivered or out-of-order events are skipped by their timestamp per
+    entity; a periodic full fetch is still the reconciliation step.
+
+    Endpoints:
+        POST /webhook   Jira webhook payload (also accepted on /)
+        GET  /health    counts of applied, duplicate, stale and ignored events
+    """
+
+    def __init__(self, get_handler: JiraGetHandler, host: str = "127.0.0.1", port: int = 8766,
+                 secret: Optional[str] = None, flush_interval: Optional[float] = None):
+        self.get_handler = get_handler
+        self.host = host
+        self.port = port
+        # Checked against X-Hub-Signature (HMAC-SHA256 of the body) or a ?token= query parameter
+        self.secret = secret if secret is not None else os.getenv("JIRA_WEBHOOK_SECRET") or None
+        self.flush_interval = flush_interval if flush_interval is not None else \
+            float(os.getenv("JIRA_WEBHOOK_FLUSH", "2.0"))
+        self.logger = logging.getLogger(__name__)
+
+        self._lock = threading.RLock()
+        # Entity ("issue:KEY", "version:ID", ...) -> (timestamp, event) of the last applied event
+        self._last_seen: Dict[str, Tuple[int, str]] = {}
+        self.stats = {"applied": 0, "duplicate": 0, "stale": 0, "ignored": 0}
+        self._stopping = threading.Event()
+        self._flusher: Optional[threading.Thread] = None
+        self._server: Optional[ThreadingHTTPServer] = None
+
+    @staticmethod
+    def _entity(event: Dict[str, Any]) -> Optional[str]:
+        name = event.get("webhookEvent", "")
+        if name in ISSUE_EVENTS and event.get("issue"):
+            return f"issue:{event['issue'].get('key')}"
+        for kind in ("version", "component", "project"):
+            if isinstance(event.get(kind), dict) and kind in name:
+                return f"{kind}:{event[kind].get('id')}"
+        return None
+
+    @staticmethod
+    def _validate(event: Dict[str, Any]) -> None:
+        """Reject payloads that parse as JSON but cannot be applied"""
+        def invalid(reason: str) -> JiraDataError:
+            return JiraDataError(f"Invalid webhook payload: {reason}", "INVALID_WEBHOOK",
+                                 {"event": event.get("webhookEvent")}, {"file": "webhook_handler"})
+
+        timestamp = event.get("timestamp")
+        if timestamp is not None and not (isinstance(timestamp, int) and not isinstance(timestamp, bool)) and \
+                not (isinstance(timestamp, str) and timestamp.isdigit()):
+            raise invalid(f"timestamp must be epoch milliseconds, got {timestamp!r}")
+        if event.get("webhookEvent") in ISSUE_EVENTS and event.get("issue") is not None:
+            issue = event["issue"]
+            if not isinstance(issue, dict):
+                raise invalid("issue is not an object")
+            key = issue.get("key")
+            if not isinstance(key, str) or "-" not in key:
+                raise invalid(f"issue.key must be an issue key, got {key!r}")
+            if not isinstance(issue.get("fields") or {}, dict) or not isinstance(event.get("changelog") or {}, dict):
+                raise invalid("issue.fields and changelog must be objects")
+
+    def apply(self, event: Dict[str, Any]) -> Dict[str, Any]:
+        """Apply one webhook payload
+
+        Returns:
+            {"result": "applied" | "duplicate" | "stale" | "ignored", ...}
+
+        Raises:
+            JiraDataError: for a malformed timestamp or issue
+        """
+        self._validate(event)
+        name = event.get("webhookEvent", "")
+        entity = self._entity(event)
+        if entity is None:
+            return self._count("ignored", event=name, reason="unsupported event")
+
+        timestamp = int(event.get("timestamp") or 0)
+        with self._lock:
+            last = self._last_seen.get(entity)
+            if timestamp and last is not None:
+                if timestamp < last[0]:
+                    return self._count("stale", event=name, entity=entity)
+                if (timestamp, name) == last:
+                    return self._count("duplicate", event=name, entity=entity)
+            # Applied under the lock so two deliveries for one entity cannot interleave
+            reason = self._apply(name, entity.split(":", 1)[0], event)
+            if reason:
+                return self._count("ignored", event=name, entity=entity, reason=reason)
+            if timestamp:
+                self._last_seen[entity] = (timestamp, name)
+        return self._count("applied", event=name, entity=entity)
+
+    def _count(self, result: str, **details: Any) -> Dict[str, Any]:
+        with self._lock:
+            self.stats[result] += 1
+        return {"result": result, **details}
+
+    def _apply(self, name: str, kind: str, event: Dict[str, Any]) -> Optional[str]:
+        """Apply an event; returns why it was ignored, or None"""
+        deleted = name.endswith(DELETE_SUFFIXES)
+        if kind == "issue":
+            return self._apply_issue(name, event)
+
+        item = event[kind]
+        if kind == "project":
+            project_snapshot_cache.invalidate(item.get("key"))
+            return None
+
+        # Versions and components carry the project id (components may carry the key instead)
+        project_key = item.get("projectKey") or item.get("project") or \
+            project_snapshot_cache.key_for_id(item.get("projectId", ""))
+        if project_key:
+            project_snapshot_cache.invalidate(project_key)
+        if project_key and project_key != self.get_handler.project_key:
+            return "other project"
+        cache_key = f"{kind}s"
+        if not project_key:
+            # Unknown project id: only apply when it matches the entries already cached
+            cached = self.get_handler._cache.get(cache_key) or []
+            if not any(str(c.get("projectId")) == str(item.get("projectId")) for c in cached):
+                return "other project"
+        self.get_handler.apply_metadata(cache_key, str(item.get("id")), None if deleted else item)
+        return None
+
+    def _apply_issue(self, name: str, event: Dict[str, Any]) -> Optional[str]:
+        issue = event["issue"]
+        key = issue.get("key")
+        fields = issue.get("fields") or {}
+        project_key = (fields.get("project") or {}).get("key") or key.rsplit("-", 1)[0]
+        changes = {item.get("field"): item for item in (event.get("changelog") or {}).get("items", [])}
+        old_key = (changes.get("Key") or {}).get("fromString")
+
+        if old_key and old_key != key and old_key.rsplit("-", 1)[0] == self.get_handler.project_key:
+            # Moved (to another project or issue type): the old key no longer exists
+            self.get_handler.apply_work_item(old_key, None)
+            if project_key != self.get_handler.project_key:
+                return None
+        if project_key != self.get_handler.project_key:
+            return "other project"
+        if name == "jira:issue_deleted":
+            self.get_handler.apply_work_item(key, None)
+            return None
+        self.get_handler.apply_work_item(key, {
+            "id": issue.get("id"),
+            "self": issue.get("self"),
+            "key": key,
+            "fields": {field: fields[field] for field in self.get_handler.work_item_fields() if field in fields}
+        })
+        return None
+
+    def verify(self, body: bytes, signature: Optional[str], token: Optional[str]) -> bool:
+        """Check the HMAC signature header or the shared token against the secret"""
+        if not self.secret:
+            return True
+        if token and hmac.compare_digest(token, self.secret):
+            return True
+        if signature:
+            expected = "sha256=" + hmac.new(self.secret.encode("utf-8"), body, hashlib.sha256).hexdigest()
+            return hmac.compare_digest(signature, expected)
+        return False
+
+    def health(self) -> Dict[str, Any]:
+        return {
+            "status": "stopping" if self._stopping.is_set() else "ok",
+            "project_key": self.get_handler.project_key,
+            "tracked_entities": len(self._last_seen),
+            "events": dict(self.stats)
+        }
+
+    def _flush_loop(self) -> None:
+        while not self._stopping.wait(self.flush_interval):
+            self.flush()
+
+    def flush(self) -> None:
+        try:
+            written = self.get_handler.flush_local_changes()
+            if written:
+                self.logger.info(f"Webhook changes written: {', '.join(written)}")
+        except (JiraError, OSError) as e:
+            self.logger.error(f"Failed to write webhook changes: {str(e)}")
+
+    def start(self) -> "JiraWebhookReceiver":
+        """Start the HTTP server and the periodic flush (in background threads)"""
+        self._stopping.clear()
+        self._flusher = threading.Thread(target=self._flush_loop, name="jira-webhook-flush", daemon=True)
+        self._flusher.start()
+        self._server = ThreadingHTTPServer((self.host, self.port), _make_request_handler(self))
+        self._server.daemon_threads = True
+        self.port = self._server.server_address[1]
+        threading.Thread(target=self._server.serve_forever, name="jira-webhook-http", daemon=True).start()
+        self.logger.info(f"Jira webhook receiver listening on http://{self.host}:{self.port}/webhook")
+        return self
+
+    def serve_forever(self) -> None:
+        """Run until interrupted"""
+        if self._server is None:
+            self.start()
+        try:
+            while not self._stopping.wait(0.5):
+                pass
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self.shutdown()
+
+    def shutdown(self) -> None:
+        """Stop the server and write pending changes"""
+        self._stopping.set()
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+        if self._flusher is not None:
+            self._flusher.join()
+            self._flusher = None
+        self.flush()
+
+
+def _make_request_handler(receiver: JiraWebhookReceiver):
+    class WebhookRequestHandler(BaseHTTPRequestHandler):
+        server_version = "JiraWebhook/1.0"
+
+        def log_message(self, format: str, *args: Any) -> None:
+            receiver.logger.debug("%s - %s", self.address_string(), format % args)
+
+        def _send_json(self, status: int, body: Any) -> None:
+            payload = json.dumps(body, ensure_ascii=False, default=str).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def do_GET(self) -> None:
+            if urlsplit(self.path).path.strip("/") == "health":
+                self._send_json(200, receiver.health())
+            else:
+                self._send_json(404, {"error": "Not found"})
+
+        def do_POST(self) -> None:
+            url = urlsplit(self.path)
+            if url.path.strip("/") not in ("", "webhook"):
+                self._send_json(404, {"error": "Not found"})
+                return
+            body = self.rfile.read(int(self.headers.get("Content-Length") or 0))
+            token = parse_qs(url.query).get("token", [None])[0]
+            if not receiver.verify(body, self.headers.get("X-Hub-Signature"), token):
+                self._send_json(401, {"error": "Missing or invalid webhook signature"})
+                return
+            try:
+                event = json.loads(body or b"{}")
+                if not isinstance(event, dict):
+                    raise ValueError("payload is not an object")
+            except ValueError as e:
+                self._send_json(400, {"error": f"Invalid webhook payload: {e}"})
+                return
+            started = time.perf_counter()
+            try:
+                result = receiver.apply(event)
+            except JiraDataError as e:
+                self._send_json(400, {"error": str(e)})
+                return
+            except Exception as e:
+                # A status code (rather than a dropped connection) lets Jira's retry logic take over
+                receiver.logger.error(f"Failed to apply webhook event {event.get('webhookEvent')}: {str(e)}")
+                self._send_json(500, {"error": f"Failed to apply webhook event: {e}"})
+                return
+            result["elapsed_ms"] = round((time.perf_counter() - started) * 1000, 3)
+            self._send_json(200, result)
+
+    return WebhookRequestHandler
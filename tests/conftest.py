@@ -0,0 +1,21 @@
+import os
+import sys
+
+import pytest
+
+# Modules are imported the way main.py imports them: "from utils.x import ..."
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+
+@pytest.fixture
+def mock_jira(tmp_path, monkeypatch):
+    """A mock Jira server with the handler environment pointed at it and data files under tmp_path"""
+    from utils.mock_server import MockJiraServer, MockJiraConfig
+    with MockJiraServer(MockJiraConfig(seed=1)) as server:
+        server.state.add_project("NEUN")
+        for name, value in (("JIRA_INSTANCE", server.url), ("EMAIL", "mock@example.com"), ("API_TOKEN", "mock"),
+                            ("PROJECT_KEY", "NEUN"), ("JIRA_DATA_DIR", str(tmp_path / "data"))):
+            monkeypatch.setenv(name, value)
+        monkeypatch.delenv("JIRA_URL", raising=False)
+        monkeypatch.delenv("JIRA_CASSETTE_MODE", raising=False)
+        yield server
@@ -0,0 +1,48 @@
+import hashlib
+import os
+import threading
+
+from utils.attachment_handler import JiraAttachmentHandler
+
+
+def _attach(mock_jira, content):
+    state = mock_jira.state
+    issue, _ = state.create_issue({"project": {"key": "NEUN"}, "summary": "with file", "issuetype": {"name": "Task"}})
+    attachment, = state.add_attachments(issue["key"], [{"filename": "a.bin", "mimeType": "application/octet-stream",
+                                                         "content": content}])
+    return issue["key"], {**attachment, "issue": issue["key"]}
+
+
+def test_concurrent_downloads_of_one_attachment(mock_jira, tmp_path):
+    content = os.urandom(300_000)
+    _, attachment = _attach(mock_jira, content)
+    handlers = [JiraAttachmentHandler(mirror_dir=str(tmp_path / "mirror")) for _ in range(2)]
+    barrier = threading.Barrier(4)
+    results = []
+
+    def download(handler):
+        barrier.wait()
+        try:
+            results.append(handler.download(attachment))
+        except Exception as e:
+            results.append({"result": "raised", "error": repr(e)})
+
+    threads = [threading.Thread(target=download, args=(handlers[n % 2],)) for n in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(results) == 4
+    assert {r["result"] for r in results} <= {"downloaded", "skipped"}, results
+    assert all(r["sha256"] == hashlib.sha256(content).hexdigest() for r in results)
+    assert handlers[0].path_for(attachment["id"]).read_bytes() == content
+    assert not list((tmp_path / "mirror" / "partial").iterdir())
+
+
+def test_mirror_skips_missing_keys_and_saves_the_index(mock_jira, tmp_path):
+    key, attachment = _attach(mock_jira, b"hello")
+    handler = JiraAttachmentHandler(mirror_dir=str(tmp_path / "mirror"))
+    result = handler.mirror_attachments(keys=[key, "NEUN-999"])
+    assert (result["attachments"], result["downloaded"], result["failed"]) == (1, 1, 0)
+    again = JiraAttachmentHandler(mirror_dir=str(tmp_path / "mirror")).mirror_attachments(keys=[key])
+    assert again["skipped"] == 1
@@ -0,0 +1,57 @@
+from utils.bulk_handler import JiraBulkHandler
+
+
+def _tasks(mock_jira, count, issuetype="Task"):
+    state = mock_jira.state
+    return [state.create_issue({"project": {"key": "NEUN"}, "summary": f"{issuetype} {i}",
+                                "issuetype": {"name": issuetype}})[0]["key"] for i in range(count)]
+
+
+def test_transitions_are_looked_up_once_per_type_and_status(mock_jira):
+    keys = _tasks(mock_jira, 12) + _tasks(mock_jira, 4, "Story")
+    mock_jira.state.transition_issue(keys[0], "21")
+    mock_jira.reset_stats()
+
+    handler = JiraBulkHandler(max_workers=4)
+    result = handler.bulk_transition("Done", keys=keys)
+    assert result["success"] and result["updated"] == 16 and result["retried"] == 0
+    # Task/To Do, Task/In Progress and Story/To Do
+    assert result["transition_lookups"] == 3
+    assert mock_jira.stats["endpoints"]["GET issue/{key}/transitions"] == 3
+    assert mock_jira.stats["endpoints"]["POST issue/{key}/transitions"] == 16
+    assert {i["fields"]["status"]["name"] for i in mock_jira.state.search("project = NEUN")} == {"Done"}
+
+    # The cache outlives a run; issues already at the target are skipped without a request
+    again = handler.bulk_transition("In Progress", keys=keys[:2])
+    assert again["updated"] == 2 and again["transition_lookups"] == 4
+
+
+def test_failed_transitions_are_retried_with_fresh_issue_data(mock_jira):
+    keys = _tasks(mock_jira, 6)
+    handler = JiraBulkHandler(max_workers=3)
+    lookup = handler.get_transitions
+    moved = []
+
+    def lookup_then_move(key, group=None):
+        # Someone else finishes an issue after the To Do transitions were cached, so its first attempt fails
+        transitions = lookup(key, group)
+        if not moved:
+            moved.append(next(k for k in keys if k != key))
+            mock_jira.state.transition_issue(moved[0], "31")
+        return transitions
+
+    handler.get_transitions = lookup_then_move
+    result = handler.bulk_transition("Done", keys=keys + ["NEUN-404"])
+    assert result["retried"] == 1
+    assert result["issues"][moved[0]] == {"result": "skipped", "reason": "already Done", "attempts": 2}
+    assert result["updated"] == 5 and result["failed"] == 0
+    assert all(result["issues"][key]["attempts"] == 1 for key in keys if key != moved[0])
+    assert result["missing"] == ["NEUN-404"] and not result["success"]
+
+
+def test_bulk_edit_applies_field_operations(mock_jira):
+    keys = _tasks(mock_jira, 5)
+    result = JiraBulkHandler(max_workers=2).bulk_edit(update={"labels": [{"add": "q3"}]},
+                                                      jql="project = NEUN AND issuetype = Task")
+    assert result["success"] and result["updated"] == 5
+    assert all(mock_jira.state.issues[key]["fields"]["labels"] == ["q3"] for key in keys)
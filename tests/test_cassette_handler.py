@@ -0,0 +1,37 @@
+import json
+
+import requests
+
+from utils.cassette_handler import Cassette
+from utils.connect_handler import JiraConnectHandler
+
+
+def test_record_then_replay_round_trip(mock_jira, tmp_path, monkeypatch):
+    path = tmp_path / "cassette.jsonl"
+    # Secrets are redacted wherever they appear, so keep the token out of the mock's ids
+    monkeypatch.setenv("API_TOKEN", "cassette-test-token")
+    monkeypatch.setenv("JIRA_CASSETTE", str(path))
+    monkeypatch.setenv("JIRA_CASSETTE_TIMING", "0")
+    monkeypatch.setenv("JIRA_CASSETTE_MODE", "record")
+    recorder = JiraConnectHandler()
+    recorded = recorder._make_request("GET", "project/NEUN")
+    recorder.cassette.close()
+    assert "cassette-test-token" not in path.read_text(encoding="utf-8")
+
+    monkeypatch.setenv("JIRA_CASSETTE_MODE", "replay")
+    player = JiraConnectHandler()
+    replayed = player._make_request("GET", "project/NEUN")
+    assert replayed.status_code == recorded.status_code
+    assert replayed.json() == recorded.json()
+    assert player.cassette.remaining() == 0
+
+
+def test_recording_replaces_the_previous_cassette(mock_jira, tmp_path):
+    path = tmp_path / "cassette.jsonl"
+    session = requests.Session()
+    for endpoint in ("project/NEUN", "field"):
+        cassette = Cassette(str(path), mode="record", base_url=mock_jira.url)
+        cassette.request(session, "GET", f"{mock_jira.url}/rest/api/3/{endpoint}")
+        cassette.close()
+    routes = [json.loads(line)["route"] for line in path.read_text(encoding="utf-8").splitlines()]
+    assert routes == ["GET /rest/api/3/field"]
@@ -0,0 +1,34 @@
+import logging
+
+from utils.daemon_handler import JiraDaemon
+from utils.error_handler import ContextThreadPoolExecutor
+
+logger = logging.getLogger("test.daemon")
+logger.setLevel(logging.INFO)
+
+
+def _fan_out(params, progress):
+    with ContextThreadPoolExecutor(max_workers=2) as executor:
+        list(executor.map(lambda n: logger.info(f"item {n}"), range(3)))
+    return "done"
+
+
+def test_pool_thread_logs_reach_job_events():
+    daemon = JiraDaemon({"fan_out": _fan_out}, port=0).start()
+    try:
+        job = daemon.submit("fan_out")
+        start = 0
+        while not job.finished:
+            start = len(job.wait_events(start, timeout=5))
+        messages = {event.get("message") for event in job.events if event["event"] == "log"}
+        assert {"item 0", "item 1", "item 2"} <= messages
+    finally:
+        daemon.shutdown()
+
+
+def test_cancel_only_queued_jobs():
+    daemon = JiraDaemon({"fan_out": _fan_out})
+    job = daemon.submit("fan_out")
+    assert daemon.cancel(job.id)
+    assert job.status == "cancelled"
+    assert not daemon.cancel(job.id)
@@ -0,0 +1,39 @@
+import json
+import time
+import uuid
+
+import pytest
+
+from utils.error_handler import ErrorHandler, JiraError, PACKAGE_ROOT, error_context, error_handler
+
+
+@error_handler
+def _fail(message="boom"):
+    raise ValueError(message)
+
+
+def test_unexpected_error_carries_text_traceback_and_context():
+    with error_context(issue="NEUN-1"), pytest.raises(JiraError) as raised:
+        _fail()
+    details = raised.value.details
+    assert isinstance(details["traceback"], str)
+    assert "ValueError: boom" in details["traceback"]
+    assert details["issue"] == "NEUN-1"
+
+
+def test_log_file_lives_under_the_repository_root():
+    ErrorHandler()
+    log_file = PACKAGE_ROOT / "logs" / "jira_errors.log"
+    message = uuid.uuid4().hex
+    with pytest.raises(JiraError):
+        _fail(message)
+    # Records are written by the background listener
+    deadline = time.time() + 5
+    while True:
+        records = [json.loads(line) for line in log_file.read_text(encoding="utf-8").splitlines()]
+        if any(message in r["message"] for r in records) or time.time() > deadline:
+            break
+        time.sleep(0.05)
+    record = next(r for r in records if message in r["message"])
+    assert record["error_type"] == "ValueError"
+    assert f"ValueError: {message}" in record["traceback"]
@@ -0,0 +1,28 @@
+import pytest
+
+from utils.export_handler import JiraExportHandler
+
+pytest.importorskip("pyarrow")
+
+
+def _issue(key, created, status="To Do"):
+    return {"key": key, "id": key.split("-")[1], "fields": {
+        "summary": f"Issue {key}", "created": created, "labels": ["a", "b"],
+        "status": {"name": status, "statusCategory": {"key": "new"}},
+        "issuetype": {"name": "Task", "hierarchyLevel": 0}
+    }}
+
+
+@pytest.mark.parametrize("fmt", ["parquet", "arrow"])
+def test_export_round_trip_prunes_partitions_and_columns(tmp_path, fmt):
+    handler = JiraExportHandler(base_dir=str(tmp_path), fmt=fmt)
+    handler.export_work_items({"issues": [
+        _issue("NEUN-1", "2026-01-05T10:00:00.000+0000"),
+        _issue("NEUN-2", "2026-02-05T10:00:00.000+0000", status="Done"),
+        _issue("OTHER-1", "2026-01-07T10:00:00.000+0000")
+    ]})
+    frame = handler.load_frame(columns=["key", "status", "labels"], projects=["NEUN"], months=["2026-01"])
+    assert list(frame.columns) == ["key", "status", "labels"]
+    assert frame["key"].tolist() == ["NEUN-1"]
+    assert list(frame["labels"][0]) == ["a", "b"]
+    assert sorted(handler.load_frame(columns=["key"], projects=["NEUN"])["key"]) == ["NEUN-1", "NEUN-2"]
@@ -0,0 +1,13 @@
+from utils.get_handler import JiraGetHandler
+
+
+def test_local_issue_reader_follows_new_snapshot(mock_jira):
+    handler = JiraGetHandler()
+    handler.json_handler.write_snapshot([{"key": "NEUN-1", "summary": "old"}], "work_items.snap")
+    assert handler.get_local_issue("NEUN-1")["summary"] == "old"
+    reader = handler._snapshot[1]
+    assert handler.get_local_issue("NEUN-1")["summary"] == "old"
+    assert handler._snapshot[1] is reader
+    handler.json_handler.write_snapshot([{"key": "NEUN-1", "summary": "new"}], "work_items.snap")
+    assert handler.get_local_issue("NEUN-1")["summary"] == "new"
+    assert handler._snapshot[1] is not reader
@@ -0,0 +1,79 @@
+from utils.hierarchy_index import HierarchyIndex
+
+
+def _issue(key, issuetype, parent=None, status="done", **fields):
+    fields = {"summary": key, "issuetype": {"name": issuetype},
+              "status": {"name": status, "statusCategory": {"key": status}}, **fields}
+    if parent:
+        fields["parent"] = {"key": parent}
+    return {"key": key, "fields": fields}
+
+
+def _index():
+    return HierarchyIndex.build([
+        _issue("NEUN-1", "Epic", status="new"),
+        _issue("NEUN-2", "Epic", status="new"),
+        _issue("NEUN-3", "Task", "NEUN-1", status="new"),
+        _issue("NEUN-4", "Task", "NEUN-1"),
+        _issue("NEUN-5", "Sub-task", "NEUN-3"),
+        _issue("NEUN-6", "Sub-task", "NEUN-3", status="indeterminate"),
+    ])
+
+
+def test_build_links_parents_and_children():
+    index = _index()
+    assert index.children("NEUN-1") == ["NEUN-3", "NEUN-4"]
+    assert index.ancestors("NEUN-5") == ["NEUN-3", "NEUN-1"]
+    assert index.epic_of("NEUN-6") == "NEUN-1"
+    assert index.roots() == ["NEUN-1", "NEUN-2"]
+    assert list(index.iter_subtree("NEUN-1")) == ["NEUN-1", "NEUN-3", "NEUN-5", "NEUN-6", "NEUN-4"]
+    assert index.rollup("NEUN-1")["percent"] == 66.7
+
+
+def test_upsert_reparents_a_task_with_its_subtasks():
+    index = _index()
+    index.upsert(_issue("NEUN-3", "Task", "NEUN-2", status="new"))
+    assert index.children("NEUN-1") == ["NEUN-4"]
+    assert index.children("NEUN-2") == ["NEUN-3"]
+    assert index.parent("NEUN-3") == "NEUN-2"
+    assert index.epic_of("NEUN-5") == "NEUN-2"
+    assert list(index.iter_subtree("NEUN-2")) == ["NEUN-2", "NEUN-3", "NEUN-5", "NEUN-6"]
+    assert index.rollup("NEUN-1")["percent"] == 100.0
+
+    # Dropping the parent leaves a root; an unchanged parent keeps the sibling order
+    index.upsert(_issue("NEUN-4", "Task"))
+    assert index.children("NEUN-1") == [] and index.rollup("NEUN-1")["leaves"] == 1
+    assert index.roots() == ["NEUN-1", "NEUN-2", "NEUN-4"]
+    index.upsert(_issue("NEUN-5", "Sub-task", "NEUN-3", status="new"))
+    assert index.children("NEUN-3") == ["NEUN-5", "NEUN-6"]
+    assert index.node("NEUN-5")["status"] == "new"
+
+
+def test_remove_unlinks_the_node_only():
+    index = _index()
+    index.remove("NEUN-6")
+    assert "NEUN-6" not in index
+    assert index.children("NEUN-3") == ["NEUN-5"]
+    assert index.parent("NEUN-6") is None
+
+    index.remove("NEUN-3")
+    assert len(index) == 4
+    assert index.children("NEUN-1") == ["NEUN-4"]
+    # The orphaned subtask still points at its removed parent, so it shows up as a root
+    assert index.parent("NEUN-5") == "NEUN-3"
+    assert "NEUN-5" in index.roots()
+    assert list(index.iter_subtree("NEUN-1")) == ["NEUN-1", "NEUN-4"]
+    index.remove("NEUN-404")
+    assert len(index) == 4
+
+
+def test_epic_link_field_and_cycles():
+    index = HierarchyIndex.build([
+        _issue("NEUN-1", "Epic"),
+        _issue("NEUN-2", "Task", customfield_10014="NEUN-1"),
+        _issue("NEUN-3", "Task", "NEUN-4"),
+        _issue("NEUN-4", "Task", "NEUN-3"),
+    ], epic_link_field="customfield_10014")
+    assert index.parent("NEUN-2") == "NEUN-1"
+    assert len(index.ancestors("NEUN-3")) <= 8
+    assert list(index.iter_subtree("NEUN-3")) == ["NEUN-3", "NEUN-4"]
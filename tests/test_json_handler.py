@@ -0,0 +1,114 @@
+import os
+import stat
+
+import pytest
+
+from utils.error_handler import JiraDataError, JiraFileError
+from utils.json_handler import JsonHandler, iter_json_array
+
+
+def test_append_json_extends_existing_list(tmp_path):
+    handler = JsonHandler(base_dir=str(tmp_path))
+    handler.save_json([1, 2], "a.json")
+    handler.append_json(3, "a.json")
+    assert handler.load_json("a.json") == [1, 2, 3]
+
+
+def test_append_json_round_trip(tmp_path):
+    handler = JsonHandler(base_dir=str(tmp_path))
+    handler.append_json({"n": 1}, "b.json")
+    handler.append_json({"n": 2}, "b.json")
+    assert handler.load_json("b.json") == [{"n": 1}, {"n": 2}]
+
+
+def test_append_json_wraps_existing_object(tmp_path):
+    handler = JsonHandler(base_dir=str(tmp_path))
+    handler.save_json({"n": 1}, "c.json")
+    handler.append_json({"n": 2}, "c.json")
+    assert handler.load_json("c.json") == [{"n": 1}, {"n": 2}]
+
+
+def test_append_json_jsonl_round_trip(tmp_path):
+    handler = JsonHandler(base_dir=str(tmp_path))
+    handler.append_json({"n": 1}, "d.jsonl")
+    handler.append_json({"n": 2}, "d.jsonl")
+    assert handler.load_json("d.jsonl") == [{"n": 1}, {"n": 2}]
+    assert (tmp_path / "d.jsonl").read_text().count("\n") == 2
+
+
+def test_iter_jira_tasks_rejects_missing_work_items(tmp_path):
+    handler = JsonHandler(base_dir=str(tmp_path))
+    for name, data in (("empty.json", {}), ("dict.json", {"work_items": {}}), ("other.json", {"items": []})):
+        handler.save_json(data, name)
+        with pytest.raises(JiraDataError):
+            handler.process_jira_tasks(name)
+
+
+def test_process_jira_tasks_splits_items(tmp_path):
+    handler = JsonHandler(base_dir=str(tmp_path))
+    base = {"project_key": "NEUN", "description": "d", "priority": "Medium", "labels": [], "components": [],
+            "fix_versions": []}
+    handler.save_json({"work_items": [
+        {**base, "issue_type": "Epic", "summary": "E"},
+        {**base, "issue_type": "Task", "summary": "T",
+         "subtasks": [{"summary": "S", "description": "d", "issue_type": "Sub-task"}, {"summary": "bad"}]},
+        {"summary": "incomplete"}
+    ]}, "tasks.json")
+    results = handler.process_jira_tasks("tasks.json")
+    assert [len(results[k]) for k in ("epics", "tasks", "subtasks", "errors")] == [1, 1, 1, 2]
+    assert results["subtasks"][0]["parent_summary"] == "T"
+
+
+def test_snapshot_embeds_index(tmp_path):
+    handler = JsonHandler(base_dir=str(tmp_path))
+    handler.write_snapshot([{"key": "A-1", "n": 1}, {"key": "A-2", "n": 2}], "items.snap")
+    assert [p.name for p in tmp_path.iterdir()] == ["items.snap"]
+    with handler.open_snapshot("items.snap") as reader:
+        assert reader.get("A-2") == {"key": "A-2", "n": 2}
+        assert [record["n"] for record in reader] == [1, 2]
+
+
+def test_save_json_keeps_file_mode(tmp_path):
+    handler = JsonHandler(base_dir=str(tmp_path))
+    path = handler.save_json({"n": 1}, "new.json")
+    umask = os.umask(0)
+    os.umask(umask)
+    assert stat.S_IMODE(os.stat(path).st_mode) == 0o666 & ~umask
+    os.chmod(path, 0o640)
+    handler.save_json({"n": 2}, "new.json")
+    assert stat.S_IMODE(os.stat(path).st_mode) == 0o640
+    assert handler.load_json("new.json") == {"n": 2}
+
+
+def test_open_log_adopts_settings_of_first_keyed_opener(tmp_path):
+    handler = JsonHandler(base_dir=str(tmp_path))
+    handler.append_json({"key": "A-1", "n": 1}, "journal.jsonl")
+    log = handler.open_log("journal.jsonl", key_field="key")
+    assert log is handler.open_log("journal.jsonl")
+    assert log.get_by_key("A-1") == {"key": "A-1", "n": 1}
+    with pytest.raises(JiraFileError):
+        handler.open_log("journal.jsonl", key_field="id")
+
+
+def test_open_log_compacts_periodically(tmp_path):
+    handler = JsonHandler(base_dir=str(tmp_path))
+    log = handler.open_log("compacted.jsonl", key_field="key", flush_every=1, compact_every=4)
+    for n in range(4):
+        log.append({"key": f"A-{n % 2}", "n": n})
+    assert len(log) == 2
+    assert log.get_by_key("A-0") == {"key": "A-0", "n": 2}
+    assert [record["n"] for record in handler.load_json("compacted.jsonl")] == [2, 3]
+
+
+def test_iter_json_array_scalars_across_chunk_edges(tmp_path):
+    text = '{"v": 1.5, "work_items": [1.25, -2e10, true, null, false, 3]}'
+    path = tmp_path / "scalars.json"
+    path.write_text(text, encoding="utf-8")
+    for chunk_size in range(1, len(text) + 1):
+        assert list(iter_json_array(path, "work_items", chunk_size=chunk_size)) == [1.25, -2e10, True, None, False, 3]
+
+
+def test_iter_json_array_number_at_default_chunk_edge(tmp_path):
+    path = tmp_path / "edge.json"
+    path.write_text('{"a": "' + "x" * 65519 + '", "v": 1.5, "work_items": [1, 2]}', encoding="utf-8")
+    assert list(iter_json_array(path, "work_items")) == [1, 2]
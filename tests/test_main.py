@@ -0,0 +1,109 @@
+import os
+import sys
+import json
+import time
+import subprocess
+
+import pytest
+
+from main import JiraManager, run_cli
+from utils.metrics_handler import metrics
+
+ROADMAP = """project: NEUN
+epics:
+  - summary: Epic
+    description: An epic
+    tasks:
+      - summary: Task
+        description: A task
+        subtasks:
+          - summary: Subtask
+            description: A subtask
+"""
+
+
+def test_pipelined_sync_creates_after_fields_and_fetches_new_issues(mock_jira, tmp_path):
+    roadmap = tmp_path / "roadmap.yaml"
+    roadmap.write_text(ROADMAP, encoding="utf-8")
+    manager = JiraManager()
+    events = {}
+    get_fields = manager.get_handler.get_fields_to_json
+    create = manager.create_jira_issues_batch
+
+    def slow_fields(*args, **kwargs):
+        time.sleep(0.3)
+        result = get_fields(*args, **kwargs)
+        events["fields_done"] = time.perf_counter()
+        return result
+
+    def timed_create(*args, **kwargs):
+        events["create_started"] = time.perf_counter()
+        return create(*args, **kwargs)
+
+    manager.get_handler.get_fields_to_json = slow_fields
+    manager.create_jira_issues_batch = timed_create
+    result = manager.pipelined_sync(str(roadmap))
+    assert result["upload"]["success"]
+    assert events["fields_done"] <= events["create_started"]
+    summaries = {issue["fields"]["summary"] for issue in result["fetch"]["work_items"]["issues"]}
+    assert {"Epic", "Task", "Subtask"} <= summaries
+    assert manager.create_handler.project_key == "NEUN"
+
+
+@pytest.fixture
+def cli(mock_jira, monkeypatch, tmp_path):
+    """run_cli against the mock; its process-wide settings are put back afterwards"""
+    from utils.connect_handler import rate_limiter
+    monkeypatch.setenv("JIRA_PAGE_SIZE", "100")
+    monkeypatch.setenv("JIRA_METRICS_DIR", str(tmp_path / "metrics"))
+    yield mock_jira
+    rate_limiter.set_rate(0)
+    metrics.disable()
+    metrics.reset()
+
+
+def test_headless_fetch_prints_and_writes_the_report(cli, tmp_path, capsys):
+    cli.state.seed_issues("NEUN", 120)
+    path = tmp_path / "report.json"
+    code = run_cli(["--jobs", "3", "--batch-size", "50", "--report", str(path), "fetch", "--types", "work_items"])
+    # Progress output goes to stderr, so stdout is the report alone
+    report = json.loads(capsys.readouterr().out)
+    assert code == 0 and report == json.loads(path.read_text(encoding="utf-8"))
+    assert report["command"] == "fetch" and report["success"]
+    assert report["result"] == {"work_items": 120}
+    assert report["settings"]["jobs"] == 3 and report["settings"]["batch_size"] == 50
+    # At least three search pages of 50
+    assert report["requests"] >= 3 and report["failures"] == {"requests": 0, "errors": 0}
+    assert set(report["throughput"]) == {"issues_per_second", "requests_per_second"}
+
+
+def test_headless_plan_reports_counts_without_creating(cli, tmp_path, capsys):
+    roadmap = tmp_path / "roadmap.yaml"
+    roadmap.write_text(ROADMAP, encoding="utf-8")
+    code = run_cli(["plan", str(roadmap)])
+    report = json.loads(capsys.readouterr().out)
+    assert code == 0 and report["success"]
+    plan, = report["result"]["files"].values()
+    assert plan["total_issues"] == 3
+    assert cli.state.issues == {}
+
+
+def test_startup_defers_handlers_and_heavy_imports(mock_jira):
+    # A fresh interpreter: this test session has long imported everything
+    code = ("import sys, json, main\n"
+            "manager = main.JiraManager()\n"
+            "built = sorted(k for k in vars(manager) if k.endswith('_handler'))\n"
+            "manager.connect_handler.test_connection()\n"
+            "print(json.dumps({'built': built, 'heavy': [m for m in ('pandas', 'numpy', 'pyarrow', 'yaml')"
+            " if m in sys.modules]}))\n")
+    src = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src")
+    output = subprocess.run([sys.executable, "-c", code], cwd=src, capture_output=True, text=True, check=True).stdout
+    assert json.loads(output.strip().splitlines()[-1]) == {"built": [], "heavy": []}
+
+
+def test_create_handler_builds_collaborators_on_first_use(mock_jira):
+    from utils.create_handler import JiraCreateHandler
+    handler = JiraCreateHandler()
+    assert (handler._connect_handler, handler._get_handler, handler._user_handler) == (None, None, None)
+    assert handler.get_handler is handler.get_handler
+    assert handler._get_handler.connect_handler is handler._connect_handler
@@ -0,0 +1,61 @@
+import pytest
+
+from utils.connect_handler import JiraConnectHandler
+from utils.metrics_handler import endpoint_template, metrics
+
+
+@pytest.fixture
+def recording():
+    metrics.reset()
+    metrics.enable()
+    yield metrics
+    metrics.disable()
+    metrics.reset()
+
+
+def _endpoint(summary, method, template):
+    return next(e for e in summary["endpoints"] if (e["method"], e["endpoint"]) == (method, template))
+
+
+def test_endpoint_templates():
+    assert endpoint_template("issue/NEUN-12/transitions") == "issue/{key}/transitions"
+    assert endpoint_template("project/NEUN/components") == "project/{key}/components"
+    assert endpoint_template("project/search?startAt=50") == "project/search"
+    assert endpoint_template("version/10001") == "version/{id}"
+    assert endpoint_template("user/search") == "user/search"
+
+
+def test_requests_are_counted_per_template_with_bytes(mock_jira, recording):
+    handler = JiraConnectHandler()
+    for _ in range(3):
+        assert handler._make_request("GET", "myself").status_code == 200
+    issue = handler._make_request("POST", "issue", json={"fields": {
+        "project": {"key": "NEUN"}, "summary": "metrics", "issuetype": {"name": "Task"}}}).json()
+    handler._make_request("GET", f"issue/{issue['key']}")
+    handler._make_request("GET", "issue/NEUN-404")
+
+    summary = recording.summary()
+    myself = _endpoint(summary, "GET", "myself")
+    assert myself["count"] == 3 and myself["statuses"] == {"200": 3} and myself["bytes_in"] > 0
+    assert _endpoint(summary, "POST", "issue")["bytes_out"] > 0
+    lookups = _endpoint(summary, "GET", "issue/{key}")
+    assert lookups["statuses"] == {"200": 1, "404": 1} and lookups["failures"] == 1
+    assert summary["totals"]["requests"] == 6 and summary["totals"]["failures"] == 1
+    assert 'jira_api_requests_total{method="GET",endpoint="myself",status="200"} 3' in recording.to_prometheus()
+
+
+def test_retried_and_final_429s_count_as_throttled(mock_jira, recording):
+    mock_jira.config.throttle_probability = 1.0
+    mock_jira.config.retry_after = 0.01
+    response = JiraConnectHandler(max_retries=2)._make_request("GET", "myself")
+    assert response.status_code == 429
+
+    myself = _endpoint(recording.summary(), "GET", "myself")
+    assert (myself["count"], myself["retries"], myself["throttled"]) == (1, 2, 3)
+    assert myself["statuses"] == {"429": 1}
+
+
+def test_disabled_metrics_record_nothing(mock_jira):
+    metrics.reset()
+    JiraConnectHandler()._make_request("GET", "myself")
+    assert metrics.summary()["endpoints"] == []
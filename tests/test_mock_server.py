@@ -0,0 +1,16 @@
+from utils.get_handler import JiraGetHandler
+
+
+def test_field_map_builds_against_mock(mock_jira):
+    fields = JiraGetHandler().get_fields_to_json()
+    assert {"summary", "customfield_10014"} <= {field["key"] for field in fields}
+
+
+def test_search_sees_in_place_changes(mock_jira):
+    state = mock_jira.state
+    issue, _ = state.create_issue({"project": {"key": "NEUN"}, "summary": "a", "issuetype": {"name": "Task"}})
+    assert [i["key"] for i in state.search("project = NEUN AND status = 'To Do'")] == [issue["key"]]
+    assert state.transition_issue(issue["key"], "31") is None
+    assert state.search("project = NEUN AND status = 'To Do'") == []
+    state.edit_issue(issue["key"], {"fields": {"priority": {"name": "High"}}})
+    assert [i["key"] for i in state.search("project = NEUN AND priority = High")] == [issue["key"]]
@@ -0,0 +1,54 @@
+import json
+import threading
+import time
+
+from utils.error_handler import ContextThreadPoolExecutor
+from utils.profile_handler import Profiler
+
+
+def _summary(paths):
+    return json.loads(paths["summary"].read_text(encoding="utf-8"))
+
+
+def test_concurrent_operations_are_profiled_separately(tmp_path):
+    profiler = Profiler()
+    profiler.enable("all", str(tmp_path))
+    barrier = threading.Barrier(2)
+    results = {}
+
+    def run(name):
+        with profiler.operation(name) as paths:
+            barrier.wait()
+            with profiler.span(f"{name}-stage"):
+                time.sleep(0.05)
+            barrier.wait()
+        results[name] = paths
+
+    threads = [threading.Thread(target=run, args=(name,)) for name in ("job", "flush")]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    for name, other in (("job", "flush"), ("flush", "job")):
+        summary = _summary(results[name])
+        assert list(summary["stages"]) == [f"{name}-stage"]
+        collapsed = results[name]["collapsed"].read_text(encoding="utf-8")
+        assert f"op:{other}" not in collapsed and f"stage:{other}-stage" not in collapsed
+
+
+def _in_span(profiler):
+    with profiler.span("send"):
+        pass
+
+
+def test_nested_operation_and_pool_spans_belong_to_the_outer_operation(tmp_path):
+    profiler = Profiler()
+    profiler.enable("cprofile", str(tmp_path))
+    with profiler.operation("sync") as paths:
+        with profiler.operation("upload") as inner:
+            assert inner is None
+        with ContextThreadPoolExecutor(max_workers=2) as executor:
+            executor.submit(_in_span, profiler).result()
+    stages = _summary(paths)["stages"]
+    assert stages["upload"]["count"] == 1
+    assert stages["send"]["count"] == 1
@@ -0,0 +1,17 @@
+from utils.report_handler import JiraReportHandler
+
+ISSUES = [
+    {"key": "NEUN-1", "fields": {"summary": "a", "status": {"name": "To Do", "statusCategory": {"key": "new"}},
+                                 "created": "2026-01-01T00:00:00.000+0000", "duedate": "2026-01-10"}},
+]
+
+
+def test_as_of_is_per_call():
+    handler = JiraReportHandler(ISSUES)
+    early = handler.report(["slippage", "burndown"], days=1, as_of="2026-01-20")
+    late = handler.report(["slippage", "burndown"], days=1, as_of="2026-01-30")
+    assert early["burndown"]["series"][0]["date"] == "2026-01-20"
+    assert late["burndown"]["series"][0]["date"] == "2026-01-30"
+    assert early["slippage"]["open_overdue_days"]["max"] == 9.0
+    assert late["slippage"]["open_overdue_days"]["max"] == 19.0
+    assert handler.as_of is None
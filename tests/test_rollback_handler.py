@@ -0,0 +1,80 @@
+from utils.create_handler import CREATION_JOURNAL, JOURNAL_COMPACT_EVERY
+from utils.json_handler import JsonHandler
+from utils.rollback_handler import JiraRollbackHandler
+
+LEVELS = {"Epic": 1, "Task": 0, "Sub-task": -1}
+
+
+def _upload(mock_jira):
+    """Issues of one journaled run "run-1", plus a task and a sub-task added by hand"""
+    state = mock_jira.state
+    journal = JsonHandler().open_log(CREATION_JOURNAL, key_field="key", compact_every=JOURNAL_COMPACT_EVERY)
+    keys = {}
+
+    def create(name, issuetype, parent=None, journaled=True):
+        fields = {"project": {"key": "NEUN"}, "summary": name, "issuetype": {"name": issuetype}}
+        if parent:
+            fields["parent"] = {"key": keys[parent]}
+        keys[name] = state.create_issue(fields)[0]["key"]
+        if journaled:
+            journal.append({"event": "created", "run_id": "run-1", "project": "NEUN", "summary": name,
+                            "hierarchy_level": LEVELS[issuetype], "parent": keys.get(parent), "key": keys[name]})
+
+    create("epic", "Epic")
+    create("covered", "Task", "epic")
+    create("covered-sub-1", "Sub-task", "covered")
+    create("covered-sub-2", "Sub-task", "covered")
+    create("kept", "Task", "epic")
+    create("kept-sub", "Sub-task", "kept")
+    create("manual-sub", "Sub-task", "kept", journaled=False)
+    create("plain", "Task", "epic")
+    create("manual", "Task", journaled=False)
+    create("orphan-sub", "Sub-task", "manual")
+    journal.flush()
+    return keys
+
+
+def test_plan_covers_subtasks_of_deleted_parents_only(mock_jira):
+    keys = _upload(mock_jira)
+    plan = JiraRollbackHandler().plan(run_ids=["run-1"])
+    levels = {name: {item["key"]: item for item in items} for name, items in plan["levels"].items()}
+    assert set(levels["subtasks"]) == {keys["kept-sub"], keys["orphan-sub"]}
+    assert set(levels["tasks"]) == {keys["covered"], keys["kept"], keys["plain"]}
+    assert set(levels["epics"]) == {keys["epic"]}
+    assert plan["covered"] == {keys["covered-sub-1"]: keys["covered"], keys["covered-sub-2"]: keys["covered"]}
+    assert plan["kept"] == {keys["kept"]: [keys["manual-sub"]]}
+    assert levels["tasks"][keys["covered"]]["delete_subtasks"]
+    assert not levels["tasks"][keys["kept"]]["delete_subtasks"]
+    assert not levels["tasks"][keys["plain"]]["delete_subtasks"]
+    # kept-sub, orphan-sub, covered (with its sub-tasks), plain and the epic
+    assert plan["issues"] == 8 and plan["calls"] == 5
+
+
+def test_rollback_deletes_level_by_level(mock_jira):
+    keys = _upload(mock_jira)
+    handler = JiraRollbackHandler(max_workers=4, rate=0)
+    level_of = {key: LEVELS[mock_jira.state.issues[key]["fields"]["issuetype"]["name"]] for key in keys.values()}
+    deletes = []
+    request = handler.connect_handler._make_request
+
+    def record(method, endpoint, **kwargs):
+        if method == "DELETE":
+            deletes.append((endpoint.split("/")[-1], (kwargs.get("params") or {}).get("deleteSubtasks")))
+        return request(method, endpoint, **kwargs)
+
+    handler.connect_handler._make_request = record
+    result = handler.rollback(handler.plan(run_ids=["run-1"]))
+
+    order = [level_of[key] for key, _ in deletes]
+    assert order == sorted(order) and len(deletes) == 5
+    assert (keys["covered"], "true") in deletes
+    assert all(flag is None for key, flag in deletes if key != keys["covered"])
+    assert result["issues"][keys["covered-sub-1"]] == {"result": "deleted", "via": keys["covered"]}
+    assert result["issues"][keys["kept"]]["result"] == "skipped"
+    assert (result["deleted"], result["skipped"], result["failed"]) == (7, 1, 0)
+    assert set(mock_jira.state.issues) == {keys["kept"], keys["manual-sub"], keys["manual"]}
+
+    # Deletions are journaled, so the run has only the kept task left
+    assert handler.list_runs() == [{"run_id": "run-1", "project": "NEUN", "started": None, "issues": 1}]
+    replan = handler.plan(run_ids=["run-1"])
+    assert [item["key"] for level in replan["levels"].values() for item in level] == [keys["kept"]]
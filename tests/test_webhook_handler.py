@@ -0,0 +1,55 @@
+import json
+import urllib.error
+import urllib.request
+
+import pytest
+
+from utils.error_handler import JiraDataError
+from utils.webhook_handler import JiraWebhookReceiver
+
+
+class _BrokenStore:
+    project_key = "NEUN"
+
+    def work_item_fields(self):
+        raise RuntimeError("store unavailable")
+
+    def apply_work_item(self, key, item):
+        raise RuntimeError("store unavailable")
+
+    def flush_local_changes(self):
+        return []
+
+
+def _issue_event(**overrides):
+    return {"webhookEvent": "jira:issue_updated", "timestamp": 1767225600000,
+            "issue": {"id": "10001", "key": "NEUN-1", "fields": {}}, **overrides}
+
+
+@pytest.mark.parametrize("event", [
+    _issue_event(timestamp="2026-01-01"),
+    _issue_event(issue={"id": "10001", "fields": {}}),
+    _issue_event(issue="NEUN-1"),
+])
+def test_apply_rejects_malformed_events(event):
+    with pytest.raises(JiraDataError):
+        JiraWebhookReceiver(_BrokenStore()).apply(event)
+
+
+def _post(receiver, event):
+    request = urllib.request.Request(f"http://127.0.0.1:{receiver.port}/webhook", data=json.dumps(event).encode(),
+                                     headers={"Content-Type": "application/json"}, method="POST")
+    try:
+        with urllib.request.urlopen(request, timeout=5) as response:
+            return response.status
+    except urllib.error.HTTPError as e:
+        return e.code
+
+
+def test_server_answers_bad_and_failing_events_with_status_codes():
+    receiver = JiraWebhookReceiver(_BrokenStore(), port=0, flush_interval=60).start()
+    try:
+        assert _post(receiver, _issue_event(timestamp="2026-01-01")) == 400
+        assert _post(receiver, _issue_event()) == 500
+    finally:
+        receiver.shutdown()